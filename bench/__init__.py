@@ -0,0 +1,6 @@
+"""Micro-benchmarks for the games' hot paths
+
+Run ``python -m bench`` from the repository root. Each case is measured
+at several scales and compared against ``bench/baseline.json``; see
+``python -m bench --help`` for filtering and updating the baseline.
+"""
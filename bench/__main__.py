@@ -0,0 +1,51 @@
+import argparse
+import os
+import sys
+
+from bench.cases import CASES
+from bench.runner import compare, format_result, load_baseline, run_cases, save_baseline
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m bench', description="Benchmark the games' hot paths")
+    parser.add_argument('-k', dest='name_filter', help="only run cases whose name contains this")
+    parser.add_argument('--quick', action='store_true', help="shorter timing runs, noisier numbers")
+    parser.add_argument('--baseline', default=BASELINE, help="baseline file to compare against")
+    parser.add_argument('--save', action='store_true', help="write these results as the new baseline")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="allowed slowdown before a case counts as a regression (default 0.25)")
+    args = parser.parse_args(argv)
+
+    results = run_cases(CASES, 0.05 if args.quick else 0.2, args.name_filter)
+
+    if args.save:
+        # Keep baseline entries for cases that were filtered out or skipped
+        baseline = load_baseline(args.baseline)
+        baseline.update(results)
+        save_baseline(args.baseline, baseline)
+        print(f"\nSaved {len(results)} results to {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if not baseline:
+        print(f"\nNo baseline at {args.baseline}; run with --save to create one")
+        return 0
+
+    print("\nAgainst baseline:")
+    for key, result in results.items():
+        if key in baseline:
+            print(format_result(key, result, baseline[key]))
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+        for key in regressions:
+            print(f"  {key}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,425 @@
+"""Benchmark cases
+
+Each case builds a game state at a given scale and returns a zero-argument
+callable that runs the hot path once. The rules themselves live in the
+headless engines, so most cases need no display; the cookie clicker
+cases drive the real Tk widgets and are skipped when no display is
+available. The tcl.* cases run the games' draw paths on the recording Tk
+stand-in from bench.tkrecord and also count the Tcl calls per frame.
+"""
+
+import random
+from collections import namedtuple
+from itertools import cycle
+
+from bench.runner import Skip
+from bench.tkrecord import calls_per_frame, recorded_game
+from gamekit.agents import DEFAULT_AGENTS, agent_rng
+from gamekit.catalog import load_game_class
+from gamekit.engines import (
+    BlockBreakerEngine,
+    MinesweeperEngine,
+    SnakeEngine,
+    TetrisEngine,
+    WordleEngine,
+)
+from gamekit.engines.snake import MOVES
+from gamekit.engines.tetris import SHAPES
+from gamekit.entities import Particle
+from gamekit.tournament import load_agent
+
+Case = namedtuple('Case', 'name scales setup')
+
+CASES = []
+
+
+def case(name, scales):
+    """Register a setup function as a benchmark case"""
+    def register(setup):
+        CASES.append(Case(name, tuple(scales), setup))
+        return setup
+    return register
+
+
+# Tetris: scale is the board width (height is twice the width)
+
+def tetris_board(width, seed=1):
+    """Board with a ragged stack over its bottom half"""
+    engine = TetrisEngine(width, width * 2, seed=seed)
+    rng = random.Random(seed)
+    for y in range(engine.height // 2, engine.height):
+        for x in range(engine.width):
+            if rng.random() < 0.7:
+                engine.grid[y][x] = 'I'
+    return engine
+
+
+@case('tetris.is_valid_position', scales=(10, 20, 40))
+def tetris_is_valid_position(width):
+    engine = tetris_board(width)
+    piece = SHAPES['T']
+    positions = [(x, y) for y in range(engine.height) for x in range(-1, engine.width)]
+    positions = random.Random(2).sample(positions, 64)
+
+    def op():
+        for x, y in positions:
+            engine.is_valid_position(piece, x, y)
+    return op
+
+
+@case('tetris.clear_lines', scales=(10, 20, 40))
+def tetris_clear_lines(width):
+    engine = tetris_board(width)
+    bottom = engine.height - 4
+
+    def op():
+        # Complete four rows, then clear them
+        for y in range(bottom, engine.height):
+            engine.grid[y] = ['I'] * engine.width
+        engine.clear_lines()
+    return op
+
+
+# Snake: scale is the snake length on a grid with room for it
+
+def winding_path(size):
+    """Every cell of a square grid, row by row in alternating directions"""
+    cells = []
+    for y in range(size):
+        row = range(size) if y % 2 == 0 else range(size - 1, -1, -1)
+        cells.extend((x, y) for x in row)
+    return cells
+
+
+def loop_cell(i, size):
+    """Cell ``i`` of a closed tour of an even-sized grid: winding rows right of
+    column 0, then back up column 0"""
+    i %= size * size
+    width = size - 1
+    if i >= size * width:
+        return 0, size - 1 - (i - size * width)
+    y, x = divmod(i, width)
+    return (1 + x if y % 2 == 0 else width - x), y
+
+
+def snake_of_length(length, seed=1):
+    """Snake winding through a square grid, 20 cells minimum"""
+    size = 20
+    while size * size < length * 2:
+        size *= 2
+    engine = SnakeEngine(size, seed=seed)
+    engine.set_snake(winding_path(size)[:length])
+    return engine
+
+
+@case('snake.check_collision', scales=(10, 100, 1000))
+def snake_check_collision(length):
+    engine = snake_of_length(length)
+    return engine.check_collision
+
+
+@case('snake.spawn_food', scales=(10, 100, 1000))
+def snake_spawn_food(length):
+    engine = snake_of_length(length)
+    return engine.spawn_food
+
+
+@case('snake.spawn_food_crowded', scales=(90, 99, 100))
+def snake_spawn_food_crowded(percent):
+    # Scale is the percentage of a 100x100 board the snake covers
+    engine = SnakeEngine(100, seed=1)
+    cells = [(x, y) for y in range(100) for x in (range(100) if y % 2 == 0 else range(99, -1, -1))]
+    engine.set_snake(cells[:100 * percent])
+    return engine.spawn_food
+
+
+@case('snake_batch.step', scales=(1, 256, 4096))
+def snake_batch_step(boards):
+    # Scale is the number of boards; one op steps all of them
+    try:
+        from gamekit.engines.snake_batch import SnakeBatch
+        batch = SnakeBatch(boards, seed=1)
+    except (ImportError, RuntimeError) as exc:
+        raise Skip(str(exc))
+    actions = cycle(batch.rng.integers(-1, 4, size=(64, boards)))
+
+    def op():
+        batch.step(next(actions))
+    return op
+
+
+# Block breaker: scale is the number of balls in play
+
+@case('block_breaker.check_collisions', scales=(1, 10, 100))
+def block_breaker_check_collisions(balls):
+    engine = BlockBreakerEngine(seed=1)
+    rng = random.Random(2)
+    # Balls between the blocks and the paddle: the common, no-hit frame
+    engine.balls = [
+        engine.new_ball(rng.uniform(0, engine.width), rng.uniform(300, 500), 45)
+        for _ in range(balls)
+    ]
+    return engine.check_collisions
+
+
+# Minesweeper: scale is the board side with 10% mines
+
+def minesweeper_board(size, seed=1):
+    engine = MinesweeperEngine(size, size * size // 10, seed=seed)
+    engine.generate_mines((0, 0))
+    engine.first_click = False
+    return engine
+
+
+@case('minesweeper.reveal_cell', scales=(10, 30, 100))
+def minesweeper_reveal_cell(size):
+    engine = minesweeper_board(size)
+
+    def op():
+        engine.revealed = set()
+        engine.done = False
+        engine.reveal_cell((0, 0))
+    return op
+
+
+@case('minesweeper.count_adjacent_mines', scales=(10, 30, 100))
+def minesweeper_count_adjacent_mines(size):
+    engine = minesweeper_board(size)
+    cells = [(r, c) for r in range(size) for c in range(size)]
+    cells = random.Random(2).sample(cells, min(len(cells), 64))
+
+    def op():
+        for row, col in cells:
+            engine.count_adjacent_mines(row, col)
+    return op
+
+
+# Wordle: scale is the lexicon size
+
+def lexicon(size, seed=1):
+    """The real word list padded with random five-letter strings"""
+    words = list(WordleEngine().words)
+    rng = random.Random(seed)
+    alphabet = 'abcdefghijklmnopqrstuvwxyz'
+    while len(words) < size:
+        words.append(''.join(rng.choice(alphabet) for _ in range(5)))
+    return words[:size]
+
+
+@case('wordle.check_guess', scales=(1,))
+def wordle_check_guess(_):
+    engine = WordleEngine(seed=1)
+    guesses = [word.upper() for word in lexicon(64)]
+
+    def op():
+        for guess in guesses:
+            engine.check_guess(guess)
+    return op
+
+
+@case('wordle.is_valid_guess', scales=(500, 5000, 50000))
+def wordle_is_valid_guess(size):
+    words = lexicon(size)
+    engine = WordleEngine(words, seed=1)
+    guesses = [word.upper() for word in words[:32]] + ['ZZZZZ', 'QXQXQ', 'ABC', 'TOOLONG']
+
+    def op():
+        for guess in guesses:
+            engine.is_valid_guess(guess)
+    return op
+
+
+# Cookie clicker: drives the Tk class, so it needs a display
+
+_game = None
+
+
+def cookie_clicker():
+    """Shared CookieClicker instance on a withdrawn Tk root"""
+    global _game
+    if _game is None:
+        import tkinter as tk
+        try:
+            root = tk.Tk()
+        except tk.TclError as exc:
+            raise Skip(f"no display ({exc})")
+        root.withdraw()
+        _game = load_game_class('cookie clicker')(root)
+        _game.scheduler.stop()
+    return _game
+
+
+@case('cookie_clicker.update_shop', scales=(0, 1000000))
+def cookie_clicker_update_shop(cookies):
+    game = cookie_clicker()
+
+    def op():
+        game.engine.cookies = cookies
+        game.update_shop()
+    return op
+
+
+@case('cookie_clicker.draw_cookie', scales=(0, 20, 100))
+def cookie_clicker_draw_cookie(particles):
+    game = cookie_clicker()
+    game.engine.upgrades['cursor'].count = 10
+
+    def op():
+        while len(game.click_particles) < particles:
+            game.click_particles.append(Particle(250, 140, 1))
+        game.cursor_rotation += 0.02
+        game.draw_cookie()
+    return op
+
+
+# Draw paths on the recording Tk stand-in: each case also reports the Tcl
+# calls one frame makes, which the baseline holds as a budget
+
+TCL_FRAMES = {}  # name -> setup(scale) returning (game, frame)
+
+
+def tcl_frame(name, scales=(1,)):
+    """Register a draw path for ``python -m bench.tkrecord`` and as a tcl.* case"""
+    def register(setup):
+        TCL_FRAMES[name] = (scales, setup)
+
+        def case_setup(scale):
+            game, frame = setup(scale)
+
+            def op():
+                frame()
+            # Counted on a fresh game, so the count does not depend on how
+            # many frames the timing loop ran
+            op.counts = lambda: tcl_counts(*setup(scale))
+            return op
+        CASES.append(Case('tcl.' + name, scales, case_setup))
+        return setup
+    return register
+
+
+def tcl_counts(game, frame):
+    log = calls_per_frame(game, frame)
+    return {'tcl_calls': log.total(), 'tcl_words': log.total_words()}
+
+
+def agent_frame(name, draw):
+    """Advance the engine one agent step, restarting finished rounds, then draw"""
+    game = recorded_game(name)
+    game.start_game()
+    engine = game.engine
+    agent = load_agent(DEFAULT_AGENTS[name])
+    rng = agent_rng(1)
+
+    def frame():
+        if engine.done:
+            engine.reset()
+        engine.step(agent(engine, rng))
+        draw(game)
+    return game, frame
+
+
+@tcl_frame('snake.draw')
+def tcl_snake_draw(_):
+    return agent_frame('snake', lambda game: game.draw())
+
+
+def crawl_frame(length, grid_size, tour=None):
+    """A snake of ``length`` going round a tour of ``tour`` cells square in
+    the middle of the board, by default the whole board"""
+    game = recorded_game('snake', grid_size=grid_size)
+    game.start_game()
+    engine = game.engine
+    engine.food = None  # Nothing to eat, so the length stays put
+    tour = tour or grid_size
+    origin = (grid_size - tour) // 2
+
+    def cell(i):
+        x, y = loop_cell(i, tour)
+        return origin + x, origin + y
+
+    engine.set_snake(cell(i) for i in range(length - 1, -1, -1))
+    directions = {move: name for name, move in MOVES.items()}
+    position = length
+
+    def frame():
+        nonlocal position
+        (x, y), (head_x, head_y) = cell(position), engine.snake[0]
+        engine.step(directions[x - head_x, y - head_y])
+        position += 1
+        game.draw()
+    return game, frame
+
+
+@tcl_frame('snake.draw_long', scales=(10, 100, 390))
+def tcl_snake_draw_long(length):
+    # On the board the canvas shows, where the segment ring draws; it
+    # holds GRID_SIZE squared cells, so 390 is about as long as it gets
+    return crawl_frame(length, load_game_class('snake').GRID_SIZE)
+
+
+@tcl_frame('snake.draw_board', scales=(20, 200, 2000))
+def tcl_snake_draw_board(size):
+    # The same 200-cell snake under the camera of ever larger boards. Its
+    # tour rows are twice the view wide, so it turns in view and the
+    # camera scrolls both ways, taking and returning segment items
+    return crawl_frame(200, size, tour=min(size, 40))
+
+
+@tcl_frame('tetris.draw')
+def tcl_tetris_draw(_):
+    return agent_frame('tetris', lambda game: game.draw())
+
+
+@tcl_frame('block_breaker.draw')
+def tcl_block_breaker_draw(_):
+    return agent_frame('block breaker', lambda game: game.draw())
+
+
+@tcl_frame('minesweeper.draw_grid', scales=(8, 14, 20))
+def tcl_minesweeper_draw_grid(size):
+    game = recorded_game('minesweeper')
+    game.start_game(size, size * size // 6)
+    game.engine.apply(('reveal', (size // 2, size // 2)))
+    return game, game.draw_grid
+
+
+def wordle_midgame():
+    game = recorded_game('wordle')
+    for letter in 'ABOUTCRANE':
+        game.engine.apply(letter)
+        if len(game.engine.current_guess) == game.WORD_LENGTH:
+            game.engine.apply('ENTER')
+    game.engine.apply('S')
+    return game
+
+
+@tcl_frame('wordle.draw_board')
+def tcl_wordle_draw_board(_):
+    game = wordle_midgame()
+    return game, game.draw_board
+
+
+@tcl_frame('wordle.draw_keyboard')
+def tcl_wordle_draw_keyboard(_):
+    game = wordle_midgame()
+    return game, game.draw_keyboard
+
+
+@tcl_frame('cookie_clicker.draw_cookie', scales=(0, 20, 100))
+def tcl_cookie_clicker_draw_cookie(particles):
+    game = recorded_game('cookie clicker')
+    game.engine.upgrades['cursor'].count = 10
+
+    def frame():
+        while len(game.click_particles) < particles:
+            game.click_particles.append(Particle(250, 140, 1))
+        game.cursor_rotation += 0.02
+        game.draw_cookie()
+    return game, frame
+
+
+@tcl_frame('cookie_clicker.update_shop')
+def tcl_cookie_clicker_update_shop(_):
+    game = recorded_game('cookie clicker')
+    game.engine.cookies = 1000
+    return game, game.update_shop
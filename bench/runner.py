@@ -0,0 +1,119 @@
+import json
+import sys
+import time
+import tracemalloc
+
+
+class Skip(Exception):
+    """Raised by a case setup that cannot run here, e.g. without a display"""
+
+
+def measure(op, min_time=0.2, repeat=5, alloc_runs=200):
+    """Time ``op`` and sample its allocations
+
+    Returns the best ops/sec over ``repeat`` runs of an auto-calibrated
+    loop, the peak traced memory while running ``op`` in KiB, and the net
+    number of memory blocks left allocated per call.
+    """
+    number = 1
+    while True:
+        elapsed = _run(op, number)
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed > min_time / 4 else 10
+
+    best = elapsed
+    for _ in range(repeat - 1):
+        best = min(best, _run(op, number))
+
+    runs = min(number, alloc_runs)
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        blocks = sys.getallocatedblocks()
+        for _ in range(runs):
+            op()
+        blocks = sys.getallocatedblocks() - blocks
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'ops': number / best,
+        'peak_kib': max(0, peak - start) / 1024,
+        'blocks': blocks / runs,
+    }
+
+
+def _run(op, number):
+    start = time.perf_counter()
+    for _ in range(number):
+        op()
+    return time.perf_counter() - start
+
+
+def run_cases(cases, min_time=0.2, name_filter=None, report=print):
+    """Measure every (case, scale) pair and return {key: result}"""
+    results = {}
+    for case in cases:
+        if name_filter and name_filter not in case.name:
+            continue
+        for scale in case.scales:
+            key = f"{case.name}[{scale}]"
+            try:
+                op = case.setup(scale)
+            except Skip as reason:
+                report(f"{key:<44} skipped: {reason}")
+                continue
+            results[key] = measure(op, min_time)
+            counts = getattr(op, 'counts', None)
+            if counts is not None:
+                # Exact per-call counts, e.g. Tcl calls on the recording Tk
+                results[key].update(counts())
+            report(format_result(key, results[key]))
+    return results
+
+
+def format_result(key, result, baseline=None):
+    line = f"{key:<44} {result['ops']:>14,.0f} ops/s {result['peak_kib']:>9.1f} KiB {result['blocks']:>7.1f} blk/op"
+    if 'tcl_calls' in result:
+        line += f" {result['tcl_calls']:>6} tcl/frame"
+    if baseline is not None:
+        line += f"  {result['ops'] / baseline['ops'] - 1:+7.1%}"
+    return line
+
+
+def compare(results, baseline, tolerance):
+    """Return the keys that got slower than the baseline by more than ``tolerance``
+
+    Tcl call counts are exact, so the baseline's count is a budget: any
+    frame that makes more calls than it counts as a regression too.
+    """
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        if result['ops'] < base['ops'] * (1 - tolerance):
+            regressions.append(key)
+        elif result.get('tcl_calls', 0) > base.get('tcl_calls', float('inf')):
+            regressions.append(key)
+    return regressions
+
+
+def load_baseline(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_baseline(path, results):
+    rounded = {
+        key: {name: round(value, 2) for name, value in result.items()}
+        for key, result in sorted(results.items())
+    }
+    with open(path, 'w') as f:
+        json.dump(rounded, f, indent=2)
+        f.write('\n')
@@ -0,0 +1,348 @@
+"""Recording stand-in for tkinter, for draw benchmarks without a display
+
+``recorded_game(name)`` builds a game's Tk class with ``tk.Tk``,
+``tk.Canvas``, ``tk.Label`` and the other widgets swapped for recording
+fakes. Every widget call that would become a Tcl command (``create_*``,
+``coords``, ``itemconfig``, ``delete``, ``after``, ``config``, ...) is
+counted in one CallLog, together with its size in Tcl words, and never
+reaches an interpreter. Canvases keep their items' coords, options and
+tags, so the games' ``find_withtag`` and ``coords`` lookups still answer
+like Tk.
+
+``python -m bench.tkrecord`` prints the calls each game's draw paths make
+per frame; the ``tcl.*`` bench cases turn the same counts into a
+calls-per-frame budget.
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+import tkinter
+import types
+from collections import Counter
+from tkinter import constants
+
+from gamekit.catalog import GAMES, ROOT_DIR
+from gamekit.raster import flatten
+
+
+def words(args, options):
+    """Tcl words of a widget command: path, method, arguments and -option value pairs"""
+    count = 2 + 2 * len(options)
+    for value in args:
+        count += len(value) if isinstance(value, (list, tuple)) else 1
+    return count
+
+
+class CallLog:
+    """Counts of widget calls and their Tcl words, by method name"""
+
+    def __init__(self):
+        self.calls = Counter()
+        self.words = Counter()
+
+    def record(self, method, args=(), options=()):
+        self.calls[method] += 1
+        self.words[method] += words(args, options)
+
+    def total(self):
+        return sum(self.calls.values())
+
+    def total_words(self):
+        return sum(self.words.values())
+
+    def reset(self):
+        self.calls.clear()
+        self.words.clear()
+
+    def report(self):
+        """One line per method, most frequent first"""
+        return "\n".join(
+            f"  {method:<16} {count:>6} calls {self.words[method]:>8} words"
+            for method, count in self.calls.most_common()
+        )
+
+
+class Widget:
+    """Any widget: logs every method call and answers with something harmless"""
+
+    def __init__(self, master=None, cnf=None, **options):
+        self.master = master
+        self.log = master.log if master is not None else CallLog()
+        self.options = dict(cnf or {}, **options)
+        self.children = []
+        if master is not None:
+            master.children.append(self)
+        self.log.record(type(self).__name__.lower(), (), self.options)
+
+    def __getattr__(self, method):
+        if method.startswith('_'):
+            raise AttributeError(method)
+
+        def call(*args, **options):
+            self.log.record(method, args, options)
+        return call
+
+    def config(self, cnf=None, **options):
+        self.log.record('configure', (), options)
+        self.options.update(cnf or {}, **options)
+
+    configure = config
+
+    def cget(self, option):
+        self.log.record('cget', (option,))
+        return self.options.get(option, '')
+
+    def winfo_children(self):
+        self.log.record('winfo_children')
+        return list(self.children)
+
+    def winfo_exists(self):
+        return True
+
+    def winfo_toplevel(self):
+        widget = self
+        while widget.master is not None:
+            widget = widget.master
+        return widget
+
+    def destroy(self):
+        self.log.record('destroy')
+        if self.master is not None and self in self.master.children:
+            self.master.children.remove(self)
+
+
+class _Interp:
+    """``root.tk``: only what the instrumentation asks the interpreter"""
+
+    def __init__(self, root):
+        self.root = root
+
+    def call(self, *args):
+        self.root.log.record(args[0] if args else 'call', args[1:])
+        if args[:2] == ('after', 'info'):
+            return tuple(self.root.pending)
+        return ''
+
+    def splitlist(self, value):
+        return tuple(value)
+
+
+class Tk(Widget):
+    """Root window; ``after`` callbacks are logged and held, never run"""
+
+    def __init__(self, *args, **options):
+        super().__init__(None)
+        self.tk = _Interp(self)
+        self.pending = {}  # after id -> callback
+        self.next_after = 0
+
+    def after(self, delay_ms, callback=None, *args):
+        self.log.record('after', (delay_ms,))
+        self.next_after += 1
+        ident = f"after#{self.next_after}"
+        self.pending[ident] = callback
+        return ident
+
+    def after_cancel(self, ident):
+        self.log.record('after', ('cancel', ident))
+        self.pending.pop(ident, None)
+
+    def focus_displayof(self):
+        return self
+
+    def mainloop(self, n=0):
+        pass
+
+
+class _Item:
+    __slots__ = ('kind', 'coords', 'options', 'tags')
+
+    def __init__(self, kind, coords, options, tags):
+        self.kind = kind
+        self.coords = coords
+        self.options = options
+        self.tags = tags
+
+
+class Canvas(Widget):
+    """Canvas that keeps its items, so lookups by id and tag work"""
+
+    def __init__(self, master=None, cnf=None, **options):
+        super().__init__(master, cnf, **options)
+        self.items = {}  # id -> _Item, in stacking order
+        self.next_id = 1
+
+    def _create(self, kind, args, options):
+        self.log.record('create_' + kind, args, options)
+        tags = options.pop('tags', ())
+        if isinstance(tags, str):
+            tags = (tags,)
+        item = self.next_id
+        self.next_id += 1
+        self.items[item] = _Item(kind, flatten(args), options, set(tags))
+        return item
+
+    def create_rectangle(self, *args, **options):
+        return self._create('rectangle', args, options)
+
+    def create_oval(self, *args, **options):
+        return self._create('oval', args, options)
+
+    def create_polygon(self, *args, **options):
+        return self._create('polygon', args, options)
+
+    def create_line(self, *args, **options):
+        return self._create('line', args, options)
+
+    def create_text(self, *args, **options):
+        return self._create('text', args, options)
+
+    def create_window(self, *args, **options):
+        return self._create('window', args, options)
+
+    def create_image(self, *args, **options):
+        return self._create('image', args, options)
+
+    def _find(self, tag):
+        if isinstance(tag, int):
+            return [tag] if tag in self.items else []
+        if tag == 'all':
+            return list(self.items)
+        return [item for item, entry in self.items.items() if tag in entry.tags]
+
+    def find_withtag(self, tag):
+        self.log.record('find', ('withtag', tag))
+        return tuple(self._find(tag))
+
+    def find_all(self):
+        self.log.record('find', ('all',))
+        return tuple(self.items)
+
+    def coords(self, tag, *args):
+        self.log.record('coords', (tag,) + args)
+        found = self._find(tag)
+        if args:
+            for item in found[:1]:
+                self.items[item].coords = flatten(args)
+            return None
+        return list(self.items[found[0]].coords) if found else []
+
+    def itemconfig(self, tag, cnf=None, **options):
+        self.log.record('itemconfigure', (tag,), options)
+        options = dict(cnf or {}, **options)
+        for item in self._find(tag):
+            self.items[item].options.update(options)
+
+    itemconfigure = itemconfig
+
+    def itemcget(self, tag, option):
+        self.log.record('itemcget', (tag, option))
+        found = self._find(tag)
+        return self.items[found[0]].options.get(option, '') if found else ''
+
+    def move(self, tag, dx, dy):
+        self.log.record('move', (tag, dx, dy))
+        for item in self._find(tag):
+            entry = self.items[item]
+            entry.coords = tuple(
+                value + (dx if i % 2 == 0 else dy) for i, value in enumerate(entry.coords)
+            )
+
+    def delete(self, *tags):
+        self.log.record('delete', tags)
+        for tag in tags:
+            for item in self._find(tag):
+                del self.items[item]
+
+    def bbox(self, *tags):
+        self.log.record('bbox', tags)
+        xs, ys = [], []
+        for tag in tags:
+            for item in self._find(tag):
+                coords = self.items[item].coords
+                xs.extend(coords[0::2])
+                ys.extend(coords[1::2])
+        if not xs:
+            return None
+        return (int(min(xs)), int(min(ys)), int(max(xs)), int(max(ys)))
+
+
+def fake_tkinter():
+    """A stand-in ``tkinter`` module whose widgets all log to the root's CallLog"""
+    module = types.SimpleNamespace(**{
+        name: value for name, value in vars(constants).items() if not name.startswith('_')
+    })
+    module.Tk = Tk
+    module.Canvas = Canvas
+    for name in ('Label', 'Frame', 'Button', 'Scrollbar', 'Toplevel', 'Entry', 'Listbox'):
+        setattr(module, name, type(name, (Widget,), {}))
+    module.TclError = tkinter.TclError
+    module.EventType = tkinter.EventType
+    return module
+
+
+_modules = {}
+
+
+def recording_module(name):
+    """A private import of a game script whose ``tk`` is the recording stand-in
+
+    The catalog's copy of the script keeps the real tkinter.
+    """
+    module = _modules.get(name)
+    if module is None:
+        script, _ = GAMES[name]
+        spec = importlib.util.spec_from_file_location(
+            'recorded_' + name.replace(' ', '_'), os.path.join(ROOT_DIR, script)
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        module.tk = fake_tkinter()
+        _modules[name] = module
+    return module
+
+
+def recorded_game(name, seed=1, **options):
+    """Build a game on a recording root; its scheduler is stopped and the log emptied"""
+    module = recording_module(name)
+    game = getattr(module, GAMES[name][1])(module.tk.Tk(), seed=seed, **options)
+    game.scheduler.stop()
+    game.root.log.reset()
+    return game
+
+
+def calls_per_frame(game, frame):
+    """Run ``frame`` once to warm up, then return the CallLog of a second run"""
+    frame()
+    log = game.root.log
+    log.reset()
+    frame()
+    counts = CallLog()
+    counts.calls.update(log.calls)
+    counts.words.update(log.words)
+    return counts
+
+
+def main(argv=None):
+    from bench.cases import TCL_FRAMES
+
+    parser = argparse.ArgumentParser(prog="python -m bench.tkrecord",
+                                     description="Count the Tcl calls of each game's draw paths per frame")
+    parser.add_argument('-k', dest='name_filter', help="only draw paths whose name contains this")
+    args = parser.parse_args(argv)
+
+    for name, (scales, setup) in TCL_FRAMES.items():
+        if args.name_filter and args.name_filter not in name:
+            continue
+        for scale in scales:
+            game, frame = setup(scale)
+            log = calls_per_frame(game, frame)
+            print(f"{name}[{scale}]: {log.total()} calls, {log.total_words()} words per frame")
+            print(log.report())
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
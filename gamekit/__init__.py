@@ -0,0 +1 @@
+"""Shared building blocks for the games in this repo"""
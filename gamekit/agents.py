@@ -0,0 +1,89 @@
+"""Simple automated players for the headless engines
+
+An agent is a callable ``agent(engine, rng)`` that returns the next action
+for ``engine.step``. ``rng`` is a ``random.Random`` seeded per episode and
+kept separate from the engine's own RNG, so an agent's choices never change
+what the game deals out. Agents are referred to as ``"module:function"`` so
+they can be imported again in worker processes.
+"""
+
+import random
+
+from gamekit.engines.snake import MOVES, OPPOSITE
+from gamekit.engines.wordle import score_guess
+
+# Game name -> agent used when none is given
+DEFAULT_AGENTS = {
+    'snake': 'gamekit.agents:snake_greedy',
+    'tetris': 'gamekit.agents:random_action',
+    'block breaker': 'gamekit.agents:follow_ball',
+    'minesweeper': 'gamekit.agents:random_reveal',
+    'wordle': 'gamekit.agents:consistent_guess',
+}
+
+
+def agent_rng(seed):
+    """The agent's RNG for an episode, apart from the engine's own stream"""
+    return random.Random(f"agent:{seed}")
+
+
+def random_action(engine, rng):
+    """Any action the engine lists, uniformly at random"""
+    return rng.choice(engine.ACTIONS)
+
+
+# Snake
+
+def snake_greedy(engine, rng):
+    """Head for the food, avoiding walls and the body one move ahead"""
+    head_x, head_y = engine.snake[0]
+    food_x, food_y = engine.food
+    tail = engine.snake[-1]
+
+    safe = []
+    for direction, (dx, dy) in MOVES.items():
+        if engine.direction and direction == OPPOSITE[engine.direction]:
+            continue
+        x, y = head_x + dx, head_y + dy
+        occupied = (x, y) != tail and engine.occupied((x, y))  # The tail moves out of the way
+        if 0 <= x < engine.grid_size and 0 <= y < engine.grid_size and not occupied:
+            safe.append((abs(food_x - x) + abs(food_y - y), direction))
+
+    if not safe:
+        return engine.direction or 'UP'
+    best = min(distance for distance, _ in safe)
+    return rng.choice([direction for distance, direction in safe if distance == best])
+
+
+# Block breaker
+
+def follow_ball(engine, rng):
+    """Keep the paddle under the lowest ball"""
+    if not engine.balls:
+        return None
+    ball = max(engine.balls, key=lambda b: b.y)
+    return ball.x + rng.uniform(-10, 10)
+
+
+# Minesweeper
+
+def random_reveal(engine, rng):
+    """Reveal a random covered cell"""
+    covered = [
+        (row, col)
+        for row in range(engine.grid_size)
+        for col in range(engine.grid_size)
+        if (row, col) not in engine.revealed
+    ]
+    return ('reveal', rng.choice(covered))
+
+
+# Wordle
+
+def consistent_guess(engine, rng):
+    """Guess a random word that fits every result seen so far"""
+    candidates = [
+        word for word in engine.word_list
+        if all(score_guess(guess, word.upper()) == result for guess, result in engine.guesses)
+    ]
+    return rng.choice(candidates or engine.word_list).upper()
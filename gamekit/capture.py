@@ -0,0 +1,144 @@
+"""Capture gameplay frames without a display
+
+``python -m gamekit.capture snake --frames 600 --out frames`` plays a seeded
+episode with an agent (see ``gamekit.agents``) and, every tick, runs the
+game's own ``draw()`` against a RasterCanvas, writing a numbered PNG
+sequence or, with ``--format raw``, one raw rgb24 video file for ffmpeg.
+Only games that paint a whole frame from engine state can be captured:
+Snake, Tetris, Block Breaker, and Minesweeper through ``draw_grid()``.
+Wordle and Cookie Clicker draw from widget and animation state the
+engine does not hold.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from gamekit.agents import DEFAULT_AGENTS, agent_rng
+from gamekit.catalog import load_game_class
+from gamekit.engines import ENGINES
+from gamekit.raster import RasterCanvas, RawVideoWriter, scale_down, write_png
+from gamekit.retained import RetainedCanvas
+from gamekit.tournament import load_agent
+
+# Game name -> animation state its draw() reads besides the engine
+VIEW_STATE = {
+    'snake': {'food_pulse': 0, 'food_pulse_direction': 1, 'camera': (0, 0)},
+    'tetris': {},
+    'block breaker': {},
+    'minesweeper': {},
+}
+
+# Minesweeper has no clock: a frame per move, played back at this rate
+MOVES_PER_SECOND = 4
+
+
+def headless_view(name, engine):
+    """A game object without a window whose draw() paints into a RasterCanvas
+
+    The Tk constructor is skipped; the view only gets the engine, the
+    canvas, the retained layer and whatever animation state draw() needs.
+    """
+    game_class = load_game_class(name)
+    view = game_class.__new__(game_class)
+    view.engine = engine
+    if name == 'minesweeper':
+        # The canvas fits the board, and draw_grid() repaints all of it
+        view.grid_size = engine.grid_size
+        size = engine.grid_size * game_class.CELL_SIZE
+        view.canvas = RasterCanvas(size, size, game_class.BG_COLOR)
+        view.draw = view.draw_grid
+    else:
+        view.canvas = RasterCanvas(game_class.WIDTH, game_class.HEIGHT, game_class.BG_COLOR)
+        if hasattr(view, 'draw_grid'):
+            view.draw_grid()
+    view.layer = RetainedCanvas(view.canvas, layers=getattr(game_class, 'LAYERS', ("default",)))
+    view.__dict__.update(VIEW_STATE[name])
+    return view
+
+
+def tick_rate(name):
+    """Frames per second of the game's own loop"""
+    if name == 'minesweeper':
+        return MOVES_PER_SECOND
+    return 1000 / load_game_class(name).GAME_SPEED
+
+
+def capture(name, out, seed=0, agent_spec=None, frames=600, every=1, scale=1, fmt='png'):
+    """Play one episode and write every ``every``-th frame; returns a stats dict"""
+    engine = ENGINES[name](seed=seed)
+    agent = load_agent(agent_spec or DEFAULT_AGENTS[name])
+    rng = agent_rng(seed)
+    view = headless_view(name, engine)
+
+    os.makedirs(out, exist_ok=True)
+    writer = None
+    if fmt == 'raw':
+        width = len(range(0, view.canvas.width, scale))
+        height = len(range(0, view.canvas.height, scale))
+        writer = RawVideoWriter(
+            os.path.join(out, f"{name.replace(' ', '_')}-{seed}.rgb"), width, height, tick_rate(name) / every
+        )
+
+    ticks = written = 0
+    render_seconds = 0.0
+    start = time.perf_counter()
+    while ticks < frames and not engine.done:
+        engine.step(agent(engine, rng))
+        ticks += 1
+        if (ticks - 1) % every:
+            continue
+
+        render_start = time.perf_counter()
+        view.draw()
+        frame = scale_down(view.canvas.render(), scale)
+        render_seconds += time.perf_counter() - render_start
+
+        if writer is not None:
+            writer.write(frame)
+        else:
+            write_png(os.path.join(out, f"frame_{written:06d}.png"), frame)
+        written += 1
+    elapsed = time.perf_counter() - start
+
+    if writer is not None:
+        writer.close()
+    return {
+        'ticks': ticks,
+        'frames': written,
+        'seconds': elapsed,
+        'render_ms': render_seconds / written * 1000 if written else 0.0,
+        'writer': writer,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m gamekit.capture",
+                                     description="Render an agent's episode to PNG frames or raw video")
+    parser.add_argument('game', choices=list(VIEW_STATE))
+    parser.add_argument('--out', default="frames", help="output directory")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--agent', help="agent as module:function (default: a built-in one for the game)")
+    parser.add_argument('--frames', type=int, default=600, help="maximum number of ticks to play")
+    parser.add_argument('--every', type=int, default=1, help="keep every n-th tick")
+    parser.add_argument('--scale', type=int, default=1, help="keep every n-th pixel, for thumbnails")
+    parser.add_argument('--format', choices=('png', 'raw'), default='png')
+    args = parser.parse_args(argv)
+
+    stats = capture(args.game, args.out, args.seed, args.agent, args.frames,
+                    max(1, args.every), max(1, args.scale), args.format)
+
+    rate = stats['frames'] / stats['seconds'] if stats['seconds'] else 0.0
+    print(
+        f"{args.game}: {stats['frames']} frames from {stats['ticks']} ticks in {stats['seconds']:.2f} s "
+        f"({rate:.0f} frames/s, render {stats['render_ms']:.2f} ms/frame, "
+        f"game runs at {tick_rate(args.game):.0f} ticks/s)"
+    )
+    if stats['writer'] is not None:
+        print(stats['writer'].ffmpeg_command())
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
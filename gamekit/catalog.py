@@ -0,0 +1,41 @@
+"""The games in this repo and how to load them
+
+The game scripts live at the repository root and some have spaces in
+their names, so they are imported by path, once, on first use.
+"""
+
+import importlib.util
+import os
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Game name -> (script, Tk game class)
+GAMES = {
+    'snake': ('snake.py', 'SnakeGame'),
+    'tetris': ('tetris.py', 'TetrisGame'),
+    'block breaker': ('block breaker.py', 'BlockBreaker'),
+    'minesweeper': ('minesweeper.py', 'MinesweeperGame'),
+    'wordle': ('wordle.py', 'WordleGame'),
+    'cookie clicker': ('cookie clicker.py', 'CookieClicker'),
+}
+
+_modules = {}
+
+
+def load_module(name):
+    """Import a game script by its game name"""
+    module = _modules.get(name)
+    if module is None:
+        script, _ = GAMES[name]
+        spec = importlib.util.spec_from_file_location(
+            name.replace(' ', '_'), os.path.join(ROOT_DIR, script)
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _modules[name] = module
+    return module
+
+
+def load_game_class(name):
+    """Return the Tk game class for a game name, importing its script if needed"""
+    return getattr(load_module(name), GAMES[name][1])
@@ -0,0 +1,22 @@
+"""Headless game engines: each game's rules without Tk or a real-time clock
+
+Every engine exposes ``reset(seed)`` to start a round, ``step(action)`` to
+advance it, and a ``done`` flag. The Tk classes drive these engines and
+only handle input, timing and drawing.
+"""
+
+from gamekit.engines.block_breaker import BlockBreakerEngine
+from gamekit.engines.cookie_clicker import CookieClickerEngine
+from gamekit.engines.minesweeper import MinesweeperEngine
+from gamekit.engines.snake import SnakeEngine
+from gamekit.engines.tetris import TetrisEngine
+from gamekit.engines.wordle import WordleEngine
+
+ENGINES = {
+    'snake': SnakeEngine,
+    'tetris': TetrisEngine,
+    'block breaker': BlockBreakerEngine,
+    'minesweeper': MinesweeperEngine,
+    'wordle': WordleEngine,
+    'cookie clicker': CookieClickerEngine,
+}
@@ -0,0 +1,344 @@
+import math
+import random
+
+from gamekit.entities import Ball, Block, Pool, Powerup
+from gamekit.phases import no_phase
+
+POWERUP_KINDS = ('EXPAND', 'MULTI', 'SLOW', 'FAST')
+
+
+class BlockBreakerEngine:
+    """Block breaker rules with no display or clock attached
+
+    One ``step`` is one frame of the original 16 ms game loop. The paddle
+    action is 'LEFT', 'RIGHT', None, or a number giving the x position
+    the paddle should be centered on (mouse control).
+    """
+
+    ACTIONS = ('LEFT', 'RIGHT', None)
+    CONFIG = ()
+
+    def __init__(self, seed=None, rng=None):
+        # Game constants
+        self.width = 500
+        self.height = 600
+        self.base_paddle_width = 80
+        self.paddle_height = 12
+        self.ball_size = 10
+        self.block_rows = 6
+        self.block_cols = 10
+        self.block_width = 46
+        self.block_height = 20
+        self.block_padding = 4
+        self.block_offset_top = 80
+        self.powerup_size = 20
+        self.powerup_speed = 2
+        self.paddle_speed = 8
+        self.ball_speed = 5
+
+        self.rng = rng if rng is not None else random.Random(seed)
+
+        # Entities are recycled instead of reallocated every round
+        self.ball_pool = Pool(Ball)
+        self.block_pool = Pool(Block)
+        self.powerup_pool = Pool(Powerup)
+        self.balls = []
+        self.blocks = []
+        self.powerups = []
+
+        # Phase timing, input recording and gameplay event hooks
+        # (gamekit.instrument, gamekit.replay, gamekit.events)
+        self.phase = no_phase
+        self.recorder = None
+        self.events = None
+
+        self.reset()
+
+    def reset(self, seed=None):
+        """Start a new round, reseeding the RNG if a seed is given"""
+        if seed is not None:
+            self.rng.seed(seed)
+        if self.recorder is not None:
+            self.recorder.record_reset(self)
+        if self.events is not None:
+            self.events.emit('round_started')
+
+        self.score = 0
+        self.lives = 3
+        self.powerup_pool.release_all(self.powerups)
+        self.powerups = []  # List of falling powerups
+        self.paddle_width = self.base_paddle_width
+        self.paddle_x = self.width // 2 - self.paddle_width // 2
+        self.paddle_y = self.height - 40
+        self.paddle_expand_timer = 0
+        self.ball_speed_modifier = 1.0
+        self.speed_modifier_timer = 0
+        self.ticks = 0
+        self.game_over = False
+        self.won = False
+
+        # Create initial ball and launch it immediately
+        self.ball_pool.release_all(self.balls)
+        self.balls = [self.new_ball(self.width // 2, self.paddle_y - self.ball_size - 10, 45)]
+        self.create_blocks()
+        return self
+
+    @property
+    def done(self):
+        return self.game_over or self.won
+
+    def new_ball(self, x, y, spread):
+        """Create a ball launched upward at a random angle within +/- spread degrees"""
+        angle = self.rng.uniform(-spread, spread)
+        return self.ball_pool.acquire(
+            x,
+            y,
+            self.ball_speed * math.sin(math.radians(angle)),
+            -self.ball_speed * math.cos(math.radians(angle))
+        )
+
+    def create_blocks(self):
+        """Create block grid"""
+        self.block_pool.release_all(self.blocks)
+        self.blocks = []
+        for row in range(self.block_rows):
+            for col in range(self.block_cols):
+                x = col * (self.block_width + self.block_padding) + self.block_padding + 5
+                y = row * (self.block_height + self.block_padding) + self.block_offset_top
+                points = (row + 1) * 10
+
+                # 15% chance of powerup
+                has_powerup = self.rng.random() < 0.15
+                powerup_type = self.rng.choice(POWERUP_KINDS) if has_powerup else None
+
+                self.blocks.append(self.block_pool.acquire(x, y, row, points, powerup_type))
+
+    def step(self, action=None):
+        """Advance one frame and return the points scored"""
+        if self.recorder is not None:
+            self.recorder.record('step', action)
+        if self.done:
+            return 0
+
+        score_before = self.score
+        self.ticks += 1
+        with self.phase("update"):
+            self.update_paddle(action)
+            self.update_balls()
+            self.update_powerups()
+            self.update_timers()
+        with self.phase("collision"):
+            self.check_collisions()
+        return self.score - score_before
+
+    def update_timers(self):
+        """Update powerup timers"""
+        if self.paddle_expand_timer > 0:
+            self.paddle_expand_timer -= 1
+            if self.paddle_expand_timer == 0:
+                self.paddle_width = self.base_paddle_width
+
+        if self.speed_modifier_timer > 0:
+            self.speed_modifier_timer -= 1
+            if self.speed_modifier_timer == 0:
+                self.ball_speed_modifier = 1.0
+                # Reset ball speeds
+                for ball in self.balls:
+                    speed = math.sqrt(ball.dx**2 + ball.dy**2)
+                    if speed > 0:
+                        ball.dx = ball.dx / abs(ball.dx) * 5 if ball.dx != 0 else 0
+                        ball.dy = ball.dy / abs(ball.dy) * 5 if ball.dy != 0 else -5
+
+    def update_paddle(self, action):
+        """Update paddle position"""
+        if action == 'LEFT':
+            self.paddle_x -= self.paddle_speed
+        elif action == 'RIGHT':
+            self.paddle_x += self.paddle_speed
+        elif action is not None:
+            self.paddle_x = action - self.paddle_width // 2
+
+        self.paddle_x = max(0, min(self.paddle_x, self.width - self.paddle_width))
+
+    def update_balls(self):
+        """Update all balls"""
+        balls_to_remove = []
+
+        for i, ball in enumerate(self.balls):
+            # Add to trail
+            trail = ball.trail
+            trail.append((ball.x, ball.y))
+            if len(trail) > 5:
+                del trail[0]
+
+            # Move ball
+            ball.x += ball.dx * self.ball_speed_modifier
+            ball.y += ball.dy * self.ball_speed_modifier
+
+            # Wall collisions
+            if ball.x <= 0 or ball.x >= self.width - self.ball_size:
+                ball.dx = -ball.dx
+                ball.x = max(0, min(ball.x, self.width - self.ball_size))
+
+            if ball.y <= 0:
+                ball.dy = -ball.dy
+                ball.y = 0
+
+            # Bottom wall - remove ball
+            if ball.y >= self.height:
+                balls_to_remove.append(i)
+
+        # Remove balls that fell
+        for i in reversed(balls_to_remove):
+            self.ball_pool.release(self.balls.pop(i))
+
+        # If no balls left, lose life
+        if len(self.balls) == 0:
+            self.lose_life()
+
+    def update_powerups(self):
+        """Update falling powerups"""
+        powerups_to_remove = []
+
+        for i, powerup in enumerate(self.powerups):
+            powerup.y += self.powerup_speed
+
+            # Check paddle collision
+            if (powerup.y + self.powerup_size >= self.paddle_y and
+                powerup.y <= self.paddle_y + self.paddle_height and
+                powerup.x + self.powerup_size >= self.paddle_x and
+                powerup.x <= self.paddle_x + self.paddle_width):
+
+                self.activate_powerup(powerup.type)
+                powerups_to_remove.append(i)
+                if self.events is not None:
+                    self.events.emit('powerup_caught', type=powerup.type)
+
+            # Remove if off screen
+            elif powerup.y > self.height:
+                powerups_to_remove.append(i)
+
+        for i in reversed(powerups_to_remove):
+            self.powerup_pool.release(self.powerups.pop(i))
+
+    def activate_powerup(self, powerup_type):
+        """Activate a powerup effect"""
+        if powerup_type == 'EXPAND':
+            self.paddle_width = self.base_paddle_width * 1.5
+            self.paddle_expand_timer = 300  # ~5 seconds
+
+        elif powerup_type == 'MULTI':
+            # Add 2 more balls
+            if len(self.balls) > 0:
+                original = self.balls[0]
+                for _ in range(2):
+                    self.balls.append(self.new_ball(original.x, original.y, 60))
+
+        elif powerup_type == 'SLOW':
+            self.ball_speed_modifier = 0.6
+            self.speed_modifier_timer = 300
+
+        elif powerup_type == 'FAST':
+            self.ball_speed_modifier = 1.5
+            self.speed_modifier_timer = 300
+
+    def check_collisions(self):
+        """Check for ball collisions"""
+        # Locals for the per-ball, per-block loop
+        blocks = self.blocks
+        block_width = self.block_width
+        block_height = self.block_height
+
+        for ball in self.balls:
+            # Paddle collision
+            if (ball.y + self.ball_size >= self.paddle_y and
+                ball.y <= self.paddle_y + self.paddle_height and
+                ball.x + self.ball_size >= self.paddle_x and
+                ball.x <= self.paddle_x + self.paddle_width):
+
+                if ball.dy > 0:
+                    hit_pos = ((ball.x + self.ball_size/2) - (self.paddle_x + self.paddle_width/2)) / (self.paddle_width/2)
+                    angle = hit_pos * 60
+                    speed = self.ball_speed  # Reset to base speed
+
+                    ball.dx = speed * math.sin(math.radians(angle))
+                    ball.dy = -speed * math.cos(math.radians(angle))
+
+                    if abs(ball.dy) < 2:
+                        ball.dy = -2 if ball.dy < 0 else 2
+
+                    ball.y = self.paddle_y - self.ball_size
+
+            # Block collisions - check all edges properly
+            ball_left = ball.x
+            ball_right = ball.x + self.ball_size
+            ball_top = ball.y
+            ball_bottom = ball.y + self.ball_size
+
+            for block in blocks:
+                if not block.visible:
+                    continue
+
+                block_left = block.x
+                block_right = block_left + block_width
+                block_top = block.y
+                block_bottom = block_top + block_height
+
+                # Check if ball overlaps with block
+                if (ball_right > block_left and ball_left < block_right and
+                    ball_bottom > block_top and ball_top < block_bottom):
+
+                    block.visible = False
+                    self.score += block.points
+                    if self.events is not None:
+                        self.events.emit('block_broken', row=block.row, points=block.points, score=self.score)
+
+                    # Spawn powerup
+                    if block.has_powerup:
+                        self.powerups.append(self.powerup_pool.acquire(
+                            block.x + self.block_width // 2 - self.powerup_size // 2,
+                            block.y,
+                            block.powerup_type
+                        ))
+
+                    # Calculate collision side more accurately
+                    prev_ball_left = ball_left - ball.dx * self.ball_speed_modifier
+                    prev_ball_right = ball_right - ball.dx * self.ball_speed_modifier
+                    prev_ball_top = ball_top - ball.dy * self.ball_speed_modifier
+                    prev_ball_bottom = ball_bottom - ball.dy * self.ball_speed_modifier
+
+                    # Determine which side was hit
+                    hit_from_left = prev_ball_right <= block_left
+                    hit_from_right = prev_ball_left >= block_right
+                    hit_from_top = prev_ball_bottom <= block_top
+                    hit_from_bottom = prev_ball_top >= block_bottom
+
+                    if hit_from_left or hit_from_right:
+                        ball.dx = -ball.dx
+                    elif hit_from_top or hit_from_bottom:
+                        ball.dy = -ball.dy
+                    else:
+                        # Corner hit - bounce both directions
+                        ball.dx = -ball.dx
+                        ball.dy = -ball.dy
+
+                    # Check win condition
+                    if all(not b.visible for b in self.blocks):
+                        self.won = True
+                        if self.events is not None:
+                            self.events.emit('cleared', score=self.score, lives=self.lives, ticks=self.ticks)
+
+                    break
+
+    def lose_life(self):
+        """Handle losing a life"""
+        self.lives -= 1
+        if self.events is not None:
+            self.events.emit('life_lost', lives=self.lives, score=self.score)
+
+        if self.lives <= 0:
+            self.game_over = True
+        else:
+            # Reset ball
+            self.ball_pool.release_all(self.balls)
+            self.balls = [self.new_ball(self.width // 2, self.paddle_y - self.ball_size - 10, 45)]
@@ -0,0 +1,117 @@
+import random
+
+from gamekit.entities import Upgrade
+
+# Upgrades
+UPGRADES = {
+    'cursor': {'cost': 15, 'cps': 0.1, 'cpc': 0, 'count': 0, 'name': 'Cursor', 'desc': '+0.1 cookies/sec'},
+    'reinforced_cursor': {'cost': 100, 'cps': 0, 'cpc': 1, 'count': 0, 'name': 'Reinforced Cursor', 'desc': '+1 cookies/click'},
+    'grandma': {'cost': 100, 'cps': 1, 'cpc': 0, 'count': 0, 'name': 'Grandma', 'desc': '+1 cookie/sec'},
+    'farm': {'cost': 500, 'cps': 8, 'cpc': 0, 'count': 0, 'name': 'Farm', 'desc': '+8 cookies/sec'},
+    'steel_clicker': {'cost': 500, 'cps': 0, 'cpc': 5, 'count': 0, 'name': 'Steel Clicker', 'desc': '+5 cookies/click'},
+    'mine': {'cost': 3000, 'cps': 47, 'cpc': 0, 'count': 0, 'name': 'Mine', 'desc': '+47 cookies/sec'},
+    'diamond_fingers': {'cost': 5000, 'cps': 0, 'cpc': 25, 'count': 0, 'name': 'Diamond Fingers', 'desc': '+25 cookies/click'},
+    'factory': {'cost': 10000, 'cps': 260, 'cpc': 0, 'count': 0, 'name': 'Factory', 'desc': '+260 cookies/sec'},
+    'bank': {'cost': 40000, 'cps': 1400, 'cpc': 0, 'count': 0, 'name': 'Bank', 'desc': '+1400 cookies/sec'},
+    'titan_hand': {'cost': 50000, 'cps': 0, 'cpc': 100, 'count': 0, 'name': 'Titan Hand', 'desc': '+100 cookies/click'}
+}
+
+
+class CookieClickerEngine:
+    """Cookie clicker economy with no display or clock attached
+
+    One ``step`` is one 100 ms passive income tick. Actions are None,
+    'click', or the key of an upgrade to buy; ``apply`` performs one
+    between ticks.
+    """
+
+    TICK_SECONDS = 0.1
+    CONFIG = ()
+
+    def __init__(self, seed=None, rng=None):
+        # Nothing here is random yet; the RNG keeps the engine API uniform
+        self.rng = rng if rng is not None else random.Random(seed)
+
+        # Input recording and gameplay event hooks, set by gamekit.replay and gamekit.events
+        self.recorder = None
+        self.events = None
+
+        self.reset()
+
+    def reset(self, seed=None):
+        """Start a new save, reseeding the RNG if a seed is given"""
+        if seed is not None:
+            self.rng.seed(seed)
+        if self.recorder is not None:
+            self.recorder.record_reset(self)
+        if self.events is not None:
+            self.events.emit('round_started')
+
+        self.cookies = 0
+        self.cookies_per_click = 1
+        self.cookies_per_second = 0
+        self.total_cookies = 0
+        self.upgrades = {key: Upgrade(**spec) for key, spec in UPGRADES.items()}
+        self.ticks = 0
+        self.done = False
+        return self
+
+    def step(self, action=None):
+        """Apply an action followed by one income tick; returns the cookies earned"""
+        if self.recorder is not None:
+            self.recorder.record('step', action)
+        earned = 0
+        if action == 'click':
+            earned += self.click()
+        elif action is not None:
+            self.buy_upgrade(action)
+
+        earned += self.tick()
+        return earned
+
+    def apply(self, action):
+        """Click or buy between ticks; returns the cookies gained or whether the upgrade was bought"""
+        if self.recorder is not None:
+            self.recorder.record('apply', action)
+        if action == 'click':
+            return self.click()
+        return self.buy_upgrade(action)
+
+    def click(self):
+        """Handle cookie click"""
+        self.cookies += self.cookies_per_click
+        self.total_cookies += self.cookies_per_click
+        return self.cookies_per_click
+
+    def can_afford(self, upgrade_key):
+        return self.cookies >= self.upgrades[upgrade_key].cost
+
+    def buy_upgrade(self, upgrade_key):
+        """Purchase an upgrade if it exists and is affordable"""
+        upgrade = self.upgrades.get(upgrade_key)
+
+        if upgrade is None or self.cookies < upgrade.cost:
+            return False
+
+        self.cookies -= upgrade.cost
+        upgrade.count += 1
+        self.cookies_per_second += upgrade.cps
+        self.cookies_per_click += upgrade.cpc
+
+        # Increase cost (1.15x multiplier)
+        paid = upgrade.cost
+        upgrade.cost = int(upgrade.cost * 1.15)
+        if self.events is not None:
+            self.events.emit('upgrade_bought', upgrade=upgrade_key, count=upgrade.count, cost=paid, cookies=self.cookies)
+        return True
+
+    def tick(self, seconds=TICK_SECONDS):
+        """Add cookies from passive income"""
+        self.ticks += 1
+        if self.cookies_per_second <= 0:
+            return 0
+
+        income = self.cookies_per_second * seconds
+        self.cookies += income
+        self.total_cookies += income
+        return income
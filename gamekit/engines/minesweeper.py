@@ -0,0 +1,167 @@
+import random
+
+NEIGHBORS = [(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc]
+
+
+class MinesweeperEngine:
+    """Minesweeper rules with no display or clock attached
+
+    Actions are ``('reveal', (row, col))`` or ``('flag', (row, col))``.
+    Mines are placed on the first reveal so the first click is always safe.
+    There is no clock, so ``step`` and ``apply`` are the same.
+    """
+
+    CONFIG = ('grid_size', 'mine_count')
+
+    def __init__(self, grid_size=10, mine_count=10, seed=None, rng=None):
+        self.grid_size = grid_size
+        self.mine_count = mine_count
+        self.rng = rng if rng is not None else random.Random(seed)
+
+        # Input recording and gameplay event hooks, set by gamekit.replay and gamekit.events
+        self.recorder = None
+        self.events = None
+
+        self.reset()
+
+    def reset(self, seed=None, grid_size=None, mine_count=None):
+        """Start a new round, optionally changing the difficulty"""
+        if seed is not None:
+            self.rng.seed(seed)
+        if grid_size is not None:
+            self.grid_size = grid_size
+        if mine_count is not None:
+            self.mine_count = mine_count
+        if self.recorder is not None:
+            self.recorder.record_reset(self)
+        if self.events is not None:
+            self.events.emit('round_started')
+
+        self.mines = set()
+        self.revealed = set()
+        self.flags = set()
+        self.first_click = True
+        self.done = False
+        self.won = False
+        return self
+
+    def in_bounds(self, pos):
+        row, col = pos
+        return 0 <= row < self.grid_size and 0 <= col < self.grid_size
+
+    def apply(self, action):
+        """Apply a reveal or flag action
+
+        Returns the number of cells revealed, or whether the flag changed.
+        """
+        if self.recorder is not None:
+            self.recorder.record('apply', action)
+        kind, pos = action
+        if kind == 'flag':
+            return self.toggle_flag(pos)
+        return self.reveal(pos)
+
+    step = apply
+
+    def reveal(self, pos):
+        """Reveal a cell from a player click, placing mines on the first one"""
+        if self.done or not self.in_bounds(pos):
+            return 0
+        if pos in self.flags or pos in self.revealed:
+            return 0
+
+        if self.first_click:
+            self.generate_mines(pos)
+            self.first_click = False
+
+        revealed = self.reveal_cell(pos)
+        if self.events is not None:
+            self.events.emit('cell_revealed', row=pos[0], col=pos[1], cells=revealed, mine=pos in self.mines)
+            if self.done:
+                self.events.emit('won' if self.won else 'lost', revealed=len(self.revealed), size=self.grid_size)
+        return revealed
+
+    def toggle_flag(self, pos):
+        """Flag or unflag a hidden cell"""
+        if self.done or self.first_click or not self.in_bounds(pos):
+            return False
+        if pos in self.revealed:
+            return False
+
+        if pos in self.flags:
+            self.flags.remove(pos)
+        else:
+            self.flags.add(pos)
+        if self.events is not None:
+            self.events.emit('flag', row=pos[0], col=pos[1], flagged=pos in self.flags)
+        return True
+
+    def generate_mines(self, safe_pos):
+        """Generate mines, avoiding the first clicked position"""
+        # Generate safe positions (clicked cell and its neighbors)
+        safe_positions = {safe_pos}
+        for dr, dc in NEIGHBORS:
+            nr, nc = safe_pos[0] + dr, safe_pos[1] + dc
+            if 0 <= nr < self.grid_size and 0 <= nc < self.grid_size:
+                safe_positions.add((nr, nc))
+
+        # Generate mines
+        available_positions = [
+            (r, c) for r in range(self.grid_size) for c in range(self.grid_size)
+            if (r, c) not in safe_positions
+        ]
+
+        self.mines = set(self.rng.sample(available_positions, min(self.mine_count, len(available_positions))))
+
+    def reveal_cell(self, pos):
+        """Reveal a cell, flood-filling empty areas, and check win/lose conditions"""
+        if pos in self.revealed or pos in self.flags:
+            return 0
+
+        self.revealed.add(pos)
+
+        if pos in self.mines:
+            self.done = True
+            self.reveal_all_mines()
+            return 1
+
+        # Auto-reveal adjacent cells if no adjacent mines
+        revealed = 1
+        stack = [pos]
+        while stack:
+            row, col = stack.pop()
+            if self.count_adjacent_mines(row, col) != 0:
+                continue
+            for dr, dc in NEIGHBORS:
+                nr, nc = row + dr, col + dc
+                if 0 <= nr < self.grid_size and 0 <= nc < self.grid_size:
+                    new_pos = (nr, nc)
+                    if new_pos not in self.revealed and new_pos not in self.flags:
+                        self.revealed.add(new_pos)
+                        revealed += 1
+                        stack.append(new_pos)
+
+        self.check_win()
+        return revealed
+
+    def count_adjacent_mines(self, row, col):
+        """Count mines adjacent to a cell"""
+        count = 0
+        for dr, dc in NEIGHBORS:
+            nr, nc = row + dr, col + dc
+            if 0 <= nr < self.grid_size and 0 <= nc < self.grid_size:
+                if (nr, nc) in self.mines:
+                    count += 1
+        return count
+
+    def reveal_all_mines(self):
+        """Reveal all mines when game is lost"""
+        for mine in self.mines:
+            self.revealed.add(mine)
+
+    def check_win(self):
+        """Check if player has won"""
+        total_cells = self.grid_size * self.grid_size
+        if len(self.revealed) == total_cells - len(self.mines):
+            self.done = True
+            self.won = True
@@ -0,0 +1,329 @@
+import random
+from array import array
+from collections import deque
+
+from gamekit.phases import no_phase
+
+OPPOSITE = {
+    'UP': 'DOWN', 'DOWN': 'UP',
+    'LEFT': 'RIGHT', 'RIGHT': 'LEFT'
+}
+
+MOVES = {
+    'UP': (0, -1),
+    'DOWN': (0, 1),
+    'LEFT': (-1, 0),
+    'RIGHT': (1, 0)
+}
+
+# Plain random draws tried before sampling the free-cell index; enough
+# for any board with room left, and they keep seeded rounds unchanged
+FOOD_PROBES = 16
+
+
+class SnakeBody:
+    """The snake's cells, head first, in a fixed ring of flat int32 indexes
+
+    Reads and moves like the deque of ``(x, y)`` cells it replaced:
+    ``len``, indexing from either end, iteration, ``appendleft``, ``pop``
+    and ``append``. Cells are numbered on the board padded by one cell on
+    every side, so a head that ran into a wall is kept too. A new round
+    takes a new SnakeBody over the same ring, so holders of the old one
+    can tell the rounds apart.
+    """
+
+    __slots__ = ('ring', 'stride', 'head', 'length')
+
+    def __init__(self, ring, grid_size):
+        self.ring = ring
+        self.stride = grid_size + 2
+        self.head = 0
+        self.length = 0
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("snake index out of range")
+        y, x = divmod(self.ring[(self.head + index) % len(self.ring)], self.stride)
+        return x - 1, y - 1
+
+    def __iter__(self):
+        for index in range(self.length):
+            yield self[index]
+
+    def __repr__(self):
+        return f"SnakeBody({list(self)})"
+
+    def appendleft(self, cell):
+        """Add a new head"""
+        self.head = (self.head - 1) % len(self.ring)
+        self.ring[self.head] = (cell[1] + 1) * self.stride + cell[0] + 1
+        self.length += 1
+
+    def append(self, cell):
+        """Add a cell behind the tail"""
+        self.ring[(self.head + self.length) % len(self.ring)] = (cell[1] + 1) * self.stride + cell[0] + 1
+        self.length += 1
+
+    def pop(self):
+        """Remove and return the tail cell"""
+        cell = self[-1]
+        self.length -= 1
+        return cell
+
+
+class SnakeEngine:
+    """Snake rules with no display or clock attached
+
+    ``apply`` queues a direction between ticks; ``step`` runs one tick,
+    optionally queueing a direction first.
+
+    ``occupancy`` counts the body segments on every grid cell, row by row,
+    and is kept in step with ``snake`` as it moves and grows, so collision
+    checks and food placement cost the same at any length. Code that
+    replaces the body wholesale goes through ``set_snake``.
+
+    ``free_cells`` lists every empty cell in no particular order and
+    ``free_slot`` maps a cell to its position there (-1 if occupied), so
+    cells are added and swap-removed in O(1) and food can be placed
+    uniformly on a nearly full board. Filling the board wins the round.
+
+    These three and the body ring are flat arrays of one byte or one
+    int32 per cell, allocated once per engine, so a 2000x2000 board costs
+    about 54 MB rather than a list entry and an int object per cell. A
+    new round only clears the cells of the last body, so it costs the
+    same on any board.
+    """
+
+    ACTIONS = ('UP', 'DOWN', 'LEFT', 'RIGHT')
+    CONFIG = ('grid_size',)
+
+    def __init__(self, grid_size=20, seed=None, rng=None):
+        self.grid_size = grid_size
+        self.rng = rng if rng is not None else random.Random(seed)
+
+        # Input queue for responsive controls
+        self.direction_queue = deque(maxlen=3)
+
+        # Board state, sized once: every cell starts out free
+        cells = grid_size * grid_size
+        self.occupancy = bytearray(cells)
+        self.free_cells = array('i', range(cells))
+        self.free_slot = array('i', range(cells))
+        # A full board plus the repeated tail cell fits in the ring
+        self.snake = SnakeBody(array('i', bytes(4 * (cells + 2))), grid_size)
+
+        # Phase timing, input recording and gameplay event hooks
+        # (gamekit.instrument, gamekit.replay, gamekit.events)
+        self.phase = no_phase
+        self.recorder = None
+        self.events = None
+
+        self.reset()
+
+    def reset(self, seed=None):
+        """Start a new round, reseeding the RNG if a seed is given"""
+        if seed is not None:
+            self.rng.seed(seed)
+        if self.recorder is not None:
+            self.recorder.record_reset(self)
+        if self.events is not None:
+            self.events.emit('round_started')
+
+        # Initialize snake in center
+        center = self.grid_size // 2
+        self.set_snake([
+            (center, center),
+            (center, center + 1),
+            (center, center + 2)
+        ])
+        self.direction = None
+        self.direction_queue.clear()
+        self.food = None
+        self.score = 0
+        self.ticks = 0
+        self.done = False
+
+        self.spawn_food()
+        return self
+
+    def set_snake(self, cells):
+        """Replace the body, head first, updating only the cells of the old and new bodies"""
+        size = self.grid_size
+        occupancy = self.occupancy
+        cells = list(cells)
+
+        for x, y in self.snake:
+            if 0 <= x < size and 0 <= y < size:
+                cell = y * size + x
+                if occupancy[cell]:
+                    occupancy[cell] = 0
+                    self.vacate(cell)
+
+        self.snake = SnakeBody(self.snake.ring, size)
+        for x, y in cells:
+            self.snake.append((x, y))
+            if 0 <= x < size and 0 <= y < size:
+                cell = y * size + x
+                if not occupancy[cell]:
+                    self.fill(cell)
+                occupancy[cell] += 1
+
+    @property
+    def won(self):
+        """True once the snake has filled the board"""
+        return self.done and self.food is None
+
+    def fill(self, cell):
+        """Swap-remove ``cell`` from the free list; its count just went from 0 to 1"""
+        slot = self.free_slot[cell]
+        last = self.free_cells.pop()
+        if last != cell:
+            self.free_cells[slot] = last
+            self.free_slot[last] = slot
+        self.free_slot[cell] = -1
+
+    def vacate(self, cell):
+        """Add ``cell`` to the free list; its count just went from 1 to 0"""
+        self.free_slot[cell] = len(self.free_cells)
+        self.free_cells.append(cell)
+
+    def occupied(self, cell):
+        """Number of body segments on ``cell``; 0 off the grid"""
+        x, y = cell
+        size = self.grid_size
+        if 0 <= x < size and 0 <= y < size:
+            return self.occupancy[y * size + x]
+        return 0
+
+    def queue_direction(self, new_direction):
+        """Queue a direction change, ignoring 180-degree turns"""
+        if self.done:
+            return False
+
+        # Get the last direction in queue or current direction
+        last_dir = self.direction_queue[-1] if self.direction_queue else self.direction
+
+        if last_dir and new_direction == OPPOSITE.get(last_dir):
+            return False
+
+        # Only queue if different from last queued direction
+        if not self.direction_queue or new_direction != self.direction_queue[-1]:
+            self.direction_queue.append(new_direction)
+            return True
+        return False
+
+    def spawn_food(self):
+        """Spawn food at a random empty cell; returns False if there is none"""
+        size = self.grid_size
+        if not self.free_cells:
+            self.food = None
+            return False
+
+        for _ in range(FOOD_PROBES):
+            x = self.rng.randint(0, size - 1)
+            y = self.rng.randint(0, size - 1)
+            if not self.occupancy[y * size + x]:
+                self.food = (x, y)
+                return True
+
+        # Nearly full: draw straight from the empty cells
+        cell = self.free_cells[self.rng.randrange(len(self.free_cells))]
+        self.food = (cell % size, cell // size)
+        return True
+
+    def apply(self, action):
+        """Queue a direction without advancing"""
+        if self.recorder is not None:
+            self.recorder.record('apply', action)
+        self.queue_direction(action)
+
+    def step(self, action=None):
+        """Advance one tick and return the points scored"""
+        if self.recorder is not None:
+            self.recorder.record('step', action)
+        if self.done:
+            return 0
+
+        if action is not None:
+            self.queue_direction(action)
+
+        # Process next direction from queue
+        if self.direction_queue:
+            next_direction = self.direction_queue.popleft()
+            if not self.direction or next_direction != OPPOSITE.get(self.direction):
+                self.direction = next_direction
+
+        # The snake waits for the first direction before moving
+        if not self.direction:
+            return 0
+
+        self.ticks += 1
+        with self.phase("update"):
+            self.move_snake()
+        with self.phase("collision"):
+            collided = self.check_collision()
+        if collided:
+            self.done = True
+            if self.events is not None:
+                self.events.emit('died', score=self.score, length=len(self.snake), ticks=self.ticks)
+            return 0
+        return self.check_food()
+
+    def move_snake(self):
+        """Move snake in current direction"""
+        head_x, head_y = self.snake[0]
+        dx, dy = MOVES[self.direction]
+        head_x += dx
+        head_y += dy
+        size = self.grid_size
+        occupancy = self.occupancy
+
+        self.snake.appendleft((head_x, head_y))
+        tail_x, tail_y = self.snake.pop()
+        if 0 <= tail_x < size and 0 <= tail_y < size:
+            cell = tail_y * size + tail_x
+            occupancy[cell] -= 1
+            if not occupancy[cell]:
+                self.vacate(cell)
+        if 0 <= head_x < size and 0 <= head_y < size:
+            cell = head_y * size + head_x
+            if not occupancy[cell]:
+                self.fill(cell)
+            occupancy[cell] += 1
+
+    def check_collision(self):
+        """Return True if the head hit a wall or the body"""
+        head_x, head_y = self.snake[0]
+
+        # Wall collision
+        if head_x < 0 or head_x >= self.grid_size or head_y < 0 or head_y >= self.grid_size:
+            return True
+
+        # Self collision: another segment shares the head's cell
+        return self.occupancy[head_y * self.grid_size + head_x] > 1
+
+    def check_food(self):
+        """Grow the snake if it ate food and return the points scored"""
+        if self.snake[0] != self.food:
+            return 0
+
+        self.score += 1
+
+        # Grow snake
+        tail_x, tail_y = self.snake[-1]
+        self.snake.append((tail_x, tail_y))
+        self.occupancy[tail_y * self.grid_size + tail_x] += 1
+
+        if self.events is not None:
+            self.events.emit('food_eaten', score=self.score, length=len(self.snake))
+        if not self.spawn_food():
+            # No empty cell left: the snake fills the board
+            self.done = True
+            if self.events is not None:
+                self.events.emit('won', score=self.score, length=len(self.snake), ticks=self.ticks)
+        return 1
@@ -0,0 +1,218 @@
+"""Many Snake boards stepped together with NumPy, for agent training
+
+SnakeBatch plays the rules of SnakeEngine (``move_snake``,
+``check_collision``, ``check_food``) on N independent boards at once.
+Every board's state lives in a row of a few NumPy arrays and one
+``step(actions)`` advances them all with whole-array operations, so the
+cost per board shrinks as N grows instead of being one Python engine
+call per board.
+
+Observations are a single (N, 3, size, size) uint8 array of bitplanes:
+the body, the head and the food. ``step`` updates those planes in place
+and ``observe()`` and the ``body``/``head``/``food`` attributes are
+views of them, never copies, so they always show the current state.
+Boards that die or fill up are reset on the spot and start their next
+round in the same step.
+
+Needs NumPy; it is imported on its own, not from ``gamekit.engines``,
+so the games do not load NumPy at startup.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # Only batched training needs NumPy
+    np = None
+
+from gamekit.engines.snake import FOOD_PROBES, SnakeEngine
+
+# Actions are indexes into SnakeEngine.ACTIONS; -1 keeps the direction
+ACTIONS = SnakeEngine.ACTIONS
+NO_ACTION = -1
+
+
+class SnakeBatch:
+    """N Snake boards stepped together; ``step`` takes one action per board
+
+    The body of each board is a ring of flat cell indexes, head first,
+    with ``occupancy`` counting the segments on every cell like the
+    engine's. Eating grows a board by keeping its tail on the next move,
+    where the engine repeats its tail cell; lengths and collisions come
+    out the same.
+    """
+
+    def __init__(self, boards, grid_size=20, seed=None):
+        if np is None:
+            raise RuntimeError("batched Snake needs NumPy")
+        self.boards = boards
+        self.grid_size = grid_size
+        self.rng = np.random.default_rng(seed)
+
+        cells = grid_size * grid_size
+        self.planes = np.zeros((boards, 3, grid_size, grid_size), dtype=np.uint8)
+        self.body = self.planes[:, 0]
+        self.head = self.planes[:, 1]
+        self.food = self.planes[:, 2]
+
+        # Flat views of the same planes, one row per board
+        self.occupancy = self.body.reshape(boards, cells)
+        self.head_plane = self.head.reshape(boards, cells)
+        self.food_plane = self.food.reshape(boards, cells)
+
+        # A full board plus the grown tail fits in the ring
+        self.ring = np.zeros((boards, cells + 1), dtype=np.int32)
+        self.ring_head = np.zeros(boards, dtype=np.int64)
+        self.length = np.zeros(boards, dtype=np.int64)
+        self.growing = np.zeros(boards, dtype=bool)
+
+        self.head_cell = np.zeros(boards, dtype=np.int64)
+        self.food_cell = np.full(boards, -1, dtype=np.int64)
+        self.direction = np.full(boards, NO_ACTION, dtype=np.int64)
+        self.score = np.zeros(boards, dtype=np.int64)
+        self.ticks = np.zeros(boards, dtype=np.int64)
+
+        # How the last round of each board ended
+        self.final_score = np.zeros(boards, dtype=np.int64)
+        self.won = np.zeros(boards, dtype=bool)
+        self.episodes = 0
+
+        # Per action: the opposite action and the step along x and y
+        self.opposite = np.array([ACTIONS.index(name) for name in ('DOWN', 'UP', 'RIGHT', 'LEFT')])
+        self.dx = np.array([0, 0, -1, 1])
+        self.dy = np.array([-1, 1, 0, 0])
+
+        self.reset()
+
+    def reset(self, boards=None):
+        """Start new rounds on ``boards`` (indexes or a mask), or on all of them"""
+        if boards is None:
+            boards = np.arange(self.boards)
+        boards = np.asarray(boards)
+        if boards.dtype == bool:
+            boards = np.flatnonzero(boards)
+        if not boards.size:
+            return
+
+        self.planes[boards] = 0
+        size = self.grid_size
+
+        # Three cells in the center, heading nowhere until the first action
+        center = size // 2
+        start = np.array([center, center + 1, center + 2]) * size + center
+        self.ring[boards, :3] = start
+        self.ring_head[boards] = 0
+        self.length[boards] = 3
+        self.growing[boards] = False
+        self.occupancy[boards[:, None], start] = 1
+        self.head_cell[boards] = start[0]
+        self.head_plane[boards, start[0]] = 1
+
+        self.direction[boards] = NO_ACTION
+        self.score[boards] = 0
+        self.ticks[boards] = 0
+        self.food_cell[boards] = -1
+        self.spawn_food(boards)
+
+    def observe(self):
+        """The (boards, 3, size, size) bitplanes: body, head, food; updated in place by ``step``"""
+        return self.planes
+
+    def step(self, actions):
+        """Advance every board one tick; returns (points scored, round ended) per board
+
+        Rounds that ended are reset before returning; their scores are in
+        ``final_score`` and ``won`` tells a filled board from a crash.
+        """
+        actions = np.asarray(actions)
+        size = self.grid_size
+        rewards = np.zeros(self.boards, dtype=np.int64)
+        done = np.zeros(self.boards, dtype=bool)
+
+        # Turn unless the action is a 180-degree turn
+        turn = (actions >= 0) & ((self.direction < 0) | (actions != self.opposite[self.direction]))
+        self.direction[turn] = actions[turn]
+
+        # The snake waits for the first direction before moving
+        moving = np.flatnonzero(self.direction >= 0)
+        if not moving.size:
+            return rewards, done
+        self.ticks[moving] += 1
+        direction = self.direction[moving]
+        head = self.head_cell[moving]
+        x = head % size + self.dx[direction]
+        y = head // size + self.dy[direction]
+        inside = (x >= 0) & (x < size) & (y >= 0) & (y < size)
+        cell = np.where(inside, y * size + x, 0)
+
+        # Move: the tail leaves unless the snake just ate, the head enters
+        self.head_plane[moving, head] = 0
+        keep_tail = self.growing[moving]
+        self.growing[moving] = False
+        shrinking = moving[~keep_tail]
+        tail = self.ring[shrinking, (self.ring_head[shrinking] + self.length[shrinking] - 1) % self.ring.shape[1]]
+        self.occupancy[shrinking, tail] -= 1
+
+        ring_head = (self.ring_head[moving] - 1) % self.ring.shape[1]
+        self.ring_head[moving] = ring_head
+        self.ring[moving, ring_head] = cell
+        self.head_cell[moving] = cell
+        entered = moving[inside]
+        self.occupancy[entered, cell[inside]] += 1
+        self.head_plane[entered, cell[inside]] = 1
+
+        # Collision with a wall, or another segment on the head's cell
+        collided = ~inside
+        collided[inside] = self.occupancy[entered, cell[inside]] > 1
+        done[moving[collided]] = True
+
+        # Food: grow by keeping the tail on the next move
+        ate = ~collided & (cell == self.food_cell[moving])
+        eaten = moving[ate]
+        if eaten.size:
+            rewards[eaten] = 1
+            self.score[eaten] += 1
+            self.length[eaten] += 1
+            self.growing[eaten] = True
+            self.food_plane[eaten, cell[ate]] = 0
+            self.food_cell[eaten] = -1
+            filled = eaten[~self.spawn_food(eaten)]
+            done[filled] = True
+
+        ended = np.flatnonzero(done)
+        if ended.size:
+            self.final_score[ended] = self.score[ended]
+            self.won[ended] = self.food_cell[ended] < 0
+            self.episodes += ended.size
+            self.reset(ended)
+        return rewards, done
+
+    def spawn_food(self, boards):
+        """Put food on a random empty cell of each board; returns which boards had one"""
+        cells = self.grid_size * self.grid_size
+
+        # Plain random probes first, like the engine; few boards miss all of them
+        probes = self.rng.integers(0, cells, size=(boards.size, FOOD_PROBES))
+        free = self.occupancy[boards[:, None], probes] == 0
+        found = free.any(axis=1)
+        food = probes[np.arange(boards.size), free.argmax(axis=1)]
+
+        # Nearly full boards: draw straight from their empty cells
+        for i in np.flatnonzero(~found):
+            empty = np.flatnonzero(self.occupancy[boards[i]] == 0)
+            if empty.size:
+                food[i] = empty[self.rng.integers(empty.size)]
+                found[i] = True
+
+        placed = boards[found]
+        self.food_cell[placed] = food[found]
+        self.food_plane[placed, food[found]] = 1
+        return found
+
+    def snake(self, board):
+        """One board's body as (x, y) cells, head first, as ``SnakeEngine.snake`` lists it"""
+        size = self.grid_size
+        positions = (self.ring_head[board] + np.arange(self.length[board])) % self.ring.shape[1]
+        cells = self.ring[board, positions]
+        if self.growing[board]:
+            cells[-1] = cells[-2]  # The engine's repeated tail cell
+        return [(int(cell) % size, int(cell) // size) for cell in cells]
+
@@ -0,0 +1,231 @@
+import random
+
+from gamekit.phases import no_phase
+
+# Tetromino shapes
+SHAPES = {
+    'I': [(0, 1), (1, 1), (2, 1), (3, 1)],
+    'O': [(0, 0), (1, 0), (0, 1), (1, 1)],
+    'T': [(1, 0), (0, 1), (1, 1), (2, 1)],
+    'S': [(1, 0), (2, 0), (0, 1), (1, 1)],
+    'Z': [(0, 0), (1, 0), (1, 1), (2, 1)],
+    'J': [(0, 0), (0, 1), (1, 1), (2, 1)],
+    'L': [(2, 0), (0, 1), (1, 1), (2, 1)]
+}
+
+POINTS = [0, 100, 300, 500, 800]  # Points for 0-4 lines
+
+
+class TetrisEngine:
+    """Tetris rules with no display or clock attached
+
+    Locked cells in ``grid`` hold the shape letter of the piece that
+    filled them, or None when empty. ``apply`` moves the piece between
+    gravity ticks; ``step`` applies an action and then one tick.
+    """
+
+    ACTIONS = ('LEFT', 'RIGHT', 'DOWN', 'ROTATE', 'DROP')
+    CONFIG = ('width', 'height')
+
+    def __init__(self, width=10, height=20, seed=None, rng=None):
+        self.width = width
+        self.height = height
+        self.rng = rng if rng is not None else random.Random(seed)
+
+        # Phase timing, input recording and gameplay event hooks
+        # (gamekit.instrument, gamekit.replay, gamekit.events)
+        self.phase = no_phase
+        self.recorder = None
+        self.events = None
+
+        self.reset()
+
+    def reset(self, seed=None):
+        """Start a new round, reseeding the RNG if a seed is given"""
+        if seed is not None:
+            self.rng.seed(seed)
+        if self.recorder is not None:
+            self.recorder.record_reset(self)
+        if self.events is not None:
+            self.events.emit('round_started')
+
+        self.grid = [[None for _ in range(self.width)] for _ in range(self.height)]
+        self.current_piece = None
+        self.current_shape = None
+        self.current_x = 0
+        self.current_y = 0
+        self.score = 0
+        self.lines_cleared = 0
+        self.pieces = 0
+        self.done = False
+
+        self.spawn_piece()
+        return self
+
+    def gravity_interval(self, base_speed=500):
+        """Milliseconds between gravity ticks at the current level"""
+        return max(100, base_speed - (self.lines_cleared // 10) * 50)
+
+    def spawn_piece(self):
+        """Spawn a new tetromino"""
+        shape_type = self.rng.choice(list(SHAPES.keys()))
+        self.current_shape = shape_type
+        self.current_piece = SHAPES[shape_type].copy()
+        self.current_x = self.width // 2 - 2
+        self.current_y = 0
+        self.pieces += 1
+
+        # Check if spawn position is valid
+        if not self.is_valid_position(self.current_piece, self.current_x, self.current_y):
+            self.done = True
+            if self.events is not None:
+                self.events.emit('topped_out', score=self.score, lines=self.lines_cleared, pieces=self.pieces)
+
+    def is_valid_position(self, piece, x, y):
+        """Check if piece position is valid"""
+        for px, py in piece:
+            new_x = x + px
+            new_y = y + py
+
+            if new_x < 0 or new_x >= self.width:
+                return False
+            if new_y >= self.height:
+                return False
+            if new_y >= 0 and self.grid[new_y][new_x] is not None:
+                return False
+
+        return True
+
+    def move(self, dx, dy):
+        """Move piece by dx, dy, locking it if a downward move is blocked"""
+        if self.done:
+            return False
+
+        new_x = self.current_x + dx
+        new_y = self.current_y + dy
+
+        if self.is_valid_position(self.current_piece, new_x, new_y):
+            self.current_x = new_x
+            self.current_y = new_y
+            return True
+        if dy > 0:  # Moving down and can't - lock piece
+            self.lock_piece()
+        return False
+
+    def rotate(self):
+        """Rotate piece 90 degrees clockwise with simple wall kicks"""
+        if self.done or self.current_shape == 'O':  # O piece doesn't rotate
+            return False
+
+        # Rotate around center
+        rotated = []
+        for x, y in self.current_piece:
+            # Rotate 90 degrees clockwise: (x,y) -> (y, -x)
+            # Adjust for piece center
+            if self.current_shape == 'I':
+                new_x = 2 - y
+                new_y = x - 1
+            else:
+                new_x = 2 - y
+                new_y = x
+            rotated.append((new_x, new_y))
+
+        # Try in place, then wall kick left, then wall kick right
+        for kick in (0, -1, 1):
+            if self.is_valid_position(rotated, self.current_x + kick, self.current_y):
+                self.current_x += kick
+                self.current_piece = rotated
+                return True
+        return False
+
+    def hard_drop(self):
+        """Drop piece instantly and lock it"""
+        if self.done:
+            return
+
+        while self.is_valid_position(self.current_piece, self.current_x, self.current_y + 1):
+            self.current_y += 1
+
+        self.lock_piece()
+
+    def lock_piece(self):
+        """Lock piece into grid"""
+        for px, py in self.current_piece:
+            grid_x = self.current_x + px
+            grid_y = self.current_y + py
+            if grid_y >= 0:
+                self.grid[grid_y][grid_x] = self.current_shape
+        if self.events is not None:
+            self.events.emit('piece_locked', shape=self.current_shape, x=self.current_x, y=self.current_y)
+
+        self.clear_lines()
+        self.spawn_piece()
+
+    def clear_lines(self):
+        """Clear completed lines and return how many were cleared"""
+        lines_to_clear = []
+
+        for y in range(self.height):
+            if all(self.grid[y][x] is not None for x in range(self.width)):
+                lines_to_clear.append(y)
+
+        if lines_to_clear:
+            # Remove cleared lines
+            for y in sorted(lines_to_clear, reverse=True):
+                del self.grid[y]
+            for _ in lines_to_clear:
+                self.grid.insert(0, [None for _ in range(self.width)])
+
+            # Update score
+            lines_count = len(lines_to_clear)
+            self.lines_cleared += lines_count
+            self.score += POINTS[min(lines_count, 4)]
+            if self.events is not None:
+                self.events.emit('lines_cleared', lines=lines_count, total=self.lines_cleared, score=self.score)
+
+        return len(lines_to_clear)
+
+    def tick(self):
+        """Apply one gravity step"""
+        if self.done:
+            return
+
+        with self.phase("collision"):
+            blocked = not self.is_valid_position(self.current_piece, self.current_x, self.current_y + 1)
+        with self.phase("update"):
+            if blocked:
+                self.lock_piece()
+            else:
+                self.current_y += 1
+
+    def apply(self, action):
+        """Apply a player action without a gravity tick; returns whether the piece moved"""
+        if self.recorder is not None:
+            self.recorder.record('apply', action)
+        return self.perform(action)
+
+    def perform(self, action):
+        if action == 'LEFT':
+            return self.move(-1, 0)
+        if action == 'RIGHT':
+            return self.move(1, 0)
+        if action == 'DOWN':
+            return self.move(0, 1)
+        if action == 'ROTATE':
+            return self.rotate()
+        if action == 'DROP':
+            self.hard_drop()
+            return True
+        return False
+
+    def step(self, action=None):
+        """Apply an action followed by one gravity tick; returns the points scored"""
+        if self.recorder is not None:
+            self.recorder.record('step', action)
+        if self.done:
+            return 0
+
+        score_before = self.score
+        self.perform(action)
+        self.tick()
+        return self.score - score_before
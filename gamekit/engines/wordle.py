@@ -0,0 +1,211 @@
+import random
+from collections import namedtuple
+
+# Word list - common 5-letter words
+WORD_LIST = [
+    "about", "above", "abuse", "actor", "acute", "admit", "adopt", "adult", "after", "again",
+    "agent", "agree", "ahead", "alarm", "album", "alert", "alike", "alive", "allow", "alone",
+    "along", "alter", "among", "anger", "angle", "angry", "apart", "apple", "apply", "arena",
+    "argue", "arise", "array", "aside", "asset", "audio", "avoid", "award", "aware", "badly",
+    "baker", "bases", "basic", "basis", "beach", "began", "begin", "begun", "being", "below",
+    "bench", "billy", "birth", "black", "blade", "blame", "blind", "block", "blood", "board",
+    "boost", "booth", "bound", "brain", "brand", "bread", "break", "breed", "brief", "bring",
+    "broad", "broke", "brown", "build", "built", "buyer", "cable", "calif", "carry", "catch",
+    "cause", "chain", "chair", "chart", "chase", "cheap", "check", "chest", "chief", "child",
+    "china", "chose", "civil", "claim", "class", "clean", "clear", "click", "clock", "close",
+    "coach", "coast", "could", "count", "court", "cover", "crack", "craft", "crash", "crazy",
+    "cream", "crime", "cross", "crowd", "crown", "crude", "curve", "cycle", "daily", "dance",
+    "dated", "dealt", "death", "debut", "delay", "depth", "doing", "doubt", "dozen", "draft",
+    "drama", "drank", "drawn", "dream", "dress", "drill", "drink", "drive", "drove", "dying",
+    "eager", "early", "earth", "eight", "elite", "empty", "enemy", "enjoy", "enter", "entry",
+    "equal", "error", "event", "every", "exact", "exist", "extra", "faith", "false", "fault",
+    "fiber", "field", "fifth", "fifty", "fight", "final", "first", "fixed", "flash", "fleet",
+    "floor", "fluid", "focus", "force", "forth", "forty", "forum", "found", "frame", "frank",
+    "fraud", "fresh", "front", "fruit", "fully", "funny", "giant", "given", "glass", "globe",
+    "going", "grace", "grade", "grand", "grant", "grass", "great", "green", "gross", "group",
+    "grown", "guard", "guess", "guest", "guide", "happy", "harry", "heart", "heavy", "hence",
+    "henry", "horse", "hotel", "house", "human", "ideal", "image", "imply", "index", "inner",
+    "input", "issue", "japan", "jimmy", "joint", "jones", "judge", "known", "label", "large",
+    "laser", "later", "laugh", "layer", "learn", "lease", "least", "leave", "legal", "lemon",
+    "level", "lewis", "light", "limit", "links", "lives", "local", "logic", "loose", "lower",
+    "lucky", "lunch", "lying", "magic", "major", "maker", "march", "maria", "match", "maybe",
+    "mayor", "meant", "media", "metal", "might", "minor", "minus", "mixed", "model", "money",
+    "month", "moral", "motor", "mount", "mouse", "mouth", "movie", "music", "needs", "never",
+    "newly", "night", "noise", "north", "noted", "novel", "nurse", "occur", "ocean", "offer",
+    "often", "order", "other", "ought", "paint", "panel", "paper", "party", "peace", "peter",
+    "phase", "phone", "photo", "piece", "pilot", "pitch", "place", "plain", "plane", "plant",
+    "plate", "point", "pound", "power", "press", "price", "pride", "prime", "print", "prior",
+    "prize", "proof", "proud", "prove", "queen", "quick", "quiet", "quite", "radio", "raise",
+    "range", "rapid", "ratio", "reach", "ready", "refer", "right", "rival", "river", "robin",
+    "roger", "roman", "rough", "round", "route", "royal", "rural", "scale", "scene", "scope",
+    "score", "sense", "serve", "seven", "shall", "shape", "share", "sharp", "sheet", "shelf",
+    "shell", "shift", "shine", "shirt", "shock", "shoot", "short", "shown", "sight", "since",
+    "sixth", "sixty", "sized", "skill", "sleep", "slide", "small", "smart", "smile", "smith",
+    "smoke", "solid", "solve", "sorry", "sound", "south", "space", "spare", "speak", "speed",
+    "spend", "spent", "split", "spoke", "sport", "staff", "stage", "stake", "stand", "start",
+    "state", "steam", "steel", "stick", "still", "stock", "stone", "stood", "store", "storm",
+    "story", "strip", "stuck", "study", "stuff", "style", "sugar", "suite", "super", "sweet",
+    "table", "taken", "taste", "taxes", "teach", "terry", "texas", "thank", "theft", "their",
+    "theme", "there", "these", "thick", "thing", "think", "third", "those", "three", "threw",
+    "throw", "tight", "times", "tired", "title", "today", "topic", "total", "touch", "tough",
+    "tower", "track", "trade", "train", "treat", "trend", "trial", "tribe", "trick", "tried",
+    "tries", "truck", "truly", "trust", "truth", "twice", "under", "undue", "union", "unity",
+    "until", "upper", "upset", "urban", "usage", "usual", "valid", "value", "video", "virus",
+    "visit", "vital", "vocal", "voice", "waste", "watch", "water", "wheel", "where", "which",
+    "while", "white", "whole", "whose", "woman", "women", "world", "worry", "worse", "worst",
+    "worth", "would", "wound", "write", "wrong", "wrote", "yield", "young", "youth"
+]
+
+# One submitted row: the word and its tile result
+Guess = namedtuple('Guess', 'word result')
+
+
+def score_guess(guess, target):
+    """Tile result of ``guess`` against ``target``: 'correct', 'present' or 'absent' per letter"""
+    result = ['absent'] * len(target)
+    target_letters = list(target)
+
+    # First pass: mark correct letters
+    for i in range(len(target)):
+        if guess[i] == target[i]:
+            result[i] = 'correct'
+            target_letters[i] = None
+
+    # Second pass: mark present letters
+    for i in range(len(target)):
+        if result[i] == 'absent' and guess[i] in target_letters:
+            result[i] = 'present'
+            target_letters[target_letters.index(guess[i])] = None
+
+    return result
+
+
+class WordleEngine:
+    """Wordle rules with no display or clock attached
+
+    ``step`` accepts a single letter, 'ENTER', 'BACKSPACE', or a whole
+    five-letter word, which is typed and submitted in one go.
+    """
+
+    MAX_GUESSES = 6
+    WORD_LENGTH = 5
+    CONFIG = ()
+
+    def __init__(self, word_list=WORD_LIST, seed=None, rng=None):
+        self.word_list = list(word_list)
+        self.words = frozenset(word_list)
+        self.rng = rng if rng is not None else random.Random(seed)
+
+        # Input recording and gameplay event hooks, set by gamekit.replay and gamekit.events
+        self.recorder = None
+        self.events = None
+
+        self.reset()
+
+    def reset(self, seed=None):
+        """Start a new round, reseeding the RNG if a seed is given"""
+        if seed is not None:
+            self.rng.seed(seed)
+        if self.recorder is not None:
+            self.recorder.record_reset(self)
+        if self.events is not None:
+            self.events.emit('round_started')
+
+        self.target_word = self.rng.choice(self.word_list).upper()
+        self.current_guess = ""
+        self.guesses = []
+        self.current_row = 0
+        self.keyboard_state = {}  # Track key colors
+        self.done = False
+        self.won = False
+        return self
+
+    def step(self, action):
+        """Apply one key press or whole-word guess; returns 1 on a win"""
+        self.apply(action)
+        return 1 if self.won else 0
+
+    def apply(self, action):
+        """Apply one key press or whole-word guess
+
+        'ENTER' and whole words return the result of ``submit_guess``.
+        """
+        if self.recorder is not None:
+            self.recorder.record('apply', action)
+        if self.done:
+            return None
+
+        if action == 'ENTER':
+            return self.submit_guess()
+        if action == 'BACKSPACE':
+            self.delete_letter()
+        elif len(action) == 1:
+            self.add_letter(action.upper())
+        else:
+            self.current_guess = action.upper()
+            return self.submit_guess()
+        return None
+
+    def add_letter(self, letter):
+        """Add letter to current guess"""
+        if self.done:
+            return
+        if len(self.current_guess) < self.WORD_LENGTH:
+            self.current_guess += letter
+        else:
+            # Replace last letter if at word limit (hidden rule)
+            self.current_guess = self.current_guess[:-1] + letter
+
+    def delete_letter(self):
+        """Delete last letter from current guess"""
+        if len(self.current_guess) > 0 and not self.done:
+            self.current_guess = self.current_guess[:-1]
+
+    def is_valid_guess(self, guess):
+        """Check a guess has the right length and is in the word list"""
+        return len(guess) == self.WORD_LENGTH and guess.lower() in self.words
+
+    def submit_guess(self):
+        """Submit current guess; returns the tile result, or None if the guess is invalid"""
+        if self.done or not self.is_valid_guess(self.current_guess):
+            return None
+
+        # Check guess
+        result = self.check_guess(self.current_guess)
+        self.guesses.append(Guess(self.current_guess, result))
+
+        # Update keyboard state
+        for i, letter in enumerate(self.current_guess):
+            color = result[i]
+            if letter not in self.keyboard_state:
+                self.keyboard_state[letter] = color
+            elif color == 'correct':
+                self.keyboard_state[letter] = color
+            elif color == 'present' and self.keyboard_state[letter] != 'correct':
+                self.keyboard_state[letter] = color
+            elif color == 'absent' and self.keyboard_state[letter] not in ['correct', 'present']:
+                self.keyboard_state[letter] = color
+
+        if self.events is not None:
+            self.events.emit(
+                'guess_submitted', guess=self.current_guess, row=self.current_row,
+                correct=result.count('correct'), present=result.count('present')
+            )
+
+        # Check win/loss
+        if self.current_guess == self.target_word:
+            self.done = True
+            self.won = True
+        elif self.current_row >= self.MAX_GUESSES - 1:
+            self.done = True
+        if self.done and self.events is not None:
+            self.events.emit('won' if self.won else 'lost', guesses=len(self.guesses), word=self.target_word)
+        if not self.done:
+            self.current_row += 1
+            self.current_guess = ""
+
+        return result
+
+    def check_guess(self, guess):
+        """Check guess against target word"""
+        return score_guess(guess, self.target_word)
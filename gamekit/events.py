@@ -0,0 +1,234 @@
+"""Gameplay event bus with a batched background log writer
+
+Engines report what happens in a round (a piece locked, food eaten, a
+block broken, a cell revealed, a guess submitted, an upgrade bought, ...)
+through their ``events`` hook with ``emit(kind, **fields)``. Emitting
+only stamps the event and appends it to an in-memory batch; full or
+stale batches are handed to a background thread that encodes them and
+appends them to the log, so the Tk thread never waits on a file.
+
+Setting GAMEKIT_EVENTS to a directory logs every session there.
+GAMEKIT_EVENTS_FORMAT picks ``jsonl`` (one JSON object per line) or the
+default ``bin``: length-prefixed zlib blocks of JSON lines, one per
+batch, which keeps soak-run logs small. ``python -m gamekit.events FILE``
+summarizes a log of either kind or converts it to JSON lines.
+"""
+
+import argparse
+import atexit
+import json
+import os
+import queue
+import struct
+import sys
+import threading
+import time
+import zlib
+from collections import Counter
+
+FORMAT_VERSION = 1
+
+# File extension per log format
+EXTENSIONS = {'bin': '.evlog', 'jsonl': '.jsonl'}
+
+_BLOCK_HEADER = struct.Struct('<I')
+
+
+def event_log(name, engine):
+    """Log ``engine``'s events if GAMEKIT_EVENTS names a directory; returns the bus or None"""
+    directory = os.environ.get("GAMEKIT_EVENTS")
+    if not directory:
+        return None
+    fmt = os.environ.get("GAMEKIT_EVENTS_FORMAT", "bin")
+    if fmt not in EXTENSIONS:
+        raise ValueError(f"GAMEKIT_EVENTS_FORMAT must be one of {', '.join(EXTENSIONS)}, not {fmt!r}")
+    os.makedirs(directory, exist_ok=True)
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    path = os.path.join(directory, f"{name.replace(' ', '_')}-{stamp}{EXTENSIONS[fmt]}")
+
+    bus = EventBus(name, LogWriter(path, fmt))
+    engine.events = bus
+    atexit.register(bus.close)
+    return bus
+
+
+class EventBus:
+    """Stamps events, passes them to listeners and batches them for a writer
+
+    Events are ``(ms since the bus started, kind, fields)`` tuples; ``t``
+    and ``event`` are the log's own keys and cannot be field names. A batch
+    goes to the writer once it holds ``BATCH_SIZE`` events or its oldest
+    event is ``BATCH_SECONDS`` old. Emitting checks the age, and
+    ``attach`` adds a scheduler task that checks it while no events come.
+    """
+
+    BATCH_SIZE = 256
+    BATCH_SECONDS = 1.0
+
+    def __init__(self, name, writer=None):
+        self.name = name
+        self.writer = writer
+        self.listeners = []
+        self.counts = Counter()
+
+        self.start = time.perf_counter()
+        self.batch = []
+        self.batch_start = self.start
+
+        self.emit('session', game=name, version=FORMAT_VERSION)
+
+    def subscribe(self, callback):
+        """Call ``callback(event)`` on the emitting thread for every event"""
+        self.listeners.append(callback)
+
+    def emit(self, kind, **fields):
+        if 't' in fields or 'event' in fields:
+            raise ValueError(f"{kind!r} event: 't' and 'event' are reserved field names")
+        now = time.perf_counter()
+        event = (round((now - self.start) * 1000, 1), kind, fields)
+        self.counts[kind] += 1
+        for listener in self.listeners:
+            listener(event)
+
+        if self.writer is None:
+            return
+        if not self.batch:
+            self.batch_start = now
+        self.batch.append(event)
+        if len(self.batch) >= self.BATCH_SIZE or now - self.batch_start >= self.BATCH_SECONDS:
+            self.flush()
+
+    def attach(self, scheduler):
+        """Flush stale batches from a persistent ``scheduler`` task"""
+        scheduler.every("events", self.BATCH_SECONDS * 1000, self.flush_stale, persistent=True)
+
+    def flush_stale(self):
+        if self.batch and time.perf_counter() - self.batch_start >= self.BATCH_SECONDS:
+            self.flush()
+
+    def flush(self):
+        """Hand the current batch to the writer"""
+        if self.batch and self.writer is not None:
+            self.writer.submit(self.batch)
+            self.batch = []
+
+    def close(self):
+        """Flush and wait for the writer to finish the file"""
+        self.flush()
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None  # Later events are still counted, but not logged
+        atexit.unregister(self.close)
+
+
+class LogWriter:
+    """Background thread appending event batches to one log file
+
+    ``submit`` never blocks: when the writer falls ``MAX_PENDING`` batches
+    behind, further batches are dropped and counted in ``dropped``. The
+    next batch that gets through starts with a 'dropped' event giving the
+    number lost since the last one, so the log always accounts for them.
+    """
+
+    MAX_PENDING = 64
+
+    def __init__(self, path, fmt='bin'):
+        self.path = path
+        self.fmt = fmt
+        self.queue = queue.Queue(self.MAX_PENDING)
+        self.dropped = 0
+        self.unreported = 0  # Dropped events no 'dropped' marker has counted yet
+        self.last_t = 0.0
+        self.file = open(path, 'wb')
+        self.thread = threading.Thread(target=self.run, name=f"events:{os.path.basename(path)}", daemon=True)
+        self.thread.start()
+
+    def submit(self, batch):
+        count = len(batch)
+        self.last_t = batch[-1][0]
+        if self.unreported:
+            batch = [(batch[0][0], 'dropped', {'events': self.unreported})] + batch
+        try:
+            self.queue.put_nowait(batch)
+        except queue.Full:
+            # The marker was not written either, so its count carries over
+            self.dropped += count
+            self.unreported += count
+            return
+        self.unreported = 0
+
+    def run(self):
+        while True:
+            batch = self.queue.get()
+            if batch is None:
+                break
+            self.file.write(self.encode(batch))
+            self.file.flush()
+        self.file.close()
+
+    def encode(self, batch):
+        lines = b"".join(
+            json.dumps({'t': t, 'event': kind, **fields}, separators=(',', ':')).encode() + b"\n"
+            for t, kind, fields in batch
+        )
+        if self.fmt == 'jsonl':
+            return lines
+        block = zlib.compress(lines)
+        return _BLOCK_HEADER.pack(len(block)) + block
+
+    def close(self):
+        if not self.thread.is_alive():
+            return
+        if self.unreported:
+            # The writer is draining the queue, so this waits for room instead of dropping
+            self.queue.put([(self.last_t, 'dropped', {'events': self.unreported})])
+            self.unreported = 0
+        self.queue.put(None)
+        self.thread.join(timeout=5)
+
+
+def read_events(path):
+    """Yield the events of a log as dicts, whichever format it was written in"""
+    with open(path, 'rb') as f:
+        if path.endswith(EXTENSIONS['jsonl']):
+            for line in f:
+                yield json.loads(line)
+            return
+        while True:
+            header = f.read(_BLOCK_HEADER.size)
+            if len(header) < _BLOCK_HEADER.size:
+                return
+            (size,) = _BLOCK_HEADER.unpack(header)
+            for line in zlib.decompress(f.read(size)).splitlines():
+                yield json.loads(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m gamekit.events",
+                                     description="Summarize a gameplay event log")
+    parser.add_argument('log')
+    parser.add_argument('--jsonl', action='store_true', help="print every event as a JSON line instead")
+    args = parser.parse_args(argv)
+
+    counts = Counter()
+    last = 0.0
+    for event in read_events(args.log):
+        if args.jsonl:
+            print(json.dumps(event))
+            continue
+        counts[event['event']] += 1
+        last = max(last, event['t'])
+    if args.jsonl:
+        return 0
+
+    seconds = last / 1000
+    total = sum(counts.values())
+    print(f"{args.log}: {total} events over {seconds:.1f} s")
+    for kind, count in counts.most_common():
+        rate = count / seconds if seconds else 0.0
+        print(f"  {kind:<20} {count:>8}  {rate:8.2f}/s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""Background throttling for game windows
+
+An IdleManager watches its window's ``<Map>``/``<Unmap>`` and focus
+events and slows the window's FrameScheduler down while nobody is
+looking at it:
+
+* hidden (minimized): only the game's background tasks, such as cookie
+  income or the Minesweeper clock, keep running, on a slow frame, and
+  nothing is drawn;
+* unfocused, or sitting on a menu with no input for a while: game logic
+  keeps its full rate, while cosmetic loops (menu bobbing, title and
+  cookie animations) run at most once per slower frame.
+
+Any input or regaining focus brings the window straight back.
+"""
+
+import time
+import tkinter as tk
+
+ACTIVE = "active"
+BACKGROUND = "background"
+HIDDEN = "hidden"
+
+
+class IdleManager:
+    """Throttles one game's scheduler while its window is in the background"""
+
+    HIDDEN_FRAME_MS = 250
+    BACKGROUND_FRAME_MS = 100
+    MENU_IDLE_SECONDS = 30
+    CHECK_MS = 500
+
+    def __init__(self, game, logic=("game",), background=(), in_round=None):
+        self.game = game
+        self.scheduler = game.scheduler
+        self.window = game.root.winfo_toplevel()
+
+        # Task names: game logic keeps its rate while unfocused, background
+        # tasks keep running while hidden
+        self.logic = tuple(logic)
+        self.background = tuple(background)
+
+        # Games without a logic loop say whether a round is on themselves
+        self.in_round = in_round
+
+        self.state = ACTIVE
+        self.mapped = True
+        self.last_input = time.perf_counter()
+
+        root = game.root
+        root.bind("<Map>", self.on_map, add="+")
+        root.bind("<Unmap>", self.on_map, add="+")
+        root.bind("<FocusIn>", self.on_focus, add="+")
+        root.bind("<FocusOut>", self.on_focus, add="+")
+        for sequence in ("<KeyPress>", "<ButtonPress>", "<Motion>"):
+            root.bind(sequence, self.on_input, add="+")
+
+        # Focus changes and menu timeouts are also picked up by polling
+        self.scheduler.every("idle", self.CHECK_MS, self.update, persistent=True)
+
+    def on_map(self, event):
+        # Child widgets' map events reach the window's bindings too
+        if event.widget is self.window:
+            self.mapped = event.type == tk.EventType.Map
+            self.update()
+
+    def on_focus(self, event):
+        self.update()
+
+    def on_input(self, event):
+        self.last_input = time.perf_counter()
+        if self.state != ACTIVE:
+            self.update()
+
+    def focused(self):
+        """Whether this application has the keyboard focus"""
+        try:
+            return self.window.focus_displayof() is not None
+        except (KeyError, tk.TclError):
+            # Focus on a widget Tkinter did not create, e.g. a popup
+            return True
+
+    def on_menu(self):
+        """True when no round is being played"""
+        if self.in_round is not None:
+            return not self.in_round()
+        return not any(self.scheduler.is_active(name) for name in self.logic)
+
+    def update(self):
+        """Work out the window's state and throttle the scheduler to match"""
+        if not self.mapped:
+            state = HIDDEN
+        elif not self.focused():
+            state = BACKGROUND
+        elif self.on_menu() and time.perf_counter() - self.last_input > self.MENU_IDLE_SECONDS:
+            state = BACKGROUND
+        else:
+            state = ACTIVE
+        self.state = state
+
+        scheduler = self.scheduler
+        if state == ACTIVE:
+            scheduler.unthrottle()
+        elif state == HIDDEN:
+            scheduler.throttle(
+                self.HIDDEN_FRAME_MS, keep=self.background + ("idle",), other_steps=0, render=False
+            )
+        else:
+            scheduler.throttle(self.background_frame_ms(), keep=self.logic + self.background + ("idle",))
+
+    def background_frame_ms(self):
+        """The slow frame rate, unless running game logic needs more"""
+        frame_ms = self.BACKGROUND_FRAME_MS
+        for name in self.logic:
+            task = self.scheduler.tasks.get(name)
+            if task is not None and task.interval * 1000 < frame_ms:
+                frame_ms = self.scheduler.base_frame_interval * 1000
+        return frame_ms
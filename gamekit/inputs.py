@@ -0,0 +1,71 @@
+"""Per-frame input buffering for a Tk window
+
+Tk calls a handler for every event as it arrives, so a fast mouse or a
+held key can run handlers several times between two display frames. An
+InputBuffer binds those sequences instead: it queues each raw event with
+the time it arrived and hands the queue to the handlers at the start of
+the next frame, before any task runs.
+
+Consecutive events bound under the same ``key`` collapse into the last
+one of their run (the pointer position, a held key's autorepeat, whether
+a key is down), and unkeyed events such as typed letters are all
+delivered. Everything is delivered in arrival order, so UP, LEFT, UP in
+one frame reaches the game as UP, LEFT, UP.
+Handlers only update state and call ``scheduler.invalidate()``; the
+frame's render callback then draws once.
+
+While the engine is being recorded, inputs are logged at the time they
+arrived rather than the time the frame got to them.
+"""
+
+import time
+
+
+class InputBuffer:
+    """Queues one window's input events and delivers them once per frame"""
+
+    def __init__(self, game):
+        self.game = game
+        self.scheduler = game.scheduler
+
+        # [key, arrival time, handler, event], in order of arrival
+        self.pending = []
+
+        # Totals for the instrumentation overlay
+        self.received = 0
+        self.delivered = 0
+
+        self.scheduler.set_input(self.flush)
+
+    def bind(self, widget, sequence, handler, key=None):
+        """Buffer ``widget``'s ``sequence`` events for ``handler``
+
+        A run of events sharing a ``key`` coalesces to its latest event;
+        with no key every event is delivered.
+        """
+        widget.bind(sequence, lambda event: self.push(key, handler, event))
+
+    def push(self, key, handler, event):
+        self.received += 1
+        entry = [key, time.perf_counter(), handler, event]
+        pending = self.pending
+        if key is not None and pending and pending[-1][0] == key:
+            pending[-1] = entry
+        else:
+            pending.append(entry)
+
+    def flush(self):
+        """Run the handlers for this frame's events; called by the scheduler"""
+        if not self.pending:
+            return
+        pending = self.pending
+        self.pending = []
+
+        for _, stamp, handler, event in pending:
+            self.delivered += 1
+            recorder = self.game.engine.recorder
+            if recorder is None:
+                handler(event)
+            else:
+                with recorder.stamped(stamp):
+                    handler(event)
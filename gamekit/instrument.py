@@ -0,0 +1,217 @@
+"""Opt-in frame timing overlay and export
+
+Every game creates an Instrument for its window. F3 toggles an overlay
+with p50/p95/p99 frame times, the average time spent in each phase,
+live canvas items and pending ``after`` callbacks. F4 toggles streaming
+every frame sample to a CSV file (JSON lines if the path ends in
+``.json`` or ``.jsonl``). The path defaults to ``<game>_frames.csv`` and
+can be set with the GAMEKIT_STATS environment variable. While both are
+off, no phase is timed. F5 starts and stops a CPU and allocation capture
+(see ``gamekit.profiler``).
+"""
+
+import csv
+import json
+import math
+import os
+import tkinter as tk
+from collections import deque
+
+from gamekit.phases import PhaseTimer, no_phase
+from gamekit.profiler import Profiler
+from gamekit.resources import font
+
+SAMPLE_FIELDS = ("frame", "time", "interval_ms", "frame_ms", "items", "after")
+
+
+def percentile(values, q):
+    """Nearest-rank percentile of an already sorted list"""
+    if not values:
+        return 0.0
+    rank = math.ceil(q / 100 * len(values))
+    return values[min(len(values), max(rank, 1)) - 1]
+
+
+class Instrument:
+    """Collects per-frame timings for one game window"""
+
+    REFRESH_SECONDS = 0.25
+    FLUSH_EVERY = 60
+
+    def __init__(self, game, name, phases=("update", "collision", "draw"), window=300, export_path=None):
+        self.game = game
+        self.name = name
+        self.phases = tuple(phases)
+        self.samples = deque(maxlen=window)
+        self.timer = PhaseTimer()
+        self.phase = no_phase
+
+        if export_path is None:
+            export_path = os.environ.get("GAMEKIT_STATS") or name.replace(" ", "_") + "_frames.csv"
+        self.export_path = export_path
+        self.export_file = None
+        self.writer = None
+        self.unflushed = 0
+
+        self.overlay = None
+        self.overlay_visible = False
+        self.last_frame = None
+        self.last_refresh = 0.0
+
+        game.root.bind("<F3>", self.toggle_overlay, add="+")
+        game.root.bind("<F4>", self.toggle_export, add="+")
+        game.scheduler.observer = self
+
+        self.profiler = Profiler(game, name)
+
+    @property
+    def active(self):
+        return self.overlay_visible or self.export_file is not None
+
+    def toggle_overlay(self, event=None):
+        """Show or hide the overlay"""
+        self.overlay_visible = not self.overlay_visible
+        if not self.overlay_visible and self.overlay is not None:
+            self.overlay.place_forget()
+        self.update_hooks()
+
+    def toggle_export(self, event=None):
+        """Start or stop streaming samples to the export file"""
+        if self.export_file is None:
+            self.start_export()
+        else:
+            self.stop_export()
+
+    def start_export(self):
+        self.export_file = open(self.export_path, "w", newline="")
+        if self.export_path.endswith((".json", ".jsonl")):
+            self.writer = None
+        else:
+            fields = SAMPLE_FIELDS + tuple(name + "_ms" for name in self.phases)
+            self.writer = csv.DictWriter(self.export_file, fields, restval=0, extrasaction="ignore")
+            self.writer.writeheader()
+        self.update_hooks()
+
+    def stop_export(self):
+        if self.export_file is not None:
+            self.export_file.close()
+        self.export_file = None
+        self.writer = None
+        self.update_hooks()
+
+    def update_hooks(self):
+        """Swap the phase hooks of the game, its engine and scheduler on or off"""
+        phase = self.timer if self.active else no_phase
+        self.phase = phase
+        self.game.scheduler.phase = phase
+        engine = getattr(self.game, "engine", None)
+        if engine is not None and hasattr(engine, "phase"):
+            engine.phase = phase
+
+        self.timer.collect()
+        self.last_frame = None
+
+    def frame_done(self, start, end):
+        """Record one frame; called by the scheduler after rendering"""
+        if not self.active:
+            return
+
+        interval = (start - self.last_frame) * 1000 if self.last_frame is not None else 0.0
+        self.last_frame = start
+
+        sample = {
+            "frame": self.game.scheduler.frame_count,
+            "time": round(end, 4),
+            "interval_ms": interval,
+            "frame_ms": (end - start) * 1000,
+            "items": self.count_items(),
+            "after": self.count_after(),
+        }
+        for name, total in self.timer.collect().items():
+            sample[name + "_ms"] = total
+        self.samples.append(sample)
+
+        if self.export_file is not None:
+            self.write_sample(sample)
+        if self.overlay_visible and end - self.last_refresh >= self.REFRESH_SECONDS:
+            self.last_refresh = end
+            self.draw_overlay()
+
+    def write_sample(self, sample):
+        if self.writer is not None:
+            self.writer.writerow(sample)
+        else:
+            self.export_file.write(json.dumps(sample) + "\n")
+
+        self.unflushed += 1
+        if self.unflushed >= self.FLUSH_EVERY:
+            self.export_file.flush()
+            self.unflushed = 0
+
+    def count_items(self):
+        """Number of items on the game canvas, or 0 if there is none"""
+        canvas = getattr(self.game, "canvas", None)
+        if canvas is None:
+            return 0
+        try:
+            return len(canvas.find_all())
+        except tk.TclError:
+            return 0
+
+    def count_after(self):
+        """Number of pending ``after`` callbacks in the interpreter"""
+        return len(self.game.root.tk.splitlist(self.game.root.tk.call("after", "info")))
+
+    def summary(self):
+        """Percentiles and phase averages over the current sample window"""
+        samples = self.samples
+        frame_times = sorted(sample["frame_ms"] for sample in samples)
+        intervals = [sample["interval_ms"] for sample in samples if sample["interval_ms"]]
+
+        phases = {}
+        for sample in samples:
+            for key, value in sample.items():
+                if key.endswith("_ms") and key not in ("interval_ms", "frame_ms"):
+                    phases[key[:-3]] = phases.get(key[:-3], 0.0) + value
+
+        return {
+            "fps": 1000 * len(intervals) / sum(intervals) if intervals else 0.0,
+            "p50": percentile(frame_times, 50),
+            "p95": percentile(frame_times, 95),
+            "p99": percentile(frame_times, 99),
+            "phases": {name: total / len(samples) for name, total in phases.items()},
+        }
+
+    def overlay_text(self):
+        if not self.samples:
+            return f"{self.name}: collecting..."
+
+        stats = self.summary()
+        last = self.samples[-1]
+        phases = "  ".join(f"{name} {avg:.2f}" for name, avg in stats["phases"].items())
+        export = self.export_path if self.export_file is not None else "off"
+        inputs = getattr(self.game, "inputs", None)
+        delivered = f"  input {inputs.delivered}/{inputs.received}" if inputs is not None else ""
+        return "\n".join([
+            f"{self.name}  {stats['fps']:.1f} fps",
+            f"frame ms  p50 {stats['p50']:.2f}  p95 {stats['p95']:.2f}  p99 {stats['p99']:.2f}",
+            f"phase ms  {phases or '-'}",
+            f"items {last['items']}  after {last['after']}  timers {len(self.game.scheduler.live())}{delivered}",
+            f"F4 export: {export}",
+            self.profiler.status(),
+        ])
+
+    def draw_overlay(self):
+        # Screens that clear the window destroy the label along with everything else
+        if self.overlay is None or not self.overlay.winfo_exists():
+            self.overlay = tk.Label(
+                self.game.root,
+                font=font("Courier", 9),
+                bg="#000000",
+                fg="#00ff41",
+                justify="left",
+                anchor="nw"
+            )
+        self.overlay.config(text=self.overlay_text())
+        self.overlay.place(x=4, y=4)
+        self.overlay.lift()
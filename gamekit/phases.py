@@ -0,0 +1,51 @@
+"""Named phase timing hooks
+
+Engines, the frame scheduler and the games wrap the parts of a frame in
+``with self.phase("update"):`` blocks. By default ``phase`` is
+``no_phase``, which does nothing; the instrumentation swaps in a
+PhaseTimer while it is collecting samples.
+"""
+
+import time
+from contextlib import nullcontext
+
+_IDLE = nullcontext()
+
+
+def no_phase(name):
+    """Phase hook used when nothing is measuring"""
+    return _IDLE
+
+
+class _Phase:
+    __slots__ = ('totals', 'name', 'start')
+
+    def __init__(self, totals, name):
+        self.totals = totals
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = (time.perf_counter() - self.start) * 1000
+        self.totals[self.name] = self.totals.get(self.name, 0.0) + elapsed
+        return False
+
+
+class PhaseTimer:
+    """Phase hook that adds up milliseconds per phase name until collected"""
+
+    def __init__(self):
+        self.totals = {}
+
+    def __call__(self, name):
+        return _Phase(self.totals, name)
+
+    def collect(self):
+        """Return the totals since the last collect and start over"""
+        totals = self.totals
+        self.totals = {}
+        return totals
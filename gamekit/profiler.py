@@ -0,0 +1,141 @@
+"""On-demand CPU and allocation capture for a running game
+
+F5 starts a capture in the focused game window and F5 again stops it.
+While capturing, a cProfile profiler is enabled around every scheduler
+frame (input handlers, every task such as ``game_loop`` or ``animate``,
+and the render callback), and tracemalloc traces allocations from a
+snapshot taken at the start.
+
+Stopping writes, under GAMEKIT_PROFILE (default ``<game>_profile``):
+
+    <game>-<time>-cpu.txt    functions sorted by cumulative and by own time
+    <game>-<time>-cpu.prof   raw pstats data, for snakeviz or pstats
+    <game>-<time>-alloc.txt  allocation growth by line and by file since
+                             the start snapshot, and the traced peak
+
+Nothing is profiled or traced while no capture is running.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import time
+import tracemalloc
+
+TOP_FUNCTIONS = 40
+TOP_ALLOCATIONS = 30
+TRACEBACK_FRAMES = 10
+
+
+class Profiler:
+    """F5 capture of one game window's frames"""
+
+    def __init__(self, game, name, directory=None):
+        self.game = game
+        self.name = name
+        if directory is None:
+            directory = os.environ.get("GAMEKIT_PROFILE") or name.replace(" ", "_") + "_profile"
+        self.directory = directory
+
+        self.profile = None
+        self.snapshot = None
+        self.started = 0.0
+        self.start_frame = 0
+        self.owns_tracing = False
+        self.last_reports = []
+
+        game.root.bind("<F5>", self.toggle, add="+")
+
+    @property
+    def active(self):
+        return self.profile is not None
+
+    def toggle(self, event=None):
+        """Start or stop a capture"""
+        if self.profile is None:
+            self.start()
+        else:
+            self.stop()
+
+    def start(self):
+        # Leave tracing alone if it was started outside, e.g. by PYTHONTRACEMALLOC
+        self.owns_tracing = not tracemalloc.is_tracing()
+        if self.owns_tracing:
+            tracemalloc.start(TRACEBACK_FRAMES)
+        tracemalloc.reset_peak()
+        self.snapshot = tracemalloc.take_snapshot()
+
+        self.started = time.perf_counter()
+        self.start_frame = self.game.scheduler.frame_count
+        self.profile = cProfile.Profile()
+        self.game.scheduler.profiler = self.profile
+
+    def stop(self):
+        """End the capture and write its reports; returns their paths"""
+        if self.profile is None:
+            return []
+        self.game.scheduler.profiler = None
+        profile = self.profile
+        self.profile = None
+
+        seconds = time.perf_counter() - self.started
+        frames = self.game.scheduler.frame_count - self.start_frame
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        if self.owns_tracing:
+            tracemalloc.stop()
+
+        os.makedirs(self.directory, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        base = os.path.join(self.directory, f"{self.name.replace(' ', '_')}-{stamp}")
+        header = f"{self.name}: {frames} frames over {seconds:.1f} s\n"
+
+        profile.dump_stats(base + "-cpu.prof")
+        with open(base + "-cpu.txt", "w") as f:
+            f.write(header)
+            f.write(self.cpu_report(profile))
+        with open(base + "-alloc.txt", "w") as f:
+            f.write(header)
+            f.write(self.alloc_report(self.snapshot, snapshot, peak))
+        self.snapshot = None
+
+        self.last_reports = [base + "-cpu.txt", base + "-cpu.prof", base + "-alloc.txt"]
+        return self.last_reports
+
+    def cpu_report(self, profile):
+        profile.create_stats()
+        if not profile.stats:
+            return "\nNo frames ran during the capture\n"  # pstats refuses empty profiles
+        out = io.StringIO()
+        stats = pstats.Stats(profile, stream=out)
+        stats.strip_dirs()
+        for order in ("cumulative", "tottime"):
+            out.write(f"\n# By {order}\n")
+            stats.sort_stats(order).print_stats(TOP_FUNCTIONS)
+        return out.getvalue()
+
+    def alloc_report(self, before, after, peak):
+        # Only the game's own allocations, not the tracing machinery
+        filters = (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        )
+        before = before.filter_traces(filters)
+        after = after.filter_traces(filters)
+
+        lines = [f"traced peak {peak / 1024:.1f} KiB"]
+        for key in ("lineno", "filename"):
+            diffs = after.compare_to(before, key)
+            lines.append(f"\n# Growth by {key}")
+            lines.extend(str(diff) for diff in diffs[:TOP_ALLOCATIONS] if diff.size_diff or diff.count_diff)
+        return "\n".join(lines) + "\n"
+
+    def status(self):
+        """One line for the instrumentation overlay"""
+        if self.profile is not None:
+            return f"F5 profile: capturing {time.perf_counter() - self.started:.0f} s"
+        if self.last_reports:
+            return f"F5 profile: {self.last_reports[0]}"
+        return "F5 profile: off"
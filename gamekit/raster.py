@@ -0,0 +1,446 @@
+"""Off-screen software rendering into NumPy framebuffers
+
+RasterCanvas accepts the tk.Canvas item calls the games draw with
+(``create_rectangle``, ``create_oval``, ``create_polygon``, ``create_line``,
+``create_text``, ``coords``, ``itemconfig``, ``delete``, ``tag_lower``), so a
+game's own ``draw()`` can run against it through a RetainedCanvas with no
+display. ``render()`` paints the visible items, bottom to top, into an
+(height, width, 3) uint8 array. There is no font rasterizer: text is drawn
+as one solid box per character at the size of the font.
+
+``write_png`` and RawVideoWriter export frames without any imaging
+library. Needs NumPy.
+"""
+
+import struct
+import zlib
+
+try:
+    import numpy as np
+except ImportError:  # Only the off-screen renderer needs NumPy
+    np = None
+
+from gamekit.resources import parse
+
+# Colors Tk knows by name that the games use
+NAMED_COLORS = {
+    'black': '#000000',
+    'white': '#ffffff',
+    'red': '#ff0000',
+    'green': '#008000',
+    'blue': '#0000ff',
+    'yellow': '#ffff00',
+    'gray': '#bebebe',
+    'grey': '#bebebe',
+}
+
+# Defaults Tk uses for options an item was created without
+ITEM_DEFAULTS = {
+    'rectangle': {'fill': '', 'outline': 'black', 'width': 1},
+    'oval': {'fill': '', 'outline': 'black', 'width': 1},
+    'polygon': {'fill': 'black', 'outline': '', 'width': 1},
+    'line': {'fill': 'black', 'width': 1},
+    'text': {'fill': 'black', 'text': '', 'font': ('TkDefaultFont', 10), 'anchor': 'center'},
+}
+
+
+class _Item:
+    __slots__ = ('kind', 'coords', 'options', 'tags')
+
+    def __init__(self, kind, coords, options, tags):
+        self.kind = kind
+        self.coords = coords
+        self.options = options
+        self.tags = tags
+
+
+def font_size(font):
+    """Pixel size of a font given as a tuple or a tkinter Font"""
+    if isinstance(font, tuple):
+        size = font[1] if len(font) > 1 else 10
+    else:
+        size = font.cget('size')
+    # Tk reads positive sizes as points and negative ones as pixels
+    return -size if size < 0 else round(size * 4 / 3)
+
+
+def flatten(coords):
+    """Coordinates passed as (x0, y0, x1, y1) or ((x0, y0), (x1, y1))"""
+    if len(coords) == 1 and isinstance(coords[0], (list, tuple)):
+        coords = coords[0]
+    flat = []
+    for value in coords:
+        if isinstance(value, (list, tuple)):
+            flat.extend(value)
+        else:
+            flat.append(value)
+    return tuple(float(value) for value in flat)
+
+
+class RasterCanvas:
+    """tk.Canvas stand-in that renders its items into a NumPy array"""
+
+    def __init__(self, width, height, bg="#000000"):
+        if np is None:
+            raise RuntimeError("off-screen rendering needs NumPy")
+        self.width = int(width)
+        self.height = int(height)
+        self.bg = bg
+
+        self.items = {}  # id -> _Item
+        self.order = []  # ids, bottom to top
+        self.next_id = 1
+
+        self.frame = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        self.colors = {}
+
+        # Copying a filled frame is far cheaper than broadcasting the color
+        self.background = np.empty_like(self.frame)
+        self.background[:] = self.color(bg)
+
+        # Pixel centers, sliced per item for ovals and polygons
+        self.xs = np.arange(self.width, dtype=np.float32) + 0.5
+        self.ys = np.arange(self.height, dtype=np.float32)[:, None] + 0.5
+
+    # Item calls made by the games and RetainedCanvas
+
+    def _create(self, kind, coords, options):
+        tags = options.pop('tags', ())
+        if isinstance(tags, str):
+            tags = (tags,)
+        item = self.next_id
+        self.next_id += 1
+        self.items[item] = _Item(kind, flatten(coords), options, set(tags))
+        self.order.append(item)
+        return item
+
+    def create_rectangle(self, *coords, **options):
+        return self._create('rectangle', coords, options)
+
+    def create_oval(self, *coords, **options):
+        return self._create('oval', coords, options)
+
+    def create_polygon(self, *coords, **options):
+        return self._create('polygon', coords, options)
+
+    def create_line(self, *coords, **options):
+        return self._create('line', coords, options)
+
+    def create_text(self, *coords, **options):
+        return self._create('text', coords, options)
+
+    def find_withtag(self, tag):
+        if isinstance(tag, int):
+            return (tag,) if tag in self.items else ()
+        if tag == 'all':
+            return tuple(self.order)
+        return tuple(item for item in self.order if tag in self.items[item].tags)
+
+    def find_all(self):
+        return tuple(self.order)
+
+    def coords(self, tag, *coords):
+        items = self.find_withtag(tag)
+        if not coords:
+            return list(self.items[items[0]].coords) if items else []
+        for item in items:
+            self.items[item].coords = flatten(coords)
+
+    def itemconfig(self, tag, **options):
+        tags = options.pop('tags', None)
+        for item in self.find_withtag(tag):
+            self.items[item].options.update(options)
+            if tags is not None:
+                self.items[item].tags = {tags} if isinstance(tags, str) else set(tags)
+
+    itemconfigure = itemconfig
+
+    def move(self, tag, dx, dy):
+        for item in self.find_withtag(tag):
+            entry = self.items[item]
+            entry.coords = tuple(
+                value + (dx if i % 2 == 0 else dy) for i, value in enumerate(entry.coords)
+            )
+
+    def delete(self, *tags):
+        doomed = set()
+        for tag in tags:
+            doomed.update(self.find_withtag(tag))
+        if doomed:
+            for item in doomed:
+                del self.items[item]
+            self.order = [item for item in self.order if item not in doomed]
+
+    def tag_lower(self, tag, below=None):
+        self._restack(tag, below, above=False)
+
+    def tag_raise(self, tag, above=None):
+        self._restack(tag, above, above=True)
+
+    lower = tag_lower
+    lift = tag_raise
+
+    def _restack(self, tag, reference, above):
+        moving = self.find_withtag(tag)
+        if not moving:
+            return
+        moving_set = set(moving)
+        rest = [item for item in self.order if item not in moving_set]
+        if reference is None:
+            self.order = rest + list(moving) if above else list(moving) + rest
+            return
+        anchor = self.find_withtag(reference)
+        if not anchor:
+            return
+        index = rest.index(anchor[-1] if above else anchor[0])
+        index += 1 if above else 0
+        self.order = rest[:index] + list(moving) + rest[index:]
+
+    def bind(self, *args, **kwargs):
+        """Event bindings mean nothing off screen"""
+
+    def tag_bind(self, *args, **kwargs):
+        """Event bindings mean nothing off screen"""
+
+    # Rendering
+
+    def color(self, name):
+        """RGB array for a Tk color string, or None for '' (transparent)"""
+        rgb = self.colors.get(name)
+        if rgb is None and name not in self.colors:
+            if name:
+                value = NAMED_COLORS.get(name.lower(), name)
+                rgb = np.array(parse(value), dtype=np.uint8)
+            self.colors[name] = rgb
+        return rgb
+
+    def render(self):
+        """Paint every visible item into ``self.frame`` and return it"""
+        frame = self.frame
+        np.copyto(frame, self.background)
+        for item in self.order:
+            entry = self.items[item]
+            options = entry.options
+            if options.get('state') == 'hidden':
+                continue
+            defaults = ITEM_DEFAULTS[entry.kind]
+            getattr(self, '_paint_' + entry.kind)(entry.coords, options, defaults)
+        return frame
+
+    def _option(self, options, defaults, name):
+        value = options.get(name)
+        return defaults.get(name) if value is None else value
+
+    def _clip(self, x0, y0, x1, y1):
+        """Integer pixel box covering [x0, x1) x [y0, y1), clipped to the frame"""
+        return (
+            max(0, int(round(min(x0, x1)))),
+            max(0, int(round(min(y0, y1)))),
+            min(self.width, int(round(max(x0, x1)))),
+            min(self.height, int(round(max(y0, y1)))),
+        )
+
+    def _paint_rectangle(self, coords, options, defaults):
+        x0, y0, x1, y1 = self._clip(*coords[:4])
+        if x0 >= x1 or y0 >= y1:
+            return
+        fill = self.color(self._option(options, defaults, 'fill'))
+        if fill is not None:
+            self.frame[y0:y1, x0:x1] = fill
+
+        outline = self.color(self._option(options, defaults, 'outline'))
+        width = int(round(float(self._option(options, defaults, 'width'))))
+        if outline is not None and width > 0:
+            frame = self.frame
+            frame[y0:min(y1, y0 + width), x0:x1] = outline
+            frame[max(y0, y1 - width):y1, x0:x1] = outline
+            frame[y0:y1, x0:min(x1, x0 + width)] = outline
+            frame[y0:y1, max(x0, x1 - width):x1] = outline
+
+    def _paint_oval(self, coords, options, defaults):
+        left, top, right, bottom = coords[:4]
+        x0, y0, x1, y1 = self._clip(left, top, right, bottom)
+        if x0 >= x1 or y0 >= y1:
+            return
+        cx, cy = (left + right) / 2, (top + bottom) / 2
+        rx, ry = max(abs(right - left) / 2, 0.5), max(abs(bottom - top) / 2, 0.5)
+        dx = (self.xs[x0:x1] - cx) / rx
+        dy = (self.ys[y0:y1] - cy) / ry
+        distance = dx * dx + dy * dy
+        region = self.frame[y0:y1, x0:x1]
+
+        fill = self.color(self._option(options, defaults, 'fill'))
+        if fill is not None:
+            region[distance <= 1.0] = fill
+
+        outline = self.color(self._option(options, defaults, 'outline'))
+        width = float(self._option(options, defaults, 'width'))
+        if outline is not None and width > 0:
+            inner_x, inner_y = max(rx - width, 0.0), max(ry - width, 0.0)
+            if inner_x and inner_y:
+                inner = ((self.xs[x0:x1] - cx) / inner_x) ** 2 + ((self.ys[y0:y1] - cy) / inner_y) ** 2
+                region[(distance <= 1.0) & (inner > 1.0)] = outline
+            else:
+                region[distance <= 1.0] = outline
+
+    def _paint_polygon(self, coords, options, defaults):
+        points = list(zip(coords[0::2], coords[1::2]))
+        if len(points) < 3:
+            return
+        xs = [x for x, _ in points]
+        ys = [y for _, y in points]
+        x0, y0, x1, y1 = self._clip(min(xs), min(ys), max(xs), max(ys))
+        if x0 >= x1 or y0 >= y1:
+            return
+        px = self.xs[x0:x1]
+        py = self.ys[y0:y1]
+
+        # Even-odd rule over every edge at once for the bounding box
+        inside = np.zeros((y1 - y0, x1 - x0), dtype=bool)
+        for (ax, ay), (bx, by) in zip(points, points[1:] + points[:1]):
+            if ay == by:
+                continue
+            crosses = (ay > py) != (by > py)
+            x_at = ax + (py - ay) * (bx - ax) / (by - ay)
+            inside ^= crosses & (px < x_at)
+
+        fill = self.color(self._option(options, defaults, 'fill'))
+        if fill is not None:
+            self.frame[y0:y1, x0:x1][inside] = fill
+
+        outline = self.color(self._option(options, defaults, 'outline'))
+        if outline is not None:
+            width = self._option(options, defaults, 'width')
+            for start, end in zip(points, points[1:] + points[:1]):
+                self._stroke(start, end, outline, width)
+
+    def _paint_line(self, coords, options, defaults):
+        fill = self.color(self._option(options, defaults, 'fill'))
+        if fill is None:
+            return
+        width = self._option(options, defaults, 'width')
+        points = list(zip(coords[0::2], coords[1::2]))
+        for start, end in zip(points, points[1:]):
+            self._stroke(start, end, fill, width)
+
+    def _stroke(self, start, end, color, width):
+        (ax, ay), (bx, by) = start, end
+        width = max(1, int(round(float(width))))
+        half = width / 2
+
+        # Axis-aligned segments (grid lines, outlines) are plain slices
+        if ax == bx or ay == by:
+            x0, y0, x1, y1 = self._clip(min(ax, bx) - half, min(ay, by) - half,
+                                        max(ax, bx) + half, max(ay, by) + half)
+            if x0 < x1 and y0 < y1:
+                self.frame[y0:y1, x0:x1] = color
+            return
+
+        steps = int(max(abs(bx - ax), abs(by - ay))) + 1
+        t = np.linspace(0.0, 1.0, steps)
+        xs = np.rint(ax + (bx - ax) * t - half).astype(np.int64)
+        ys = np.rint(ay + (by - ay) * t - half).astype(np.int64)
+        for ox in range(width):
+            for oy in range(width):
+                x = xs + ox
+                y = ys + oy
+                keep = (x >= 0) & (x < self.width) & (y >= 0) & (y < self.height)
+                self.frame[y[keep], x[keep]] = color
+
+    def _paint_text(self, coords, options, defaults):
+        text = str(self._option(options, defaults, 'text'))
+        fill = self.color(self._option(options, defaults, 'fill'))
+        if not text or fill is None:
+            return
+
+        size = font_size(self._option(options, defaults, 'font'))
+        lines = text.split('\n')
+        advance = max(1, round(size * 0.6))
+        box_width = advance * max(len(line) for line in lines)
+        box_height = round(size * 1.2) * len(lines)
+
+        x, y = coords[:2]
+        anchor = self._option(options, defaults, 'anchor')
+        left = x - box_width / 2
+        top = y - box_height / 2
+        if 'w' in anchor:
+            left = x
+        elif 'e' in anchor:
+            left = x - box_width
+        if anchor.startswith('n'):
+            top = y
+        elif anchor.startswith('s'):
+            top = y - box_height
+
+        # One box per character, leaving gaps so words stay readable
+        glyph_height = max(1, round(size * 0.7))
+        for row, line in enumerate(lines):
+            line_top = top + row * round(size * 1.2) + (round(size * 1.2) - glyph_height) / 2
+            for column, char in enumerate(line):
+                if char.isspace():
+                    continue
+                char_left = left + column * advance
+                x0, y0, x1, y1 = self._clip(char_left + 1, line_top,
+                                            char_left + advance - 1, line_top + glyph_height)
+                if x0 < x1 and y0 < y1:
+                    self.frame[y0:y1, x0:x1] = fill
+
+
+def scale_down(frame, factor):
+    """Every ``factor``-th pixel of a frame, for thumbnails"""
+    if factor <= 1:
+        return frame
+    return np.ascontiguousarray(frame[::factor, ::factor])
+
+
+def png_bytes(frame, level=1):
+    """Encode an (h, w, 3) uint8 array as a PNG"""
+    height, width, _ = frame.shape
+    rows = np.empty((height, width * 3 + 1), dtype=np.uint8)
+    rows[:, 0] = 0  # Filter type None on every row
+    rows[:, 1:] = frame.reshape(height, width * 3)
+
+    def chunk(kind, data):
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return b"".join((
+        b"\x89PNG\r\n\x1a\n",
+        chunk(b"IHDR", header),
+        chunk(b"IDAT", zlib.compress(rows.tobytes(), level)),
+        chunk(b"IEND", b""),
+    ))
+
+
+def write_png(path, frame, level=1):
+    with open(path, "wb") as f:
+        f.write(png_bytes(frame, level))
+
+
+class RawVideoWriter:
+    """Appends frames as raw rgb24 video, readable by ffmpeg
+
+    ``ffmpeg -f rawvideo -pix_fmt rgb24 -s WxH -r FPS -i FILE out.mp4``
+    """
+
+    def __init__(self, path, width, height, fps):
+        self.path = path
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.frames = 0
+        self.file = open(path, "wb")
+
+    def write(self, frame):
+        self.file.write(frame.tobytes())
+        self.frames += 1
+
+    def close(self):
+        self.file.close()
+
+    def ffmpeg_command(self, output="out.mp4"):
+        return (
+            f"ffmpeg -f rawvideo -pix_fmt rgb24 -s {self.width}x{self.height} "
+            f"-r {self.fps:g} -i {self.path} {output}"
+        )
@@ -0,0 +1,255 @@
+"""Seeded sessions, input recording and headless replay
+
+Setting GAMEKIT_SEED makes a game's engine start from that seed, and
+setting GAMEKIT_RECORD to a directory records every session to a JSON
+lines file there. A recording holds the engine's RNG state at each
+reset, every input with a timestamp (ms since recording started), runs
+of clock steps, and periodic state digests.
+
+``python -m gamekit.replay FILE`` re-executes a recording on the
+headless engine as fast as the CPU allows, reports the speed, and
+exits non-zero at the first state digest that does not match. That
+makes it usable for bisecting both slowdowns and desyncs.
+"""
+
+import argparse
+import atexit
+import json
+import os
+import sys
+import time
+import zlib
+from collections import deque
+from contextlib import contextmanager
+
+from gamekit.engines import ENGINES
+from gamekit.engines.snake import SnakeBody
+from gamekit.entities import Entity, Pool
+
+FORMAT_VERSION = 1
+
+# Engine attributes left out of state digests: hooks, constant word lists
+# and indexes derived from other state
+DIGEST_SKIP = frozenset(('rng', 'recorder', 'events', 'phase', 'words', 'word_list',
+                         'occupancy', 'free_cells', 'free_slot'))
+
+
+def session_seed(seed=None):
+    """``seed`` if given, else GAMEKIT_SEED as an int, else None"""
+    if seed is not None:
+        return seed
+    value = os.environ.get("GAMEKIT_SEED")
+    return int(value) if value else None
+
+
+def record_session(name, engine):
+    """Start recording ``engine`` if GAMEKIT_RECORD names a directory"""
+    directory = os.environ.get("GAMEKIT_RECORD")
+    if not directory:
+        return None
+    os.makedirs(directory, exist_ok=True)
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    path = os.path.join(directory, f"{name.replace(' ', '_')}-{stamp}.jsonl")
+    return Recorder(name, engine, path)
+
+
+def canonical(value):
+    """Order-independent, JSON-like form of engine state for hashing"""
+    if isinstance(value, (set, frozenset)):
+        return sorted(repr(canonical(item)) for item in value)
+    if isinstance(value, dict):
+        return sorted((repr(key), canonical(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple, deque, SnakeBody)):
+        return [canonical(item) for item in value]
+    if isinstance(value, Entity):
+        # Same form as the dicts entities replaced, so old digests still match
+        return canonical(value.fields())
+    return value
+
+
+def state_digest(engine):
+    state = {
+        name: value for name, value in vars(engine).items()
+        if name not in DIGEST_SKIP and not callable(value) and not isinstance(value, Pool)
+    }
+    return format(zlib.crc32(repr(canonical(state)).encode()), '08x')
+
+
+def from_json(value):
+    """Turn JSON lists back into the tuples the engines use for actions"""
+    if isinstance(value, list):
+        return tuple(from_json(item) for item in value)
+    return value
+
+
+def rng_state(engine):
+    version, internal, gauss = engine.rng.getstate()
+    return [version, list(internal), gauss]
+
+
+def set_rng_state(engine, state):
+    version, internal, gauss = state
+    engine.rng.setstate((version, tuple(internal), gauss))
+
+
+class Recorder:
+    """Logs everything that drives one engine to a JSON lines file
+
+    The engine calls ``record``/``record_reset`` from its ``apply``,
+    ``step`` and ``reset``. Consecutive identical steps are stored as one
+    entry with a count, and a state digest is written every
+    ``CHECK_EVERY`` steps.
+    """
+
+    CHECK_EVERY = 300
+
+    def __init__(self, name, engine, path):
+        self.name = name
+        self.engine = engine
+        self.path = path
+        self.file = open(path, "w")
+        self.start = time.perf_counter()
+        self.stamp = None
+        self.steps = 0
+
+        # Pending run of identical steps: [action, count, timestamp]
+        self.run = None
+
+        config = {key: getattr(engine, key) for key in engine.CONFIG}
+        self.write({"version": FORMAT_VERSION, "game": name, "config": config})
+        atexit.register(self.close)
+
+        # Restart the engine so the recording begins from a logged reset
+        engine.recorder = self
+        engine.reset()
+
+    def now(self):
+        stamp = self.stamp if self.stamp is not None else time.perf_counter()
+        return round((stamp - self.start) * 1000, 1)
+
+    @contextmanager
+    def stamped(self, stamp):
+        """Log entries made inside the block at ``stamp``, e.g. when buffered input arrived"""
+        self.stamp = stamp
+        try:
+            yield
+        finally:
+            self.stamp = None
+
+    def write(self, entry):
+        self.file.write(json.dumps(entry) + "\n")
+
+    def record(self, kind, action):
+        """Log an 'apply' (input between steps) or a 'step' (clock tick)"""
+        if kind == 'step':
+            if self.steps and self.steps % self.CHECK_EVERY == 0:
+                self.flush_run()
+                self.write({"digest": state_digest(self.engine), "steps": self.steps})
+            self.steps += 1
+
+            if self.run is not None and self.run[0] == action:
+                self.run[1] += 1
+                return
+            self.flush_run()
+            self.run = [action, 1, self.now()]
+            return
+
+        self.flush_run()
+        self.write({"t": self.now(), "apply": action})
+
+    def record_reset(self, engine):
+        """Log the start of a round with the RNG state and engine config"""
+        self.flush_run()
+        config = {key: getattr(engine, key) for key in engine.CONFIG}
+        self.write({"t": self.now(), "reset": config, "rng": rng_state(engine)})
+        self.file.flush()
+
+    def flush_run(self):
+        if self.run is not None:
+            action, count, timestamp = self.run
+            self.write({"t": timestamp, "step": action, "n": count})
+            self.run = None
+
+    def close(self):
+        """Write the final digest and close the file"""
+        if self.file.closed:
+            return
+        self.flush_run()
+        self.write({"digest": state_digest(self.engine), "steps": self.steps})
+        self.file.close()
+        self.engine.recorder = None
+
+
+def load(path):
+    """Read a recording; returns (header, entries)"""
+    with open(path) as f:
+        lines = [json.loads(line) for line in f if line.strip()]
+    if not lines or lines[0].get("version") != FORMAT_VERSION:
+        raise ValueError(f"{path} is not a version {FORMAT_VERSION} recording")
+    return lines[0], lines[1:]
+
+
+def replay(header, entries):
+    """Re-execute a recording as fast as possible
+
+    Returns a dict with the step and input counts, the elapsed time, and
+    the first mismatching digest entry (or None).
+    """
+    engine_class = ENGINES[header["game"]]
+    engine = engine_class(**header["config"])
+    steps = inputs = 0
+    desync = None
+
+    start = time.perf_counter()
+    for index, entry in enumerate(entries):
+        if "step" in entry:
+            action = from_json(entry["step"])
+            step = engine.step
+            for _ in range(entry["n"]):
+                step(action)
+            steps += entry["n"]
+        elif "apply" in entry:
+            engine.apply(from_json(entry["apply"]))
+            inputs += 1
+        elif "reset" in entry:
+            # A fresh engine with the recorded RNG state replays reset() exactly
+            engine = engine_class(**entry["reset"])
+            set_rng_state(engine, entry["rng"])
+            engine.reset()
+        elif "digest" in entry:
+            if state_digest(engine) != entry["digest"]:
+                desync = {"entry": index + 1, "steps": entry["steps"]}
+                break
+    elapsed = time.perf_counter() - start
+
+    return {"steps": steps, "inputs": inputs, "seconds": elapsed, "desync": desync, "engine": engine}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m gamekit.replay", description="Replay a recorded session headlessly")
+    parser.add_argument("recording")
+    parser.add_argument("--repeat", type=int, default=1, help="replay this many times and report the best speed")
+    args = parser.parse_args(argv)
+
+    header, entries = load(args.recording)
+    best = None
+    for _ in range(args.repeat):
+        result = replay(header, entries)
+        if best is None or result["seconds"] < best["seconds"]:
+            best = result
+
+    events = best["steps"] + best["inputs"]
+    rate = events / best["seconds"] if best["seconds"] else 0.0
+    print(
+        f"{header['game']}: {best['steps']} steps and {best['inputs']} inputs "
+        f"in {best['seconds'] * 1000:.1f} ms ({rate:,.0f} events/s)"
+    )
+    if best["desync"] is not None:
+        print(f"desync at entry {best['desync']['entry']} after {best['desync']['steps']} steps")
+        return 1
+    print("state digests match")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""Shared fonts and colors
+
+Passing a font tuple such as ("Arial", 12, "bold") or a freshly formatted
+color string makes Tk resolve the font or parse the color again on every
+call. The helpers here hand out one named Font per family/size/weight and
+one interned string per color, and precompute the color ramps used by
+fades, so hot drawing paths reuse values Tk has already resolved.
+"""
+
+import sys
+import tkinter as tk
+import tkinter.font as tkfont
+
+FADE_STEPS = 20
+
+_fonts = {}
+_fonts_root = None
+_colors = {}
+_ramps = {}
+
+
+def font(family, size, weight="normal"):
+    """Named Font for a family, size and weight, created once per Tk root
+
+    Without a Tk root (off-screen rendering) the plain font tuple is returned.
+    """
+    global _fonts_root
+    if tk._default_root is None:
+        return (family, size, weight)
+    if tk._default_root is not _fonts_root:
+        # Fonts belong to an interpreter; start over when the root changes
+        _fonts.clear()
+        _fonts_root = tk._default_root
+
+    key = (family, size, weight)
+    named = _fonts.get(key)
+    if named is None:
+        named = _fonts[key] = tkfont.Font(family=family, size=size, weight=weight)
+    return named
+
+
+def rgb(r, g, b):
+    """Interned '#rrggbb' string for 0-255 channel values"""
+    key = (r, g, b)
+    color = _colors.get(key)
+    if color is None:
+        color = _colors[key] = sys.intern(f"#{r:02x}{g:02x}{b:02x}")
+    return color
+
+
+def gray(level):
+    return rgb(level, level, level)
+
+
+def parse(color):
+    """Channels of a '#rrggbb' string"""
+    return int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
+
+
+def ramp(start, end, steps):
+    """Tuple of ``steps`` colors going from ``start`` to ``end``, built once"""
+    key = (start, end, steps)
+    colors = _ramps.get(key)
+    if colors is None:
+        first, last = parse(start), parse(end)
+        colors = _ramps[key] = tuple(
+            rgb(*(int(a + (b - a) * i / (steps - 1)) for a, b in zip(first, last)))
+            for i in range(steps)
+        )
+    return colors
+
+
+def fade(color, alpha, background="#000000"):
+    """``color`` blended over ``background`` at ``alpha`` (0-1), in FADE_STEPS steps"""
+    colors = ramp(background, color, FADE_STEPS + 1)
+    return colors[max(0, min(FADE_STEPS, round(alpha * FADE_STEPS)))]
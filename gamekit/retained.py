@@ -0,0 +1,213 @@
+"""Retained-mode drawing on a tk.Canvas
+
+Instead of deleting and re-creating every item each frame, a game draws
+through a RetainedCanvas: it names each object with a key and describes
+how it should look. The layer keeps one canvas item per key and only
+sends ``coords``/``itemconfig`` for what actually changed. Items for keys
+that were not drawn in a frame are hidden and pooled for reuse.
+
+Long chains of cells that only change at their ends, like a snake, are
+drawn through a SegmentRing instead, which touches only the ends each
+frame rather than visiting every segment.
+"""
+
+from collections import deque
+
+
+class _Entry:
+    __slots__ = ('item', 'kind', 'coords', 'options')
+
+    def __init__(self, item, kind, coords, options):
+        self.item = item
+        self.kind = kind
+        self.coords = coords
+        self.options = options
+
+
+class RetainedCanvas:
+    """Keeps one canvas item per game object and pushes only diffs"""
+
+    def __init__(self, canvas, tag="game", layers=("default",)):
+        self.canvas = canvas
+        self.tag = tag
+        self.layers = tuple(layers)
+
+        self.entries = {}  # key -> _Entry
+        self.pools = {}  # kind -> hidden entries ready for reuse
+        self.markers = {}  # layer -> invisible item marking its top
+        self.rings = {}  # key -> SegmentRing
+        self.seen = set()
+
+        # Tcl calls issued by the layer, for instrumentation
+        self.calls = 0
+
+        self._create_markers()
+
+    def begin_frame(self):
+        """Start collecting the objects drawn this frame"""
+        self.seen = set()
+
+    def end_frame(self):
+        """Hide every object that was not drawn since begin_frame"""
+        if len(self.seen) == len(self.entries):
+            return
+        for key in [key for key in self.entries if key not in self.seen]:
+            self.release(key)
+
+    def draw(self, key, kind, coords, layer="default", **options):
+        """Show ``key`` as a ``kind`` item ('rectangle', 'oval', ...) at ``coords``"""
+        self.seen.add(key)
+        entry = self.entries.get(key)
+
+        if entry is None:
+            self.entries[key] = self._acquire(kind, coords, layer, options)
+            return
+        self._update(entry, coords, options)
+
+    def ring(self, key, kind="rectangle", layer="default"):
+        """The SegmentRing drawn under ``key``, created on first use"""
+        ring = self.rings.get(key)
+        if ring is None:
+            ring = self.rings[key] = SegmentRing(self, kind, layer)
+        return ring
+
+    def _update(self, entry, coords, options):
+        """Send whatever differs from what the item already shows"""
+        if entry.coords != coords:
+            self.canvas.coords(entry.item, *coords)
+            entry.coords = coords
+            self.calls += 1
+
+        old = entry.options
+        changed = {name: value for name, value in options.items() if old.get(name) != value}
+        if changed:
+            self.canvas.itemconfig(entry.item, **changed)
+            old.update(changed)
+            self.calls += 1
+
+    def release(self, key):
+        """Hide one object and return its item to the pool"""
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self._hide(entry)
+
+    def _hide(self, entry):
+        self.canvas.itemconfig(entry.item, state="hidden")
+        self.calls += 1
+        self.pools.setdefault(entry.kind, []).append(entry)
+
+    def clear(self):
+        """Hide every object, keeping the items pooled"""
+        for key in list(self.entries):
+            self.release(key)
+        for ring in self.rings.values():
+            ring.clear()
+        self.seen = set()
+
+    def reset(self):
+        """Forget all items, e.g. after the canvas was cleared with delete('all')"""
+        self.entries = {}
+        self.pools = {}
+        self.rings = {}
+        self.seen = set()
+        self._create_markers()
+
+    def item_count(self):
+        """Number of canvas items owned by the layer, visible or pooled"""
+        return (len(self.entries) + sum(len(pool) for pool in self.pools.values())
+                + sum(len(ring.entries) for ring in self.rings.values()))
+
+    def _acquire(self, kind, coords, layer, options):
+        """Reuse a pooled item of the same kind or create a new one"""
+        pool = self.pools.get(kind)
+        if pool:
+            entry = pool.pop()
+            self.canvas.coords(entry.item, *coords)
+            self.canvas.itemconfig(entry.item, state="normal", **options)
+            self.calls += 2
+            entry.coords = coords
+            entry.options = dict(options)
+        else:
+            create = getattr(self.canvas, "create_" + kind)
+            item = create(*coords, tags=self.tag, **options)
+            self.calls += 1
+            entry = _Entry(item, kind, coords, dict(options))
+
+        # Slot the item in just under its layer's marker to keep z-order stable
+        self.canvas.tag_lower(entry.item, self.markers[layer])
+        self.calls += 1
+        return entry
+
+    def _create_markers(self):
+        """Create one invisible item per layer, bottom-up, above everything drawn so far"""
+        self.markers = {}
+        for name in self.layers:
+            self.markers[name] = self.canvas.create_line(
+                0, 0, 0, 0, state="hidden", tags=self.tag + "-layer"
+            )
+
+
+class SegmentRing:
+    """Items for a chain of cells that moves and grows only at its ends
+
+    ``draw(cells, moves, look)`` takes the cells head first, a counter
+    that goes up by one per move, and ``look(cell, is_head)`` returning
+    the ``(coords, options)`` of a segment. Between two draws the chain
+    may have moved a few cells and grown by repeating its tail cell: the
+    old head is restyled, items dropped off the tail are moved to the new
+    head cells and new items are taken only for growth, so a frame costs
+    the same at any length. Anything else, such as a new round, redraws every segment.
+    """
+
+    def __init__(self, layer, kind, layer_name):
+        self.layer = layer
+        self.kind = kind
+        self.layer_name = layer_name
+        self.entries = deque()  # one per cell, head first
+        self.cells = None
+        self.moves = 0
+
+    def draw(self, cells, moves, look):
+        moved = moves - self.moves
+        grown = len(cells) - len(self.entries)
+        if cells is not self.cells or not 0 <= grown <= moved < len(cells):
+            self.redraw(cells, moves, look)
+            return
+        if not moved:
+            return
+
+        layer = self.layer
+        entries = self.entries
+        dropped = moved - grown
+
+        coords, options = look(cells[moved], False)
+        layer._update(entries[0], coords, options)
+        for i in range(moved - 1, -1, -1):
+            coords, options = look(cells[i], i == 0)
+            if dropped:
+                entry = entries.pop()
+                dropped -= 1
+                layer._update(entry, coords, options)
+            else:
+                entry = layer._acquire(self.kind, coords, self.layer_name, options)
+            entries.appendleft(entry)
+
+        # Growth repeats the tail cell, so the last items show cells the chain has left
+        for i in range(1, grown + 1):
+            coords, options = look(cells[-i], False)
+            layer._update(entries[-i], coords, options)
+        self.moves = moves
+
+    def redraw(self, cells, moves, look):
+        self.clear()
+        for i, cell in enumerate(cells):
+            coords, options = look(cell, i == 0)
+            self.entries.append(self.layer._acquire(self.kind, coords, self.layer_name, options))
+        self.cells = cells
+        self.moves = moves
+
+    def clear(self):
+        """Hide every segment, returning the items to the layer's pool"""
+        while self.entries:
+            self.layer._hide(self.entries.pop())
+        self.cells = None
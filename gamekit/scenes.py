@@ -0,0 +1,93 @@
+"""Screens that are built once and then hidden and shown
+
+Menus, game screens and game-over screens used to be torn down and
+rebuilt on every switch: Minesweeper destroyed every widget and created
+its canvas, frames, labels and bindings again, and the other games
+deleted and recreated their menu text. A SceneManager builds each scene
+the first time it is shown and afterwards only hides it: root-level
+widgets with ``pack_forget`` and canvas items with ``state='hidden'``.
+Showing a scene again re-packs the same widgets and calls its ``enter``
+callback to refresh whatever changed since, so a menu-to-game switch
+allocates nothing.
+"""
+
+import tkinter as tk
+
+
+class Scene:
+    """One screen: the root-level widgets and canvas items it owns
+
+    ``build(scene)`` runs on the first show and hands what it creates to
+    ``pack`` and ``items``. ``enter(*args)`` runs on every show and
+    ``leave()`` whenever another scene replaces this one.
+    """
+
+    def __init__(self, name, build=None, enter=None, leave=None):
+        self.name = name
+        self.build = build
+        self.enter = enter
+        self.leave = leave
+        self.built = False
+        self.widgets = []  # (widget, pack options), in packing order
+        self.tags = []  # (canvas, tag)
+
+    def pack(self, widget, **options):
+        """Pack a root-level widget of this scene; it is re-packed the same way on every show"""
+        widget.pack(**options)
+        self.widgets.append((widget, options))
+        return widget
+
+    def items(self, canvas, tag):
+        """Make the canvas items tagged ``tag`` part of this scene"""
+        self.tags.append((canvas, tag))
+
+    def show(self):
+        for widget, options in self.widgets:
+            widget.pack(**options)
+        for canvas, tag in self.tags:
+            canvas.itemconfig(tag, state=tk.NORMAL)
+
+    def hide(self):
+        for widget, _ in self.widgets:
+            widget.pack_forget()
+        for canvas, tag in self.tags:
+            canvas.itemconfig(tag, state=tk.HIDDEN)
+
+
+class SceneManager:
+    """Switches one window between its scenes, building each only once"""
+
+    def __init__(self):
+        self.scenes = {}
+        self.current = None
+
+        # Totals, to check that switching stopped rebuilding
+        self.builds = 0
+        self.switches = 0
+
+    def add(self, name, build=None, enter=None, leave=None):
+        self.scenes[name] = Scene(name, build, enter, leave)
+
+    def show(self, name, *args):
+        """Make ``name`` the visible scene and call its ``enter(*args)``"""
+        scene = self.scenes[name]
+        current = self.current
+        if current is not scene:
+            if current is not None:
+                current.hide()
+                if current.leave is not None:
+                    current.leave()
+            self.current = scene
+            self.switches += 1
+            if scene.built:
+                scene.show()
+            else:
+                scene.built = True
+                self.builds += 1
+                if scene.build is not None:
+                    scene.build(scene)
+        if scene.enter is not None:
+            scene.enter(*args)
+
+    def is_showing(self, name):
+        return self.current is not None and self.current.name == name
@@ -0,0 +1,236 @@
+"""Fixed-timestep frame scheduler for a Tk window
+
+A FrameScheduler owns the only ``after`` timer of a window. Each display
+frame it delivers the input buffered since the last one (see
+``gamekit.inputs``), advances every named task by the real time that
+passed, running the task's callback once per whole interval (its fixed
+logic timestep), then calls the render callback once if anything asked
+for a redraw.
+Frames are scheduled against absolute target times, so work done inside a
+frame does not push later frames back.
+
+Delayed one-shot calls are named tasks too, so every pending piece of work
+in a window can be listed with ``live``, replaced by name, or dropped with
+``cancel_all`` when the screen changes.
+"""
+
+import time
+
+from gamekit.phases import no_phase
+
+
+class _Task:
+    __slots__ = ('interval', 'callback', 'max_catchup', 'persistent', 'accumulator')
+
+    def __init__(self, interval, callback, max_catchup, persistent):
+        self.interval = interval
+        self.callback = callback
+        self.max_catchup = max_catchup
+        self.persistent = persistent
+        self.accumulator = 0.0
+
+
+class FrameScheduler:
+    """One display-frame loop per window driving fixed-timestep tasks"""
+
+    def __init__(self, root, frame_ms=16, max_catchup=5):
+        self.root = root
+        self.frame_interval = self.base_frame_interval = frame_ms / 1000
+        self.max_catchup = max_catchup
+
+        self.tasks = {}  # name -> _Task
+        self.input = None
+        self.render = None
+        self.dirty = False
+
+        self.running = False
+        self.frame_count = 0
+
+        # Background throttling set by gamekit.idle; None when running normally
+        self.keep = None
+        self.other_steps = 1
+        self.render_paused = False
+
+        # Timing hooks set by gamekit.instrument
+        self.phase = no_phase
+        self.observer = None
+
+        # cProfile.Profile enabled around each frame while gamekit.profiler captures
+        self.profiler = None
+
+        self._after_id = None
+        self._last_time = 0.0
+        self._next_frame = 0.0
+
+    def every(self, name, interval_ms, callback, max_catchup=None, persistent=False):
+        """Run ``callback`` every ``interval_ms`` of game time under ``name``
+
+        Registering a name that is already active replaces that task, so
+        restarting an animation never stacks a second copy of it.
+        Persistent tasks survive ``cancel_all``.
+        """
+        if max_catchup is None:
+            max_catchup = self.max_catchup
+        self.tasks[name] = _Task(interval_ms / 1000, callback, max_catchup, persistent)
+
+    def after(self, name, delay_ms, callback):
+        """Run ``callback`` once, ``delay_ms`` of game time from now, under ``name``
+
+        Like ``every``, scheduling a name again replaces the pending call.
+        """
+        def once():
+            self.cancel(name)
+            callback()
+        self.every(name, delay_ms, once, max_catchup=1)
+
+    def set_interval(self, name, interval_ms):
+        """Change a task's timestep without resetting its accumulator"""
+        task = self.tasks.get(name)
+        if task is not None:
+            task.interval = interval_ms / 1000
+
+    def cancel(self, name):
+        """Stop a task; unknown names are ignored"""
+        self.tasks.pop(name, None)
+
+    def cancel_all(self):
+        """Stop every task that is not persistent, e.g. when the screen changes"""
+        for name in [name for name, task in self.tasks.items() if not task.persistent]:
+            del self.tasks[name]
+
+    def is_active(self, name):
+        return name in self.tasks
+
+    def live(self):
+        """Names of the tasks and pending one-shots still scheduled"""
+        return sorted(self.tasks, key=str)
+
+    def set_input(self, callback):
+        """Set the callback that delivers buffered input at the start of each frame"""
+        self.input = callback
+
+    def set_render(self, callback):
+        """Set the callback that redraws the window once per frame when invalidated"""
+        self.render = callback
+
+    def invalidate(self):
+        """Ask for one render at the end of the current or next frame"""
+        self.dirty = True
+
+    def throttle(self, frame_ms, keep=(), other_steps=1, render=True):
+        """Slow the loop down while the window is in the background
+
+        Frames come every ``frame_ms``. Tasks named in ``keep`` run as
+        usual; every other task runs at most ``other_steps`` times a frame
+        and drops the rest of its backlog, and 0 freezes it in place.
+        ``render=False`` skips drawing until ``unthrottle``.
+        """
+        self.keep = frozenset(keep)
+        self.other_steps = other_steps
+        self.render_paused = not render
+        self._set_frame_interval(frame_ms / 1000)
+
+    def unthrottle(self):
+        """Go back to the normal frame rate and redraw"""
+        if self.keep is None:
+            return
+        self.keep = None
+        self.render_paused = False
+        self.dirty = True
+        self._set_frame_interval(self.base_frame_interval)
+
+    def _set_frame_interval(self, interval):
+        if interval == self.frame_interval:
+            return
+        self.frame_interval = interval
+        if self.running and self._after_id is not None:
+            # Rebase the pending frame so a faster rate takes effect right away
+            self.root.after_cancel(self._after_id)
+            self._next_frame = time.perf_counter()
+            self._schedule()
+
+    def start(self):
+        """Start the frame loop"""
+        if self.running:
+            return
+        self.running = True
+        self._last_time = self._next_frame = time.perf_counter()
+        self._schedule()
+
+    def stop(self):
+        """Stop the frame loop and cancel its pending timer"""
+        self.running = False
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _schedule(self):
+        """Queue the next frame at its absolute target time"""
+        now = time.perf_counter()
+        self._next_frame += self.frame_interval
+        if self._next_frame < now:
+            # Too far behind to keep the cadence; restart it from now
+            self._next_frame = now + self.frame_interval
+        delay = max(1, int((self._next_frame - now) * 1000))
+        self._after_id = self.root.after(delay, self._frame)
+
+    def _frame(self):
+        """Advance all tasks by the elapsed time, then render if needed"""
+        if not self.running:
+            return
+        # Queue the next frame first so a failing task cannot stop the loop
+        self._schedule()
+
+        now = time.perf_counter()
+        elapsed = now - self._last_time
+        self._last_time = now
+        self.frame_count += 1
+
+        profiler = self.profiler
+        if profiler is None:
+            self._advance(elapsed)
+        else:
+            profiler.enable()
+            try:
+                self._advance(elapsed)
+            finally:
+                profiler.disable()
+
+        if self.observer is not None:
+            self.observer.frame_done(now, time.perf_counter())
+
+    def _advance(self, elapsed):
+        """Deliver input, step the tasks by ``elapsed`` seconds and render"""
+        # Input first, so this frame's tasks and render already see it
+        if self.input is not None:
+            with self.phase("update"):
+                self.input()
+
+        keep = self.keep
+        for name, task in list(self.tasks.items()):
+            if self.tasks.get(name) is not task:
+                continue  # Cancelled or replaced earlier in this frame
+
+            max_steps = task.max_catchup
+            if keep is not None and name not in keep:
+                max_steps = min(max_steps, self.other_steps)
+                if max_steps == 0:
+                    continue  # Frozen while throttled
+
+            task.accumulator += elapsed
+            steps = 0
+            while task.accumulator >= task.interval:
+                task.accumulator -= task.interval
+                task.callback()
+                steps += 1
+                if self.tasks.get(name) is not task:
+                    break
+                if steps >= max_steps:
+                    # Drop the backlog instead of spiralling after a stall
+                    task.accumulator %= task.interval
+                    break
+
+        if self.dirty and self.render is not None and not self.render_paused:
+            self.dirty = False
+            with self.phase("draw"):
+                self.render()
@@ -0,0 +1,515 @@
+"""Local spectator server streaming game-state deltas
+
+Setting GAMEKIT_SPECTATE to a port (or ``host:port``; the host defaults to
+127.0.0.1) makes a game serve its state to any number of spectators over
+TCP. Every PUBLISH_MS the Tk thread compares the engine with what it last
+sent and queues a compact delta: the snake's new head cells and how many
+tail cells it dropped, changed Tetris rows, newly revealed Minesweeper
+cells, removed blocks, new Wordle guesses, changed cookie counts. A
+background thread running an asyncio server takes deltas off that queue
+and writes them to every spectator as JSON lines.
+
+The Tk thread only ever does ``put_nowait`` on a bounded queue. A
+spectator that cannot keep up skips deltas until the next keyframe, which
+is sent whenever someone connects or falls behind, so a slow reader
+never holds up ``game_loop``.
+
+``python -m gamekit.spectate [host:]port`` prints what a game streams.
+"""
+
+import argparse
+import asyncio
+import atexit
+import json
+import os
+import queue
+import sys
+import threading
+from itertools import islice
+
+PUBLISH_MS = 50
+DEFAULT_HOST = "127.0.0.1"
+
+
+def parse_address(value):
+    """``"port"`` or ``"host:port"`` as a (host, port) pair"""
+    host, _, port = value.rpartition(":")
+    return host or DEFAULT_HOST, int(port)
+
+
+# Deltas per engine: keyframe() describes the whole state, delta() what
+# changed since the last call and returns None when nothing did. A new
+# round replaces the engine's containers, which forces a keyframe.
+
+class SnakeStream:
+    def __init__(self, engine):
+        self.engine = engine
+        self.snake = None
+        self.ticks = 0
+        self.length = 0
+        self.food = None
+        self.done = False
+
+    def keyframe(self):
+        engine = self.engine
+        self.snake = engine.snake
+        self.ticks = engine.ticks
+        self.length = len(engine.snake)
+        self.food = engine.food
+        self.done = engine.done
+        return {'snake': list(engine.snake), 'food': engine.food, 'score': engine.score, 'done': engine.done}
+
+    def delta(self):
+        engine = self.engine
+        moved = engine.ticks - self.ticks
+        if engine.snake is not self.snake or moved < 0 or moved > len(engine.snake):
+            return self.keyframe()
+
+        delta = {}
+        if moved:
+            # New heads oldest first; the tail lost one cell per move it did not grow
+            delta['head'] = list(islice(engine.snake, moved))[::-1]
+            delta['tail'] = moved - (len(engine.snake) - self.length)
+            delta['score'] = engine.score
+            self.ticks = engine.ticks
+            self.length = len(engine.snake)
+        if engine.food != self.food:
+            delta['food'] = self.food = engine.food
+        if engine.done != self.done:
+            delta['done'] = self.done = engine.done
+        return delta or None
+
+
+class TetrisStream:
+    def __init__(self, engine):
+        self.engine = engine
+        self.grid = None
+        self.rows = []
+        self.piece = None
+        self.done = False
+
+    def row(self, cells):
+        return "".join(cell or "." for cell in cells)
+
+    def current_piece(self):
+        engine = self.engine
+        if engine.current_piece is None:
+            return None
+        return [engine.current_shape, engine.current_x, engine.current_y, engine.current_piece]
+
+    def keyframe(self):
+        engine = self.engine
+        self.grid = engine.grid
+        self.rows = [self.row(cells) for cells in engine.grid]
+        self.piece = self.current_piece()
+        self.done = engine.done
+        return {'rows': dict(enumerate(self.rows)), 'piece': self.piece,
+                'score': engine.score, 'lines': engine.lines_cleared, 'done': engine.done}
+
+    def delta(self):
+        engine = self.engine
+        if engine.grid is not self.grid:
+            return self.keyframe()
+
+        delta = {}
+        rows = {}
+        for y, cells in enumerate(engine.grid):
+            row = self.row(cells)
+            if row != self.rows[y]:
+                rows[y] = self.rows[y] = row
+        if rows:
+            delta['rows'] = rows
+            delta['score'] = engine.score
+            delta['lines'] = engine.lines_cleared
+        piece = self.current_piece()
+        if piece != self.piece:
+            delta['piece'] = self.piece = piece
+        if engine.done != self.done:
+            delta['done'] = self.done = engine.done
+        return delta or None
+
+
+class MinesweeperStream:
+    def __init__(self, engine):
+        self.engine = engine
+        self.revealed = None
+        self.sent = set()
+        self.flags = frozenset()
+        self.done = False
+
+    def cells(self, positions):
+        """[row, col, adjacent mines] per cell, -1 for a mine"""
+        engine = self.engine
+        return [
+            [row, col, -1 if (row, col) in engine.mines else engine.count_adjacent_mines(row, col)]
+            for row, col in sorted(positions)
+        ]
+
+    def keyframe(self):
+        engine = self.engine
+        self.revealed = engine.revealed
+        self.sent = set(engine.revealed)
+        self.flags = frozenset(engine.flags)
+        self.done = engine.done
+        return {'size': engine.grid_size, 'mines': engine.mine_count, 'revealed': self.cells(self.sent),
+                'flags': sorted(self.flags), 'done': engine.done, 'won': engine.won}
+
+    def delta(self):
+        engine = self.engine
+        if engine.revealed is not self.revealed:
+            return self.keyframe()
+
+        delta = {}
+        if len(engine.revealed) != len(self.sent):
+            new = engine.revealed - self.sent
+            self.sent.update(new)
+            delta['revealed'] = self.cells(new)
+        if engine.flags != self.flags:
+            delta['flags'] = sorted(engine.flags)
+            self.flags = frozenset(engine.flags)
+        if engine.done != self.done:
+            delta['done'] = self.done = engine.done
+            delta['won'] = engine.won
+        return delta or None
+
+
+class BlockBreakerStream:
+    def __init__(self, engine):
+        self.engine = engine
+        self.blocks = None
+        self.visible = []
+        self.lives = 0
+        self.last_moving = None
+        self.done = False
+
+    def moving(self):
+        """Paddle, balls and powerups, which move every tick"""
+        engine = self.engine
+        return {
+            'paddle': [round(engine.paddle_x), round(engine.paddle_width)],
+            'balls': [[round(ball.x), round(ball.y)] for ball in engine.balls],
+            'powerups': [[round(p.x), round(p.y), p.type] for p in engine.powerups],
+        }
+
+    def keyframe(self):
+        engine = self.engine
+        self.blocks = engine.blocks
+        self.visible = [block.visible for block in engine.blocks]
+        self.lives = engine.lives
+        self.last_moving = self.moving()
+        self.done = engine.done
+        return dict(
+            self.last_moving,
+            blocks=[[block.x, block.y, block.row] for block in engine.blocks],
+            removed=[i for i, visible in enumerate(self.visible) if not visible],
+            score=engine.score, lives=engine.lives, done=engine.done,
+        )
+
+    def delta(self):
+        engine = self.engine
+        if engine.blocks is not self.blocks:
+            return self.keyframe()
+
+        delta = {}
+        moving = self.moving()
+        if moving != self.last_moving:
+            delta.update(moving)
+            self.last_moving = moving
+        removed = []
+        for i, block in enumerate(engine.blocks):
+            if self.visible[i] and not block.visible:
+                self.visible[i] = False
+                removed.append(i)
+        if removed:
+            delta['removed'] = removed
+            delta['score'] = engine.score
+        if engine.lives != self.lives:
+            delta['lives'] = self.lives = engine.lives
+        if engine.done != self.done:
+            delta['done'] = self.done = engine.done
+        return delta or None
+
+
+class WordleStream:
+    def __init__(self, engine):
+        self.engine = engine
+        self.guesses = None
+        self.count = 0
+        self.current = ""
+        self.done = False
+
+    def keyframe(self):
+        engine = self.engine
+        self.guesses = engine.guesses
+        self.count = len(engine.guesses)
+        self.current = engine.current_guess
+        self.done = engine.done
+        return {'guesses': [list(guess) for guess in engine.guesses], 'current': engine.current_guess,
+                'done': engine.done, 'won': engine.won}
+
+    def delta(self):
+        engine = self.engine
+        if engine.guesses is not self.guesses:
+            return self.keyframe()
+
+        delta = {}
+        if len(engine.guesses) != self.count:
+            delta['guesses'] = [list(guess) for guess in engine.guesses[self.count:]]
+            self.count = len(engine.guesses)
+        if engine.current_guess != self.current:
+            delta['current'] = self.current = engine.current_guess
+        if engine.done != self.done:
+            delta['done'] = self.done = engine.done
+            delta['won'] = engine.won
+        return delta or None
+
+
+class CookieStream:
+    def __init__(self, engine):
+        self.engine = engine
+        self.upgrades = None
+        self.counts = {}
+        self.cookies = None
+
+    def keyframe(self):
+        engine = self.engine
+        self.upgrades = engine.upgrades
+        self.counts = {key: upgrade.count for key, upgrade in engine.upgrades.items()}
+        self.cookies = int(engine.cookies)
+        return {'cookies': self.cookies, 'cps': engine.cookies_per_second, 'upgrades': dict(self.counts)}
+
+    def delta(self):
+        engine = self.engine
+        if engine.upgrades is not self.upgrades:
+            return self.keyframe()
+
+        delta = {}
+        cookies = int(engine.cookies)
+        if cookies != self.cookies:
+            delta['cookies'] = self.cookies = cookies
+        bought = {key: upgrade.count for key, upgrade in engine.upgrades.items()
+                  if upgrade.count != self.counts[key]}
+        if bought:
+            self.counts.update(bought)
+            delta['upgrades'] = bought
+            delta['cps'] = engine.cookies_per_second
+        return delta or None
+
+
+STREAMS = {
+    'snake': SnakeStream,
+    'tetris': TetrisStream,
+    'minesweeper': MinesweeperStream,
+    'block breaker': BlockBreakerStream,
+    'wordle': WordleStream,
+    'cookie clicker': CookieStream,
+}
+
+
+def spectate(name, game):
+    """Serve ``game`` to spectators if GAMEKIT_SPECTATE is set; returns the Publisher or None"""
+    address = os.environ.get("GAMEKIT_SPECTATE")
+    if not address:
+        return None
+    host, port = parse_address(address)
+    server = SpectatorServer(host, port)
+    server.start()
+    atexit.register(server.close)
+    return Publisher(name, game, server)
+
+
+class Publisher:
+    """Tk-thread side: turns engine changes into deltas for the server"""
+
+    def __init__(self, name, game, server, interval_ms=PUBLISH_MS):
+        self.name = name
+        self.game = game
+        self.server = server
+        self.stream = STREAMS[name](game.engine)
+        self.seq = 0
+        game.scheduler.every("spectate", interval_ms, self.publish, persistent=True)
+
+    def close(self):
+        """Stop publishing and shut the server down, freeing its port"""
+        self.game.scheduler.cancel("spectate")
+        self.server.close()
+        atexit.unregister(self.server.close)
+
+    def publish(self):
+        if not self.server.clients:
+            return
+        if self.server.keyframe_wanted.is_set():
+            self.server.keyframe_wanted.clear()
+            self.send('keyframe', self.stream.keyframe())
+            return
+        delta = self.stream.delta()
+        if delta is not None:
+            self.send('delta', delta)
+
+    def send(self, kind, state):
+        self.seq += 1
+        message = {'seq': self.seq, 'game': self.name, 'type': kind, **state}
+        line = json.dumps(message, separators=(',', ':')).encode() + b"\n"
+        self.server.submit(line, kind == 'keyframe')
+
+
+class _Client:
+    __slots__ = ('writer', 'lines', 'stale', 'task')
+
+    def __init__(self, writer, backlog):
+        self.writer = writer
+        self.lines = asyncio.Queue(backlog)
+        self.stale = False
+        self.task = asyncio.current_task()
+
+
+class SpectatorServer:
+    """asyncio TCP server on a background thread, fed through a thread-safe queue
+
+    ``submit`` is the only method the Tk thread calls. When the handoff
+    queue is full the line is dropped and counted, and spectators resync
+    from the next keyframe.
+    """
+
+    MAX_PENDING = 256
+    CLIENT_BACKLOG = 64
+
+    def __init__(self, host=DEFAULT_HOST, port=0):
+        self.host = host
+        self.port = port
+        self.pending = queue.Queue(self.MAX_PENDING)
+        self.keyframe_wanted = threading.Event()
+        self.clients = set()
+        self.dropped = 0
+
+        self.loop = None
+        self.wake = None
+        self.stopping = False
+        self.error = None
+        self.ready = threading.Event()
+        self.thread = threading.Thread(target=self.run, name=f"spectate:{port}", daemon=True)
+
+    def start(self):
+        """Start serving; raises OSError if the address cannot be bound"""
+        self.thread.start()
+        self.ready.wait(5)
+        if self.error is not None:
+            raise self.error
+
+    def submit(self, line, keyframe=False):
+        try:
+            self.pending.put_nowait((line, keyframe))
+        except queue.Full:
+            self.dropped += 1
+            self.keyframe_wanted.set()
+            return
+        self.loop.call_soon_threadsafe(self.wake.set)
+
+    def run(self):
+        try:
+            asyncio.run(self.serve())
+        except OSError as error:
+            self.error = error
+            self.ready.set()
+
+    async def serve(self):
+        self.wake = asyncio.Event()
+        server = await asyncio.start_server(self.connected, self.host, self.port)
+        self.loop = asyncio.get_running_loop()
+        self.port = server.sockets[0].getsockname()[1]
+        self.ready.set()
+        async with server:
+            await self.pump()
+
+            # Since 3.12 leaving the block waits for open connections, so end
+            # every handler first; each one closes its spectator's socket
+            server.close()
+            tasks = [client.task for client in self.clients]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def pump(self):
+        """Move lines from the handoff queue to each spectator's own queue until stopped"""
+        while not self.stopping:
+            await self.wake.wait()
+            self.wake.clear()
+            while not self.stopping:
+                try:
+                    line, keyframe = self.pending.get_nowait()
+                except queue.Empty:
+                    break
+                self.broadcast(line, keyframe)
+
+    def stop(self):
+        """Runs on the server's loop: make ``pump`` return"""
+        self.stopping = True
+        self.wake.set()
+
+    def broadcast(self, line, keyframe):
+        for client in self.clients:
+            if client.lines.full():
+                # Too slow: it skips ahead to a keyframe once it has caught up
+                client.stale = True
+            elif keyframe or not client.stale:
+                client.lines.put_nowait(line)
+                client.stale = False
+            else:
+                self.keyframe_wanted.set()
+
+    async def connected(self, reader, writer):
+        client = _Client(writer, self.CLIENT_BACKLOG)
+        client.stale = True  # Nothing makes sense before the first keyframe
+        self.clients.add(client)
+        self.keyframe_wanted.set()
+        try:
+            while True:
+                line = await client.lines.get()
+                writer.write(line)
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass  # Gone, or the server is shutting down
+        finally:
+            self.clients.discard(client)
+            writer.close()
+
+    def close(self):
+        """Disconnect every spectator and stop the server thread"""
+        if self.loop is None or not self.thread.is_alive():
+            return
+        try:
+            # Not through ``pending``, which may be full
+            self.loop.call_soon_threadsafe(self.stop)
+        except RuntimeError:
+            return  # The loop has already finished
+        self.thread.join(timeout=2)
+
+
+async def watch(host, port, limit):
+    reader, writer = await asyncio.open_connection(host, port)
+    count = 0
+    while limit is None or count < limit:
+        line = await reader.readline()
+        if not line:
+            break
+        sys.stdout.write(line.decode())
+        count += 1
+    writer.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m gamekit.spectate",
+                                     description="Print the state deltas a game streams to spectators")
+    parser.add_argument('address', help="[host:]port the game was started with in GAMEKIT_SPECTATE")
+    parser.add_argument('-n', dest='limit', type=int, help="stop after this many messages")
+    args = parser.parse_args(argv)
+    host, port = parse_address(args.address)
+    try:
+        asyncio.run(watch(host, port, args.limit))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,196 @@
+"""Run an automated agent over many seeded episodes in a process pool
+
+``python -m gamekit.tournament snake --seeds 1000`` plays one episode per
+seed on the headless engine, spreads the episodes over a
+``concurrent.futures`` process pool, and prints running score, length and
+time-per-step statistics as results come back. See ``gamekit.agents`` for
+the agent interface.
+"""
+
+import argparse
+import importlib
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from gamekit.agents import DEFAULT_AGENTS, agent_rng
+from gamekit.engines import ENGINES
+
+# Games an agent can play to the end without a clock driving it
+GAMES = tuple(DEFAULT_AGENTS)
+
+MAX_STEPS = 20000
+
+
+def load_agent(spec):
+    """Resolve a ``"module:function"`` agent spec"""
+    module_name, _, name = spec.partition(':')
+    if not name:
+        raise ValueError(f"agent {spec!r} is not of the form module:function")
+    return getattr(importlib.import_module(module_name), name)
+
+
+def episode_score(engine):
+    """Final score of an episode
+
+    Minesweeper scores the cells revealed and Wordle the guesses left
+    over on a win, since neither keeps a score of its own.
+    """
+    if hasattr(engine, 'score'):
+        return engine.score
+    if hasattr(engine, 'revealed'):
+        return len(engine.revealed)
+    return engine.MAX_GUESSES - engine.current_row if engine.won else 0
+
+
+def run_episode(game, agent, seed, max_steps=MAX_STEPS):
+    """Play one episode; returns a dict with seed, score, steps, seconds and won"""
+    engine = ENGINES[game](seed=seed)
+    rng = agent_rng(seed)
+    step = engine.step
+    steps = 0
+
+    start = time.perf_counter()
+    while not engine.done and steps < max_steps:
+        step(agent(engine, rng))
+        steps += 1
+    elapsed = time.perf_counter() - start
+
+    return {
+        'seed': seed,
+        'score': episode_score(engine),
+        'steps': steps,
+        'seconds': elapsed,
+        'won': bool(getattr(engine, 'won', False)),
+    }
+
+
+def run_batch(game, agent_spec, seeds, max_steps):
+    """Worker entry point: play a batch of seeds with an agent loaded by spec"""
+    agent = load_agent(agent_spec)
+    return [run_episode(game, agent, seed, max_steps) for seed in seeds]
+
+
+class Stats:
+    """Running totals over finished episodes"""
+
+    def __init__(self):
+        self.episodes = 0
+        self.wins = 0
+        self.steps = 0
+        self.seconds = 0.0
+        self.score_mean = 0.0
+        self.score_m2 = 0.0  # Sum of squared deviations (Welford)
+        self.score_min = None
+        self.score_max = None
+
+    def add(self, result):
+        self.episodes += 1
+        self.wins += result['won']
+        self.steps += result['steps']
+        self.seconds += result['seconds']
+
+        score = result['score']
+        delta = score - self.score_mean
+        self.score_mean += delta / self.episodes
+        self.score_m2 += delta * (score - self.score_mean)
+        self.score_min = score if self.score_min is None else min(self.score_min, score)
+        self.score_max = score if self.score_max is None else max(self.score_max, score)
+
+    @property
+    def score_stdev(self):
+        return math.sqrt(self.score_m2 / (self.episodes - 1)) if self.episodes > 1 else 0.0
+
+    def summary(self, total=None):
+        if not self.episodes:
+            return "no episodes"
+        count = f"{self.episodes}/{total}" if total else str(self.episodes)
+        us_per_step = self.seconds / self.steps * 1e6 if self.steps else 0.0
+        return (
+            f"{count} episodes  "
+            f"score {self.score_mean:.2f} +/- {self.score_stdev:.2f} "
+            f"[{self.score_min}, {self.score_max}]  "
+            f"length {self.steps / self.episodes:.1f}  "
+            f"{us_per_step:.1f} us/step  "
+            f"wins {self.wins / self.episodes:.1%}"
+        )
+
+
+def run_tournament(game, agent_spec, seeds, workers=None, max_steps=MAX_STEPS, on_result=None):
+    """Play one episode per seed and return the aggregated Stats
+
+    ``workers=0`` plays everything in this process. ``on_result`` is
+    called with each result dict and the running Stats as they arrive.
+    """
+    if game not in GAMES:
+        raise ValueError(f"no agent support for {game!r}; choose from {', '.join(GAMES)}")
+    seeds = list(seeds)
+    stats = Stats()
+
+    def collect(results):
+        for result in results:
+            stats.add(result)
+            if on_result is not None:
+                on_result(result, stats)
+
+    if workers == 0:
+        agent = load_agent(agent_spec)
+        for seed in seeds:
+            collect([run_episode(game, agent, seed, max_steps)])
+        return stats
+
+    # Several seeds per task keep short episodes from drowning in pickling overhead
+    workers = workers or os.cpu_count() or 1
+    chunk = max(1, len(seeds) // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(run_batch, game, agent_spec, seeds[i:i + chunk], max_steps)
+            for i in range(0, len(seeds), chunk)
+        ]
+        for future in as_completed(futures):
+            collect(future.result())
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m gamekit.tournament",
+                                     description="Evaluate an agent over many seeded episodes")
+    parser.add_argument('game', choices=GAMES)
+    parser.add_argument('--agent', help="agent as module:function (default: a built-in one for the game)")
+    parser.add_argument('--seeds', type=int, default=100, help="number of episodes, seeded 0..N-1")
+    parser.add_argument('--first-seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None,
+                        help="worker processes (default: one per CPU, 0: no pool)")
+    parser.add_argument('--max-steps', type=int, default=MAX_STEPS, help="cut episodes off after this many steps")
+    parser.add_argument('--interval', type=float, default=0.5, help="seconds between progress lines")
+    args = parser.parse_args(argv)
+
+    agent_spec = args.agent or DEFAULT_AGENTS[args.game]
+    print(f"{args.game}: {agent_spec} over {args.seeds} seeds")
+
+    last_print = [time.perf_counter()]
+
+    def progress(result, stats):
+        now = time.perf_counter()
+        if now - last_print[0] >= args.interval:
+            last_print[0] = now
+            print("  " + stats.summary(args.seeds), flush=True)
+
+    start = time.perf_counter()
+    stats = run_tournament(
+        args.game,
+        agent_spec,
+        range(args.first_seed, args.first_seed + args.seeds),
+        workers=args.workers,
+        max_steps=args.max_steps,
+        on_result=progress,
+    )
+    print(stats.summary(args.seeds))
+    print(f"wall time {time.perf_counter() - start:.2f} s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
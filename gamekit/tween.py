@@ -0,0 +1,164 @@
+"""Menu bobbing and color fades driven by one scheduler task
+
+The start, win and game-over screens all bob their text up and down and
+fade it in from black. A Tweens object runs every such animation of a
+window in one ``"tweens"`` scheduler task. Offsets come from a
+precomputed sine table and are applied with one ``canvas.move`` per tag,
+so a whole menu moves with a single call, and only when its rounded
+offset changes. Fades step through ``resources.ramp`` colors along a
+precomputed easing table and only reconfigure items whose color changed.
+"""
+
+import math
+import tkinter as tk
+
+from gamekit.resources import FADE_STEPS, ramp
+
+TICK_MS = 20
+
+# One bob period: the old 0.08 rad per 30 ms step
+BOB_PERIOD_MS = 2356
+WAVE_STEPS = 64
+
+EASE_STEPS = 64
+EASINGS = {
+    'linear': tuple(i / EASE_STEPS for i in range(EASE_STEPS + 1)),
+    'ease_out': tuple(1 - (1 - i / EASE_STEPS) ** 2 for i in range(EASE_STEPS + 1)),
+    'ease_in_out': tuple((1 - math.cos(math.pi * i / EASE_STEPS)) / 2 for i in range(EASE_STEPS + 1)),
+}
+
+_waves = {}
+
+
+def wave(amplitude):
+    """Whole-pixel offsets of one sine period at ``amplitude``, built once"""
+    offsets = _waves.get(amplitude)
+    if offsets is None:
+        offsets = _waves[amplitude] = tuple(
+            round(math.sin(2 * math.pi * i / WAVE_STEPS) * amplitude) for i in range(WAVE_STEPS)
+        )
+    return offsets
+
+
+class _Bob:
+    __slots__ = ('canvas', 'tag', 'offsets', 'period', 'phase', 'elapsed', 'offset')
+
+    def __init__(self, canvas, tag, amplitude, period_ms, phase):
+        self.canvas = canvas
+        self.tag = tag
+        self.offsets = wave(amplitude)
+        self.period = period_ms
+        self.phase = phase
+        self.elapsed = 0
+        self.offset = 0
+
+    def step(self, ms):
+        self.elapsed += ms
+        index = int((self.elapsed / self.period + self.phase) * WAVE_STEPS) % WAVE_STEPS
+        offset = self.offsets[index]
+        if offset != self.offset:
+            self.canvas.move(self.tag, 0, offset - self.offset)
+            self.offset = offset
+        return False
+
+    def stop(self):
+        """Put the items back where they rest"""
+        if self.offset:
+            self.canvas.move(self.tag, 0, -self.offset)
+            self.offset = 0
+
+
+class _Fade:
+    __slots__ = ('canvas', 'ramps', 'shown', 'easing', 'duration', 'elapsed')
+
+    def __init__(self, canvas, colors, duration_ms, easing, background):
+        self.canvas = canvas
+        self.ramps = {item: ramp(background, color, FADE_STEPS + 1) for item, color in colors.items()}
+        self.shown = dict.fromkeys(self.ramps)
+        self.easing = EASINGS[easing]
+        self.duration = duration_ms
+        self.elapsed = 0
+
+    def step(self, ms):
+        self.elapsed += ms
+        progress = min(1.0, self.elapsed / self.duration)
+        index = round(self.easing[round(progress * EASE_STEPS)] * FADE_STEPS)
+        for item, colors in self.ramps.items():
+            if self.shown[item] != index:
+                self.canvas.itemconfig(item, fill=colors[index])
+                self.shown[item] = index
+        return progress >= 1.0
+
+    def stop(self):
+        """Jump to the final colors"""
+        self.elapsed = self.duration
+        self.step(0)
+
+
+class Tweens:
+    """The running tweens of one window, advanced together every TICK_MS
+
+    Tweens are keyed: starting one under a key that is already running
+    replaces it. Finished fades remove themselves, and the scheduler task
+    stops when nothing is left. Stopping a tween settles it: bobbing items
+    go back to where they rest and fades jump to their final colors, so a
+    screen that is hidden and shown again starts from the same place.
+    """
+
+    def __init__(self, scheduler, name="tweens"):
+        self.scheduler = scheduler
+        self.name = name
+        self.active = {}  # key -> tween
+
+    def bob(self, canvas, tag, amplitude, period_ms=BOB_PERIOD_MS, phase=0.0):
+        """Bob every item tagged ``tag`` up and down; ``phase`` is a fraction of the period"""
+        self.add(tag, _Bob(canvas, tag, amplitude, period_ms, phase))
+
+    def fade_in(self, canvas, colors, duration_ms=400, easing='linear', background="#000000", key="fade"):
+        """Fade items in from ``background``; ``colors`` maps each item to its final fill"""
+        self.add(key, _Fade(canvas, colors, duration_ms, easing, background))
+
+    def add(self, key, tween):
+        if not self.scheduler.is_active(self.name):
+            # The task was cancelled from outside, e.g. with cancel_all()
+            self.stop_all()
+            self.scheduler.every(self.name, TICK_MS, self.tick)
+        self.cancel(key)
+        self.active[key] = tween
+        # Show the first step now, so nothing flashes at its final state
+        self.advance(key, tween, 0)
+
+    def cancel(self, key):
+        tween = self.active.pop(key, None)
+        if tween is not None:
+            self.settle(tween)
+
+    def clear(self):
+        """Stop every tween, e.g. when the game starts"""
+        self.stop_all()
+        self.scheduler.cancel(self.name)
+
+    def stop_all(self):
+        for tween in self.active.values():
+            self.settle(tween)
+        self.active.clear()
+
+    def settle(self, tween):
+        try:
+            tween.stop()
+        except tk.TclError:
+            pass  # Its canvas was destroyed
+
+    def tick(self):
+        for key, tween in list(self.active.items()):
+            self.advance(key, tween, TICK_MS)
+        if not self.active:
+            self.scheduler.cancel(self.name)
+
+    def advance(self, key, tween, ms):
+        try:
+            done = tween.step(ms)
+        except tk.TclError:
+            done = True  # Its canvas was destroyed
+        if done and self.active.get(key) is tween:
+            del self.active[key]
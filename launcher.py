@@ -0,0 +1,224 @@
+import argparse
+import sys
+import time
+import tkinter as tk
+
+from gamekit.catalog import GAMES, load_game_class
+from gamekit.resources import font
+
+
+class GameFrame(tk.Frame):
+    """Frame that stands in for the Tk root a game expects
+
+    Window calls (title, resizable, iconify) go to the launcher window, key
+    bindings are made on the window and removed again when the game closes,
+    and destroy() returns to the launcher instead of quitting.
+    """
+
+    def __init__(self, launcher):
+        super().__init__(launcher.root)
+        self.launcher = launcher
+        self.window = launcher.root
+        self.bound = set()
+
+    def title(self, text):
+        self.window.title(text)
+
+    def resizable(self, width, height):
+        self.window.resizable(width, height)
+
+    def iconify(self):
+        self.window.iconify()
+
+    def bind(self, sequence=None, func=None, add=None):
+        """Bind on the window so keys reach the game wherever the focus is"""
+        self.bound.add(sequence)
+        return self.window.bind(sequence, func, add)
+
+    def destroy(self):
+        """Games close themselves with root.destroy(); go back to the menu instead"""
+        if self.launcher.game_frame is self:
+            self.launcher.close_game()
+        else:
+            self.dispose()
+
+    def dispose(self):
+        """Remove the game's window bindings and really destroy the frame"""
+        for sequence in self.bound:
+            self.window.unbind(sequence)
+        self.bound = set()
+        tk.Frame.destroy(self)
+
+
+class Launcher:
+    def __init__(self, root, budget_ms=500):
+        self.root = root
+        self.root.title("pygames")
+        self.root.resizable(False, False)
+        self.root.protocol("WM_DELETE_WINDOW", self.quit)
+
+        # Colors matching the games
+        self.BG_COLOR = "#1a1a2e"
+        self.BUTTON_COLOR = "#16213e"
+        self.ACCENT_COLOR = "#00ff41"
+        self.TEXT_COLOR = "#ffffff"
+        self.OVER_BUDGET_COLOR = "#ff4757"
+
+        # Startup budget per game, from click to first painted frame
+        self.budget_ms = budget_ms
+        self.startup_times = {}  # name -> (total, import, build, paint) in ms
+
+        self.game = None
+        self.game_frame = None
+        self.quitting = False
+
+        self.build_menu()
+        self.root.bind('<Control-w>', lambda e: self.close_game())  # Back to the menu
+
+    def build_menu(self):
+        """Create the game picker"""
+        self.menu = tk.Frame(self.root, bg=self.BG_COLOR, padx=40, pady=30)
+
+        tk.Label(
+            self.menu,
+            text="PYGAMES",
+            font=font("Arial", 28, "bold"),
+            fg=self.ACCENT_COLOR,
+            bg=self.BG_COLOR
+        ).pack(pady=(0, 20))
+
+        for name in GAMES:
+            tk.Button(
+                self.menu,
+                text=name.upper(),
+                font=font("Arial", 12, "bold"),
+                width=20,
+                fg=self.TEXT_COLOR,
+                bg=self.BUTTON_COLOR,
+                activebackground=self.ACCENT_COLOR,
+                activeforeground=self.BG_COLOR,
+                relief=tk.FLAT,
+                cursor="hand2",
+                command=lambda n=name: self.open_game(n)
+            ).pack(pady=4)
+
+        self.status_label = tk.Label(
+            self.menu,
+            text=f"Ctrl+W returns here - startup budget {self.budget_ms} ms",
+            font=font("Arial", 9),
+            fg="#888888",
+            bg=self.BG_COLOR,
+            justify=tk.LEFT
+        )
+        self.status_label.pack(pady=(20, 0))
+
+        self.menu.pack()
+
+    def open_game(self, name):
+        """Load a game on first use and show it in place of the menu"""
+        self.close_game(show_menu=False)
+        self.menu.pack_forget()
+
+        start = time.perf_counter()
+        game_class = load_game_class(name)
+        imported = time.perf_counter()
+
+        frame = GameFrame(self)
+        try:
+            game = game_class(frame)
+        except Exception:
+            # Nothing half-built may linger, or the next close_game trips on it
+            frame.dispose()
+            self.menu.pack()
+            raise
+        self.game_frame = frame
+        self.game = game
+        self.game_frame.pack()
+        self.root.geometry("")  # Fit the window to the new game
+        built = time.perf_counter()
+
+        # Tk paints when idle; flushing that is the first visible frame
+        self.root.update_idletasks()
+        painted = time.perf_counter()
+
+        self.report_startup(name, start, imported, built, painted)
+
+    def report_startup(self, name, start, imported, built, painted):
+        times = tuple(round(ms * 1000, 1) for ms in (
+            painted - start, imported - start, built - imported, painted - built
+        ))
+        self.startup_times[name] = times
+
+        over = times[0] > self.budget_ms
+        print(
+            f"{name}: first frame in {times[0]:.0f} ms "
+            f"(import {times[1]:.0f}, build {times[2]:.0f}, paint {times[3]:.0f})"
+            + (f" - over the {self.budget_ms} ms budget" if over else "")
+        )
+        self.status_label.config(
+            text=f"{name}: first frame in {times[0]:.0f} ms (budget {self.budget_ms} ms)",
+            fg=self.OVER_BUDGET_COLOR if over else "#888888"
+        )
+
+    def close_game(self, show_menu=True):
+        """Stop the running game and go back to the menu"""
+        if self.game_frame is None:
+            return
+        game, frame = self.game, self.game_frame
+        self.game = None
+        self.game_frame = None
+
+        # Timers live in the shared interpreter, so stop them before the widgets go
+        game.scheduler.stop()
+        game.instrument.stop_export()
+        game.instrument.profiler.stop()  # Ends an F5 capture, so tracemalloc stops tracing
+        if game.recorder is not None:
+            game.recorder.close()
+        if game.events is not None:
+            game.events.close()  # Stops its writer thread and closes the log
+        if game.spectators is not None:
+            game.spectators.close()  # Frees the port for the next game
+        frame.dispose()
+
+        if show_menu and not self.quitting:
+            self.root.title("pygames")
+            self.menu.pack()
+            self.root.geometry("")
+
+    def quit(self):
+        self.quitting = True
+        self.close_game()
+        self.root.destroy()
+
+    def check_budget(self):
+        """Open every game once and return the names that missed the budget"""
+        for name in GAMES:
+            self.open_game(name)
+            self.close_game()
+        return [name for name, times in self.startup_times.items() if times[0] > self.budget_ms]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play all the games from one window")
+    parser.add_argument('game', nargs='?', choices=list(GAMES), help="open this game right away")
+    parser.add_argument('--budget', type=float, default=500, help="time-to-first-frame budget in ms")
+    parser.add_argument('--check', action='store_true',
+                        help="open every game once, report startup times and exit")
+    args = parser.parse_args(argv)
+
+    root = tk.Tk()
+    launcher = Launcher(root, budget_ms=args.budget)
+
+    if args.check:
+        slow = launcher.check_budget()
+        launcher.quit()
+        return 1 if slow else 0
+
+    if args.game:
+        launcher.open_game(args.game)
+    root.mainloop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
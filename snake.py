@@ -1,455 +1,392 @@
-import tkinter as tk
-import random
-from collections import deque
-import math
-
-class SnakeGame:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("snake")
-        self.root.resizable(False, False)
-        
-        # Game constants
-        self.GRID_SIZE = 20
-        self.CELL_SIZE = 25
-        self.WIDTH = self.GRID_SIZE * self.CELL_SIZE
-        self.HEIGHT = self.GRID_SIZE * self.CELL_SIZE
-        self.GAME_SPEED = 100  # milliseconds
-        
-        # Colors
-        self.BG_COLOR = "#1a1a2e"
-        self.SNAKE_COLOR = "#00ff41"
-        self.SNAKE_HEAD_COLOR = "#00cc33"
-        self.FOOD_COLOR = "#ff4757"
-        self.GRID_COLOR = "#16213e"
-        self.TEXT_COLOR = "#ffffff"
-        
-        # Canvas setup
-        self.canvas = tk.Canvas(
-            root, 
-            width=self.WIDTH, 
-            height=self.HEIGHT,
-            bg=self.BG_COLOR,
-            highlightthickness=0
-        )
-        self.canvas.pack(padx=10, pady=10)
-        
-        # Score display
-        self.score_label = tk.Label(
-            root,
-            text="SCORE: 0",
-            font=("Arial", 14, "bold"),
-            fg=self.TEXT_COLOR,
-            bg=self.BG_COLOR
-        )
-        self.score_label.pack()
-        
-        # Watermark (clickable)
-        self.watermark_label = tk.Label(
-            root,
-            text="spidrbot.com",
-            font=("Arial", 9),
-            fg="#888888",
-            bg=self.BG_COLOR,
-            cursor="hand2"
-        )
-        self.watermark_label.pack(pady=(5, 5))
-        self.watermark_label.bind("<Button-1>", self.open_website)
-        
-        # Game state
-        self.snake = deque()
-        self.direction = None
-        self.next_direction = None
-        self.food = None
-        self.score = 0
-        self.game_over = False
-        self.game_started = False
-        
-        # Input queue for responsive controls
-        self.direction_queue = deque(maxlen=3)
-        
-        # Animation state
-        self.food_pulse = 0
-        self.food_pulse_direction = 1
-        self.menu_bob = 0
-        self.menu_animation_running = False
-        self.fade_progress = 0
-        self.is_fading = False
-        self.input_blocked = False
-        
-        # Menu text elements
-        self.title_text = None
-        self.subtitle_text = None
-        self.instruction_text = None
-        
-        # Key bindings - using both arrow keys and WASD
-        self.root.bind('<Up>', lambda e: self.queue_direction('UP'))
-        self.root.bind('<Down>', lambda e: self.queue_direction('DOWN'))
-        self.root.bind('<Left>', lambda e: self.queue_direction('LEFT'))
-        self.root.bind('<Right>', lambda e: self.queue_direction('RIGHT'))
-        self.root.bind('w', lambda e: self.queue_direction('UP'))
-        self.root.bind('s', lambda e: self.queue_direction('DOWN'))
-        self.root.bind('a', lambda e: self.queue_direction('LEFT'))
-        self.root.bind('d', lambda e: self.queue_direction('RIGHT'))
-        self.root.bind('<Escape>', lambda e: self.root.iconify())  # Minimize on ESC
-        self.root.bind('<space>', lambda e: self.root.destroy())  # Close on SPACE
-        
-        self.draw_grid()
-        self.show_start_screen()
-        self.animate_menu()
-    
-    def open_website(self, event):
-        """Open spidrbot.com in browser"""
-        import webbrowser
-        webbrowser.open("https://spidrbot.com")
-    
-    def draw_grid(self):
-        """Draw subtle grid lines"""
-        for i in range(self.GRID_SIZE + 1):
-            # Vertical lines
-            x = i * self.CELL_SIZE
-            self.canvas.create_line(
-                x, 0, x, self.HEIGHT,
-                fill=self.GRID_COLOR,
-                width=1
-            )
-            # Horizontal lines
-            y = i * self.CELL_SIZE
-            self.canvas.create_line(
-                0, y, self.WIDTH, y,
-                fill=self.GRID_COLOR,
-                width=1
-            )
-    
-    def show_start_screen(self):
-        """Display start screen"""
-        self.menu_animation_running = True
-        self.canvas.delete("game")
-        self.canvas.delete("start")
-        
-        # Title (will be animated)
-        self.title_text = self.canvas.create_text(
-            self.WIDTH // 2,
-            self.HEIGHT // 2 - 50,
-            text="SNAKE",
-            font=("Arial", 28, "bold"),
-            fill=self.SNAKE_COLOR,
-            tags="start"
-        )
-        
-        # Subtitle (will also bob)
-        self.subtitle_text = self.canvas.create_text(
-            self.WIDTH // 2,
-            self.HEIGHT // 2 + 10,
-            text="Use Arrow Keys or WASD to move",
-            font=("Arial", 11),
-            fill=self.TEXT_COLOR,
-            tags="start"
-        )
-        
-        # Instructions (will also bob)
-        self.instruction_text = self.canvas.create_text(
-            self.WIDTH // 2,
-            self.HEIGHT // 2 + 35,
-            text="Press any direction key to start",
-            font=("Arial", 11),
-            fill="#888888",
-            tags="start"
-        )
-    
-    def animate_menu(self):
-        """Animate the main menu with smooth bobbing"""
-        if self.menu_animation_running:
-            # Create smooth bobbing motion using sine wave
-            self.menu_bob += 0.08
-            offset = math.sin(self.menu_bob) * 8
-            
-            # Move all menu text elements together
-            try:
-                self.canvas.coords(
-                    self.title_text,
-                    self.WIDTH // 2,
-                    self.HEIGHT // 2 - 50 + offset
-                )
-                self.canvas.coords(
-                    self.subtitle_text,
-                    self.WIDTH // 2,
-                    self.HEIGHT // 2 + 10 + offset
-                )
-                self.canvas.coords(
-                    self.instruction_text,
-                    self.WIDTH // 2,
-                    self.HEIGHT // 2 + 35 + offset
-                )
-            except:
-                pass
-            
-            self.root.after(30, self.animate_menu)
-    
-    def animate_fade_in(self):
-        """Smooth fade-in animation for menu after death"""
-        if self.is_fading and self.fade_progress < 1.0:
-            self.fade_progress += 0.05
-            
-            # Calculate alpha-like effect by adjusting colors
-            # Start from dark and fade to full brightness
-            alpha = self.fade_progress
-            
-            # Update title color
-            green_val = int(255 * alpha)
-            title_color = f"#{0:02x}{green_val:02x}{int(65 * alpha):02x}"
-            
-            # Update text colors
-            text_brightness = int(255 * alpha)
-            text_color = f"#{text_brightness:02x}{text_brightness:02x}{text_brightness:02x}"
-            
-            gray_brightness = int(136 * alpha)
-            gray_color = f"#{gray_brightness:02x}{gray_brightness:02x}{gray_brightness:02x}"
-            
-            try:
-                self.canvas.itemconfig(self.title_text, fill=title_color)
-                self.canvas.itemconfig(self.subtitle_text, fill=text_color)
-                self.canvas.itemconfig(self.instruction_text, fill=gray_color)
-            except:
-                pass
-            
-            self.root.after(20, self.animate_fade_in)
-        else:
-            self.is_fading = False
-            # Reset to final colors
-            try:
-                self.canvas.itemconfig(self.title_text, fill=self.SNAKE_COLOR)
-                self.canvas.itemconfig(self.subtitle_text, fill=self.TEXT_COLOR)
-                self.canvas.itemconfig(self.instruction_text, fill="#888888")
-            except:
-                pass
-    
-    def queue_direction(self, new_direction):
-        """Queue direction changes for responsive input"""
-        # Block input if disabled
-        if self.input_blocked:
-            return
-            
-        if not self.game_started:
-            self.start_game()
-            self.direction_queue.append(new_direction)
-            return
-        
-        if self.game_over:
-            return
-        
-        # Get the last direction in queue or current direction
-        last_dir = self.direction_queue[-1] if self.direction_queue else self.direction
-        
-        # Prevent 180-degree turns
-        opposite = {
-            'UP': 'DOWN', 'DOWN': 'UP',
-            'LEFT': 'RIGHT', 'RIGHT': 'LEFT'
-        }
-        
-        if last_dir and new_direction == opposite.get(last_dir):
-            return
-        
-        # Only queue if different from last queued direction
-        if not self.direction_queue or new_direction != self.direction_queue[-1]:
-            self.direction_queue.append(new_direction)
-    
-    def start_game(self):
-        """Initialize game state"""
-        self.menu_animation_running = False
-        self.canvas.delete("start")
-        self.game_started = True
-        self.game_over = False
-        self.score = 0
-        self.direction = None
-        self.direction_queue.clear()
-        
-        # Initialize snake in center
-        center = self.GRID_SIZE // 2
-        self.snake = deque([
-            (center, center),
-            (center, center + 1),
-            (center, center + 2)
-        ])
-        
-        self.spawn_food()
-        self.update_score()
-        self.game_loop()
-    
-    def spawn_food(self):
-        """Spawn food at random empty location"""
-        while True:
-            x = random.randint(0, self.GRID_SIZE - 1)
-            y = random.randint(0, self.GRID_SIZE - 1)
-            if (x, y) not in self.snake:
-                self.food = (x, y)
-                break
-    
-    def game_loop(self):
-        """Main game loop"""
-        if self.game_over:
-            return
-        
-        # Process next direction from queue
-        if self.direction_queue:
-            self.next_direction = self.direction_queue.popleft()
-            
-            # Validate direction change
-            opposite = {
-                'UP': 'DOWN', 'DOWN': 'UP',
-                'LEFT': 'RIGHT', 'RIGHT': 'LEFT'
-            }
-            if not self.direction or self.next_direction != opposite.get(self.direction):
-                self.direction = self.next_direction
-        
-        if self.direction:
-            self.move_snake()
-            self.check_collision()
-            self.check_food()
-        
-        self.draw()
-        self.root.after(self.GAME_SPEED, self.game_loop)
-    
-    def move_snake(self):
-        """Move snake in current direction"""
-        head_x, head_y = self.snake[0]
-        
-        if self.direction == 'UP':
-            head_y -= 1
-        elif self.direction == 'DOWN':
-            head_y += 1
-        elif self.direction == 'LEFT':
-            head_x -= 1
-        elif self.direction == 'RIGHT':
-            head_x += 1
-        
-        self.snake.appendleft((head_x, head_y))
-        self.snake.pop()
-    
-    def check_collision(self):
-        """Check for collisions with walls or self"""
-        head_x, head_y = self.snake[0]
-        
-        # Wall collision
-        if head_x < 0 or head_x >= self.GRID_SIZE or head_y < 0 or head_y >= self.GRID_SIZE:
-            self.end_game()
-            return
-        
-        # Self collision
-        if self.snake[0] in list(self.snake)[1:]:
-            self.end_game()
-            return
-    
-    def check_food(self):
-        """Check if snake ate food"""
-        if self.snake[0] == self.food:
-            self.score += 1
-            self.update_score()
-            
-            # Grow snake
-            tail = self.snake[-1]
-            self.snake.append(tail)
-            
-            self.spawn_food()
-    
-    def draw(self):
-        """Draw everything on canvas"""
-        self.canvas.delete("game")
-        
-        # Animate food pulse
-        self.food_pulse += self.food_pulse_direction * 0.3
-        if self.food_pulse > 3:
-            self.food_pulse_direction = -1
-        elif self.food_pulse < 0:
-            self.food_pulse_direction = 1
-        
-        # Draw food with pulsing animation
-        if self.food:
-            fx, fy = self.food
-            pulse_offset = int(self.food_pulse)
-            self.canvas.create_oval(
-                fx * self.CELL_SIZE + 3 + pulse_offset,
-                fy * self.CELL_SIZE + 3 + pulse_offset,
-                (fx + 1) * self.CELL_SIZE - 3 - pulse_offset,
-                (fy + 1) * self.CELL_SIZE - 3 - pulse_offset,
-                fill=self.FOOD_COLOR,
-                outline="",
-                tags="game"
-            )
-        
-        # Draw snake with rounded effect
-        for i, (x, y) in enumerate(self.snake):
-            color = self.SNAKE_HEAD_COLOR if i == 0 else self.SNAKE_COLOR
-            offset = 1 if i == 0 else 2
-            self.canvas.create_rectangle(
-                x * self.CELL_SIZE + offset,
-                y * self.CELL_SIZE + offset,
-                (x + 1) * self.CELL_SIZE - offset,
-                (y + 1) * self.CELL_SIZE - offset,
-                fill=color,
-                outline="",
-                tags="game"
-            )
-            
-            # Add eye to head
-            if i == 0:
-                # Determine eye position based on direction
-                eye_offset = 8
-                if self.direction == 'UP':
-                    eye_y = y * self.CELL_SIZE + 7
-                    eye_x1 = x * self.CELL_SIZE + 7
-                    eye_x2 = x * self.CELL_SIZE + 16
-                elif self.direction == 'DOWN':
-                    eye_y = (y + 1) * self.CELL_SIZE - 7
-                    eye_x1 = x * self.CELL_SIZE + 7
-                    eye_x2 = x * self.CELL_SIZE + 16
-                elif self.direction == 'LEFT':
-                    eye_x = x * self.CELL_SIZE + 7
-                    eye_y1 = y * self.CELL_SIZE + 7
-                    eye_y2 = y * self.CELL_SIZE + 16
-                elif self.direction == 'RIGHT':
-                    eye_x = (x + 1) * self.CELL_SIZE - 7
-                    eye_y1 = y * self.CELL_SIZE + 7
-                    eye_y2 = y * self.CELL_SIZE + 16
-                else:
-                    # Default right-facing eyes
-                    eye_x = (x + 1) * self.CELL_SIZE - 7
-                    eye_y1 = y * self.CELL_SIZE + 7
-                    eye_y2 = y * self.CELL_SIZE + 16
-                
-                # Draw eyes
-                if self.direction in ['UP', 'DOWN']:
-                    self.canvas.create_oval(eye_x1, eye_y, eye_x1 + 3, eye_y + 3,
-                                           fill="#000000", outline="", tags="game")
-                    self.canvas.create_oval(eye_x2, eye_y, eye_x2 + 3, eye_y + 3,
-                                           fill="#000000", outline="", tags="game")
-                else:
-                    self.canvas.create_oval(eye_x, eye_y1, eye_x + 3, eye_y1 + 3,
-                                           fill="#000000", outline="", tags="game")
-                    self.canvas.create_oval(eye_x, eye_y2, eye_x + 3, eye_y2 + 3,
-                                           fill="#000000", outline="", tags="game")
-    
-    def update_score(self):
-        """Update score display"""
-        self.score_label.config(text=f"SCORE: {self.score}")
-    
-    def end_game(self):
-        """Handle game over - smoothly fade in main menu"""
-        self.game_over = True
-        self.game_started = False
-        
-        # Block input for 0.5 seconds to prevent glitching
-        self.input_blocked = True
-        self.root.after(500, lambda: setattr(self, 'input_blocked', False))
-        
-        # Show menu immediately with fade-in animation
-        self.show_start_screen()
-        self.fade_progress = 0
-        self.is_fading = True
-        self.animate_fade_in()
-        self.animate_menu()
-
-if __name__ == "__main__":
-    root = tk.Tk()
-    game = SnakeGame(root)
-    root.mainloop()
+import os
+import tkinter as tk
+
+from gamekit.engines.snake import SnakeEngine
+from gamekit.events import event_log
+from gamekit.idle import IdleManager
+from gamekit.inputs import InputBuffer
+from gamekit.retained import RetainedCanvas
+from gamekit.instrument import Instrument
+from gamekit.replay import record_session, session_seed
+from gamekit.resources import font
+from gamekit.scenes import SceneManager
+from gamekit.scheduler import FrameScheduler
+from gamekit.spectate import spectate
+from gamekit.tween import Tweens
+
+def board_size(grid_size=None):
+    """``grid_size`` if given, else GAMEKIT_SNAKE_GRID as an int, else the default board"""
+    if grid_size is None:
+        value = os.environ.get("GAMEKIT_SNAKE_GRID")
+        grid_size = int(value) if value else SnakeGame.GRID_SIZE
+    if not SnakeGame.GRID_SIZE <= grid_size <= SnakeGame.MAX_GRID_SIZE:
+        raise ValueError(
+            f"Snake boards are {SnakeGame.GRID_SIZE} to {SnakeGame.MAX_GRID_SIZE} cells wide, not {grid_size}"
+        )
+    return grid_size
+
+class SnakeGame:
+    # Game constants; the canvas shows GRID_SIZE cells, and larger boards
+    # scroll under a camera that keeps the head CAMERA_MARGIN cells inside
+    GRID_SIZE = 20
+    MAX_GRID_SIZE = 2000
+    CAMERA_MARGIN = 5
+    CELL_SIZE = 25
+    WIDTH = GRID_SIZE * CELL_SIZE
+    HEIGHT = GRID_SIZE * CELL_SIZE
+    GAME_SPEED = 100  # milliseconds
+    
+    # Colors
+    BG_COLOR = "#1a1a2e"
+    SNAKE_COLOR = "#00ff41"
+    SNAKE_HEAD_COLOR = "#00cc33"
+    FOOD_COLOR = "#ff4757"
+    GRID_COLOR = "#16213e"
+    TEXT_COLOR = "#ffffff"
+    
+    # Drawing layers for game objects, bottom to top
+    LAYERS = ("food", "snake", "eyes")
+    
+    def __init__(self, root, seed=None, grid_size=None):
+        self.root = root
+        self.root.title("snake")
+        self.root.resizable(False, False)
+        
+        # Canvas setup
+        self.canvas = tk.Canvas(
+            root, 
+            width=self.WIDTH, 
+            height=self.HEIGHT,
+            bg=self.BG_COLOR,
+            highlightthickness=0
+        )
+        self.canvas.pack(padx=10, pady=10)
+        
+        # Score display
+        self.score_label = tk.Label(
+            root,
+            text="SCORE: 0",
+            font=font("Arial", 14, "bold"),
+            fg=self.TEXT_COLOR,
+            bg=self.BG_COLOR
+        )
+        self.score_label.pack()
+        
+        # Watermark (clickable)
+        self.watermark_label = tk.Label(
+            root,
+            text="spidrbot.com",
+            font=font("Arial", 9),
+            fg="#888888",
+            bg=self.BG_COLOR,
+            cursor="hand2"
+        )
+        self.watermark_label.pack(pady=(5, 5))
+        self.watermark_label.bind("<Button-1>", self.open_website)
+        
+        # Game state
+        self.engine = SnakeEngine(board_size(grid_size), seed=session_seed(seed))
+        self.recorder = record_session("snake", self.engine)  # Only when GAMEKIT_RECORD is set
+        self.events = event_log("snake", self.engine)  # Only when GAMEKIT_EVENTS is set
+        self.game_over = False
+        self.game_started = False
+        self.camera = (0, 0)  # Board cell at the view's top left
+        
+        # Animation state
+        self.food_pulse = 0
+        self.food_pulse_direction = 1
+        self.input_blocked = False
+        
+        # Menu text elements
+        self.title_text = None
+        self.subtitle_text = None
+        self.instruction_text = None
+        
+        self.draw_grid()
+        
+        # Game objects are drawn retained, above the grid and below menus
+        self.layer = RetainedCanvas(self.canvas, layers=self.LAYERS)
+        
+        # Every loop of this window runs off one fixed-timestep scheduler
+        self.scheduler = FrameScheduler(self.root)
+        self.instrument = Instrument(self, "snake")  # F3 overlay, F4 export
+        self.tweens = Tweens(self.scheduler)  # Menu bobbing and fades
+        
+        # The start screen is built once and hidden during play
+        self.scenes = SceneManager()
+        self.scenes.add("start", self.build_start_screen, self.enter_start_screen, self.tweens.clear)
+        self.scenes.add("game")
+        
+        self.idle = IdleManager(self)  # Throttle while minimized or in the background
+        self.spectators = spectate("snake", self)  # Only when GAMEKIT_SPECTATE is set
+        if self.events is not None:
+            self.events.attach(self.scheduler)  # Flush batches while no events come
+        self.scheduler.set_render(self.draw)
+        
+        # Key bindings - using both arrow keys and WASD, delivered once per
+        # frame with key autorepeat collapsed
+        self.inputs = InputBuffer(self)
+        self.inputs.bind(self.root, '<Up>', lambda e: self.queue_direction('UP'), key='UP')
+        self.inputs.bind(self.root, '<Down>', lambda e: self.queue_direction('DOWN'), key='DOWN')
+        self.inputs.bind(self.root, '<Left>', lambda e: self.queue_direction('LEFT'), key='LEFT')
+        self.inputs.bind(self.root, '<Right>', lambda e: self.queue_direction('RIGHT'), key='RIGHT')
+        self.inputs.bind(self.root, 'w', lambda e: self.queue_direction('UP'), key='UP')
+        self.inputs.bind(self.root, 's', lambda e: self.queue_direction('DOWN'), key='DOWN')
+        self.inputs.bind(self.root, 'a', lambda e: self.queue_direction('LEFT'), key='LEFT')
+        self.inputs.bind(self.root, 'd', lambda e: self.queue_direction('RIGHT'), key='RIGHT')
+        self.root.bind('<Escape>', lambda e: self.root.iconify())  # Minimize on ESC
+        self.root.bind('<space>', lambda e: self.root.destroy())  # Close on SPACE
+        
+        self.show_start_screen()
+        self.scheduler.start()
+    
+    def open_website(self, event):
+        """Open spidrbot.com in browser"""
+        import webbrowser
+        webbrowser.open("https://spidrbot.com")
+    
+    def draw_grid(self):
+        """Draw subtle grid lines"""
+        for i in range(self.GRID_SIZE + 1):
+            # Vertical lines
+            x = i * self.CELL_SIZE
+            self.canvas.create_line(
+                x, 0, x, self.HEIGHT,
+                fill=self.GRID_COLOR,
+                width=1
+            )
+            # Horizontal lines
+            y = i * self.CELL_SIZE
+            self.canvas.create_line(
+                0, y, self.WIDTH, y,
+                fill=self.GRID_COLOR,
+                width=1
+            )
+    
+    def show_start_screen(self):
+        """Display start screen"""
+        self.scenes.show("start")
+    
+    def build_start_screen(self, scene):
+        """Create the start screen text once; it is hidden while playing"""
+        # Title (will be animated)
+        self.title_text = self.canvas.create_text(
+            self.WIDTH // 2,
+            self.HEIGHT // 2 - 50,
+            text="SNAKE",
+            font=font("Arial", 28, "bold"),
+            fill=self.SNAKE_COLOR,
+            tags="start"
+        )
+        
+        # Subtitle (will also bob)
+        self.subtitle_text = self.canvas.create_text(
+            self.WIDTH // 2,
+            self.HEIGHT // 2 + 10,
+            text="Use Arrow Keys or WASD to move",
+            font=font("Arial", 11),
+            fill=self.TEXT_COLOR,
+            tags="start"
+        )
+        
+        # Instructions (will also bob)
+        self.instruction_text = self.canvas.create_text(
+            self.WIDTH // 2,
+            self.HEIGHT // 2 + 35,
+            text="Press any direction key to start",
+            font=font("Arial", 11),
+            fill="#888888",
+            tags="start"
+        )
+        scene.items(self.canvas, "start")
+    
+    def enter_start_screen(self):
+        """Clear the board and set the start screen bobbing"""
+        self.layer.clear()
+        self.canvas.itemconfig(self.title_text, text="YOU WIN!" if self.engine.won else "SNAKE")
+        self.tweens.bob(self.canvas, "start", 8)
+    
+    def queue_direction(self, new_direction):
+        """Queue direction changes for responsive input"""
+        # Block input if disabled
+        if self.input_blocked:
+            return
+            
+        if not self.game_started:
+            self.start_game()
+        elif self.game_over:
+            return
+        
+        # The engine rejects 180-degree turns and duplicate entries
+        self.engine.apply(new_direction)
+    
+    def start_game(self):
+        """Initialize game state"""
+        self.scenes.show("game")
+        self.game_started = True
+        self.game_over = False
+        self.engine.reset()
+        self.camera = (0, 0)
+        
+        self.update_score()
+        self.scheduler.every("game", self.GAME_SPEED, self.game_loop)
+        self.scheduler.invalidate()
+    
+    def game_loop(self):
+        """Main game loop"""
+        if self.game_over:
+            return
+        
+        # Advance the simulation one tick
+        if self.engine.step():
+            self.update_score()
+        if self.engine.done:
+            self.end_game()
+        
+        self.scheduler.invalidate()
+    
+    def draw(self):
+        """Draw everything on canvas"""
+        layer = self.layer
+        layer.begin_frame()
+        
+        # Animate food pulse
+        self.food_pulse += self.food_pulse_direction * 0.3
+        if self.food_pulse > 3:
+            self.food_pulse_direction = -1
+        elif self.food_pulse < 0:
+            self.food_pulse_direction = 1
+        
+        engine = self.engine
+        if engine.grid_size > self.GRID_SIZE:
+            self.follow_head()
+        cam_x, cam_y = self.camera
+        
+        # Draw food with pulsing animation
+        if engine.food:
+            fx, fy = engine.food[0] - cam_x, engine.food[1] - cam_y
+            pulse_offset = int(self.food_pulse)
+            layer.draw(
+                "food", "oval",
+                (fx * self.CELL_SIZE + 3 + pulse_offset,
+                 fy * self.CELL_SIZE + 3 + pulse_offset,
+                 (fx + 1) * self.CELL_SIZE - 3 - pulse_offset,
+                 (fy + 1) * self.CELL_SIZE - 3 - pulse_offset),
+                layer="food",
+                fill=self.FOOD_COLOR,
+                outline=""
+            )
+        
+        # Draw snake with rounded effect; the ring only restyles the old
+        # head and moves the tail item to the new head each tick, and
+        # scrolling boards draw just the cells in view
+        if engine.grid_size > self.GRID_SIZE:
+            self.draw_visible_snake()
+        else:
+            layer.ring("snake", layer="snake").draw(engine.snake, engine.ticks, self.segment_look)
+        
+        # Add eye to head
+        x, y = engine.snake[0][0] - cam_x, engine.snake[0][1] - cam_y
+        # Determine eye position based on direction
+        if engine.direction == 'UP':
+            eye_y = y * self.CELL_SIZE + 7
+            eye_x1 = x * self.CELL_SIZE + 7
+            eye_x2 = x * self.CELL_SIZE + 16
+        elif engine.direction == 'DOWN':
+            eye_y = (y + 1) * self.CELL_SIZE - 7
+            eye_x1 = x * self.CELL_SIZE + 7
+            eye_x2 = x * self.CELL_SIZE + 16
+        elif engine.direction == 'LEFT':
+            eye_x = x * self.CELL_SIZE + 7
+            eye_y1 = y * self.CELL_SIZE + 7
+            eye_y2 = y * self.CELL_SIZE + 16
+        elif engine.direction == 'RIGHT':
+            eye_x = (x + 1) * self.CELL_SIZE - 7
+            eye_y1 = y * self.CELL_SIZE + 7
+            eye_y2 = y * self.CELL_SIZE + 16
+        else:
+            # Default right-facing eyes
+            eye_x = (x + 1) * self.CELL_SIZE - 7
+            eye_y1 = y * self.CELL_SIZE + 7
+            eye_y2 = y * self.CELL_SIZE + 16
+        
+        # Draw eyes
+        if engine.direction in ['UP', 'DOWN']:
+            eyes = ((eye_x1, eye_y), (eye_x2, eye_y))
+        else:
+            eyes = ((eye_x, eye_y1), (eye_x, eye_y2))
+        for n, (ex, ey) in enumerate(eyes):
+            layer.draw(
+                ("eye", n), "oval", (ex, ey, ex + 3, ey + 3),
+                layer="eyes",
+                fill="#000000",
+                outline=""
+            )
+        
+        layer.end_frame()
+    
+    def follow_head(self):
+        """Scroll the camera just enough to keep the head CAMERA_MARGIN cells inside the view"""
+        head_x, head_y = self.engine.snake[0]
+        view = self.GRID_SIZE
+        margin = self.CAMERA_MARGIN
+        last = self.engine.grid_size - view
+        cam_x, cam_y = self.camera
+        cam_x = min(max(cam_x, head_x + margin + 1 - view), head_x - margin)
+        cam_y = min(max(cam_y, head_y + margin + 1 - view), head_y - margin)
+        self.camera = (min(max(cam_x, 0), last), min(max(cam_y, 0), last))
+    
+    def draw_visible_snake(self):
+        """Draw the body cells under the camera, keyed by their place in the view"""
+        engine = self.engine
+        size = engine.grid_size
+        view = self.GRID_SIZE
+        head = engine.snake[0]
+        cam_x, cam_y = self.camera
+        for row in range(view):
+            start = (cam_y + row) * size + cam_x
+            counts = engine.occupancy[start:start + view]
+            if not any(counts):
+                continue
+            for col, count in enumerate(counts):
+                if count:
+                    cell = (cam_x + col, cam_y + row)
+                    coords, options = self.segment_look(cell, cell == head)
+                    self.layer.draw(("segment", col, row), "rectangle", coords, layer="snake", **options)
+    
+    def segment_look(self, cell, is_head):
+        """Coords and options of one snake segment, relative to the camera"""
+        x, y = cell[0] - self.camera[0], cell[1] - self.camera[1]
+        offset = 1 if is_head else 2
+        coords = (x * self.CELL_SIZE + offset,
+                  y * self.CELL_SIZE + offset,
+                  (x + 1) * self.CELL_SIZE - offset,
+                  (y + 1) * self.CELL_SIZE - offset)
+        return coords, {"fill": self.SNAKE_HEAD_COLOR if is_head else self.SNAKE_COLOR, "outline": ""}
+    
+    def update_score(self):
+        """Update score display"""
+        self.score_label.config(text=f"SCORE: {self.engine.score}")
+    
+    def end_game(self):
+        """Handle game over - smoothly fade in main menu"""
+        self.game_over = True
+        self.game_started = False
+        self.scheduler.cancel("game")
+        
+        # Block input for 0.5 seconds to prevent glitching
+        self.input_blocked = True
+        self.scheduler.after("unblock", 500, lambda: setattr(self, 'input_blocked', False))
+        
+        # Show menu immediately with fade-in animation
+        self.show_start_screen()
+        self.tweens.fade_in(self.canvas, {
+            self.title_text: self.SNAKE_COLOR,
+            self.subtitle_text: self.TEXT_COLOR,
+            self.instruction_text: "#888888",
+        })
+
+if __name__ == "__main__":
+    root = tk.Tk()
+    game = SnakeGame(root)
+    root.mainloop()
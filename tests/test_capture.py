@@ -0,0 +1,39 @@
+import pytest
+
+from gamekit.capture import VIEW_STATE, capture, headless_view
+from gamekit.engines import ENGINES
+
+np = pytest.importorskip('numpy')
+
+
+@pytest.mark.parametrize('game', sorted(VIEW_STATE))
+def test_capture_writes_frames(tmp_path, game):
+    stats = capture(game, str(tmp_path), seed=2, frames=5)
+    pngs = sorted(tmp_path.glob('frame_*.png'))
+    assert stats['frames'] == len(pngs) > 0
+    assert all(path.read_bytes().startswith(b"\x89PNG") for path in pngs)
+
+
+def test_minesweeper_view_shows_the_board():
+    engine = ENGINES['minesweeper'](seed=2)
+    view = headless_view('minesweeper', engine)
+    assert (view.canvas.width, view.canvas.height) == (engine.grid_size * view.CELL_SIZE,) * 2
+
+    view.draw()
+    before = view.canvas.render().copy()
+    engine.apply(('reveal', (0, 0)))
+    view.draw()
+    after = view.canvas.render()
+
+    # The revealed corner cell changes color; the frame is the board and nothing else
+    cell = view.CELL_SIZE
+    assert (before[cell // 2, cell // 2] != after[cell // 2, cell // 2]).any()
+    assert len(view.canvas.items) >= engine.grid_size ** 2
+
+
+def test_raw_video_has_one_frame_per_capture(tmp_path):
+    stats = capture('snake', str(tmp_path), seed=1, frames=6, scale=5, fmt='raw')
+    (video,) = tmp_path.glob('*.rgb')
+    canvas = headless_view('snake', ENGINES['snake']()).canvas
+    width, height = len(range(0, canvas.width, 5)), len(range(0, canvas.height, 5))
+    assert video.stat().st_size == stats['frames'] * width * height * 3
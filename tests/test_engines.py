@@ -0,0 +1,171 @@
+import random
+
+import pytest
+
+from gamekit.engines import ENGINES
+from gamekit.engines.minesweeper import MinesweeperEngine
+from gamekit.engines.snake import SnakeEngine
+from gamekit.engines.tetris import POINTS, TetrisEngine
+from gamekit.engines.wordle import WordleEngine, score_guess
+
+
+# Tetris
+
+def fill_rows(engine, rows):
+    for y in rows:
+        engine.grid[y] = ['I'] * engine.width
+
+
+def test_tetris_clears_separated_lines():
+    engine = TetrisEngine(seed=1)
+    fill_rows(engine, (15, 17, 19))
+    engine.grid[16][0] = 'T'
+    engine.grid[18][1] = 'S'
+
+    assert engine.clear_lines() == 3
+    assert engine.score == POINTS[3]
+    assert engine.lines_cleared == 3
+
+    # The partial rows drop in order and nothing full is left behind
+    assert engine.grid[19] == [None, 'S'] + [None] * 8
+    assert engine.grid[18] == ['T'] + [None] * 9
+    assert all(cell is None for row in engine.grid[:18] for cell in row)
+    assert len(engine.grid) == engine.height
+
+
+def test_tetris_clears_four_lines():
+    engine = TetrisEngine(seed=1)
+    fill_rows(engine, range(16, 20))
+
+    assert engine.clear_lines() == 4
+    assert engine.score == POINTS[4]
+    assert all(cell is None for row in engine.grid for cell in row)
+
+
+def test_tetris_tops_out():
+    engine = TetrisEngine(seed=1)
+    for _ in range(200):
+        engine.step('DROP')
+        if engine.done:
+            break
+    assert engine.done
+    assert engine.step('DROP') == 0
+
+
+# Snake
+
+def test_snake_waits_for_a_direction():
+    engine = SnakeEngine(seed=1)
+    before = list(engine.snake)
+    engine.step()
+    assert list(engine.snake) == before
+    assert engine.ticks == 0
+
+
+def test_snake_eats_and_grows():
+    engine = SnakeEngine(seed=1)
+    head_x, head_y = engine.snake[0]
+    engine.food = (head_x, head_y - 1)
+
+    assert engine.step('UP') == 1
+    assert engine.score == 1
+    assert len(engine.snake) == 4
+    assert engine.snake[0] == (head_x, head_y - 1)
+
+
+def test_snake_ignores_reversal():
+    engine = SnakeEngine(seed=1)
+    engine.step('UP')
+    engine.step('DOWN')
+    assert engine.direction == 'UP'
+    assert not engine.done
+
+
+def test_snake_dies_on_the_wall():
+    engine = SnakeEngine(grid_size=8, seed=1)
+    engine.food = (7, 0)
+    steps = 0
+    while not engine.done:
+        engine.step('LEFT')
+        steps += 1
+    assert steps == 5
+    assert not engine.won
+
+
+# Minesweeper
+
+def test_minesweeper_first_reveal_is_safe():
+    for seed in range(20):
+        engine = MinesweeperEngine(seed=seed)
+        engine.apply(('reveal', (4, 4)))
+        assert (4, 4) not in engine.mines
+        assert len(engine.mines) == engine.mine_count
+        assert not engine.done
+
+
+def test_minesweeper_flags_block_reveals():
+    engine = MinesweeperEngine(seed=1)
+    assert not engine.apply(('flag', (0, 0)))  # Nothing to flag before the first reveal
+
+    engine.apply(('reveal', (4, 4)))
+    mine = min(engine.mines)
+    assert engine.apply(('flag', mine))
+    assert engine.apply(('reveal', mine)) == 0
+    assert mine not in engine.revealed
+    assert not engine.done
+
+
+# Wordle
+
+def test_score_guess_counts_repeated_letters_once():
+    assert score_guess('EERIE', 'THREE') == ['present', 'absent', 'correct', 'absent', 'correct']
+    assert score_guess('HELLO', 'HELLO') == ['correct'] * 5
+
+
+def test_wordle_win_and_loss():
+    engine = WordleEngine(seed=1)
+    assert engine.step(engine.target_word) == 1
+    assert engine.done and engine.won
+
+    engine.reset()
+    wrong = next(word for word in engine.word_list if word.upper() != engine.target_word)
+    for _ in range(engine.MAX_GUESSES):
+        engine.step(wrong)
+    assert engine.done and not engine.won
+    assert len(engine.guesses) == engine.MAX_GUESSES
+
+
+def test_wordle_rejects_unknown_words():
+    engine = WordleEngine(seed=1)
+    assert engine.apply('ZZZZZ') is None
+    assert engine.guesses == []
+
+
+# Cookie Clicker
+
+def test_cookie_clicker_refuses_unknown_upgrades():
+    engine = ENGINES['cookie clicker'](seed=1)
+    engine.cookies = 1000
+
+    # Unknown actions are ignored like an unaffordable purchase, as the other engines do
+    assert engine.apply('nope') is False
+    assert engine.step('Click') == 0
+    assert engine.cookies == 1000
+    assert all(upgrade.count == 0 for upgrade in engine.upgrades.values())
+
+
+# Seeding
+
+@pytest.mark.parametrize('game', ['snake', 'tetris', 'block breaker'])
+def test_same_seed_plays_the_same_round(game):
+    def play(seed):
+        engine = ENGINES[game](seed=seed)
+        rng = random.Random(seed)
+        trace = []
+        for _ in range(300):
+            trace.append(engine.step(rng.choice(engine.ACTIONS)))
+            if engine.done:
+                break
+        return trace, engine.score
+
+    assert play(3) == play(3)
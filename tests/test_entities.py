@@ -0,0 +1,33 @@
+from gamekit.entities import Ball, Block, Pool, Upgrade
+
+
+def test_pool_reuses_released_objects():
+    pool = Pool(Ball)
+    ball = pool.acquire(1, 2, 3, 4)
+    ball.trail.append((1, 2))
+    pool.release(ball)
+
+    again = pool.acquire(5, 6, 7, 8)
+    assert again is ball
+    assert (again.x, again.y, again.dx, again.dy, again.trail) == (5, 6, 7, 8, [])
+    assert pool.free == []
+    assert pool.acquire(0, 0, 1, 1) is not ball
+
+
+def test_release_all_returns_every_object():
+    pool = Pool(Block)
+    blocks = [pool.acquire(x, 0, 0, 10) for x in range(5)]
+    pool.release_all(blocks)
+    assert {id(pool.acquire(0, 0, 0, 10)) for _ in range(5)} == {id(block) for block in blocks}
+
+
+def test_entities_are_slotted_with_fields():
+    block = Block(10, 20, 1, 50, powerup_type='MULTI')
+    assert not hasattr(block, '__dict__')
+    assert block.fields() == {
+        'x': 10, 'y': 20, 'row': 1, 'points': 50, 'visible': True,
+        'has_powerup': True, 'powerup_type': 'MULTI',
+    }
+    assert repr(Upgrade('Cursor', 'Clicks', 15, cps=0.1)) == (
+        "Upgrade(name='Cursor', desc='Clicks', cost=15, cps=0.1, cpc=0, count=0)"
+    )
@@ -0,0 +1,144 @@
+import threading
+import time
+
+import pytest
+
+from gamekit.events import EventBus, LogWriter, read_events
+from gamekit.scheduler import FrameScheduler
+
+
+class ListWriter:
+    """Collects submitted batches in memory"""
+
+    def __init__(self):
+        self.batches = []
+        self.closed = False
+
+    def submit(self, batch):
+        self.batches.append(batch)
+
+    def close(self):
+        self.closed = True
+
+
+class GatedWriter(LogWriter):
+    """A LogWriter whose thread waits for ``gate`` before writing anything"""
+
+    def __init__(self, path, fmt='jsonl'):
+        self.gate = threading.Event()
+        super().__init__(path, fmt)
+
+    def run(self):
+        self.gate.wait()
+        super().run()
+
+
+def test_events_are_stamped_counted_and_heard():
+    bus = EventBus('snake')
+    heard = []
+    bus.subscribe(heard.append)
+    bus.emit('food_eaten', score=1)
+
+    t, kind, fields = heard[0]
+    assert (kind, fields) == ('food_eaten', {'score': 1})
+    assert t >= 0
+    assert bus.counts == {'session': 1, 'food_eaten': 1}
+
+
+def test_reserved_field_names_are_refused():
+    bus = EventBus('snake', ListWriter())
+    for field in ('t', 'event'):
+        with pytest.raises(ValueError):
+            bus.emit('food_eaten', **{field: 1})
+
+
+def test_full_batches_go_to_the_writer():
+    writer = ListWriter()
+    bus = EventBus('snake', writer)
+    for i in range(bus.BATCH_SIZE - 1):  # The session event is the first of the batch
+        bus.emit('tick', i=i)
+    assert len(writer.batches) == 1
+    assert len(writer.batches[0]) == bus.BATCH_SIZE
+    assert bus.batch == []
+
+
+def test_stale_batches_flush_from_the_scheduler():
+    writer = ListWriter()
+    bus = EventBus('snake', writer)
+    scheduler = FrameScheduler(None)
+    bus.attach(scheduler)
+    assert scheduler.is_active('events')
+
+    scheduler.cancel_all()
+    assert scheduler.is_active('events')  # Survives screen changes
+
+    bus.flush_stale()
+    assert writer.batches == []  # Not old enough yet
+
+    bus.batch_start -= bus.BATCH_SECONDS
+    scheduler._advance(bus.BATCH_SECONDS)
+    assert len(writer.batches) == 1
+
+
+def test_close_flushes_and_detaches_the_writer():
+    writer = ListWriter()
+    bus = EventBus('snake', writer)
+    bus.emit('died', score=3)
+    bus.close()
+    assert writer.closed
+    assert [kind for _, kind, _ in writer.batches[0]] == ['session', 'died']
+
+    bus.emit('round_started')  # Still counted, no longer logged
+    assert bus.counts['round_started'] == 1
+    assert bus.writer is None
+
+
+@pytest.mark.parametrize('fmt', ['jsonl', 'bin'])
+def test_log_round_trip(tmp_path, fmt):
+    path = str(tmp_path / ('events.jsonl' if fmt == 'jsonl' else 'events.evlog'))
+    bus = EventBus('tetris', LogWriter(path, fmt))
+    bus.emit('lines_cleared', lines=2, total=2, score=300)
+    bus.flush()
+    bus.emit('topped_out', score=300)
+    bus.close()
+
+    events = list(read_events(path))
+    assert [event['event'] for event in events] == ['session', 'lines_cleared', 'topped_out']
+    assert events[1] == {'t': events[1]['t'], 'event': 'lines_cleared', 'lines': 2, 'total': 2, 'score': 300}
+
+
+def wait_until_empty(writer):
+    deadline = time.monotonic() + 5
+    while not writer.queue.empty() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_dropped_events_are_counted_in_the_next_batch_written(tmp_path):
+    path = str(tmp_path / 'events.jsonl')
+    writer = GatedWriter(path)
+    for i in range(writer.MAX_PENDING + 3):
+        writer.submit([(float(i), 'tick', {'i': i}), (float(i), 'tick', {'i': i})])
+    assert writer.dropped == 6
+
+    writer.gate.set()
+    wait_until_empty(writer)
+    writer.submit([(100.0, 'died', {})])
+    writer.close()
+
+    events = list(read_events(path))
+    assert events[-2:] == [{'t': 100.0, 'event': 'dropped', 'events': 6}, {'t': 100.0, 'event': 'died'}]
+    assert sum(event['event'] == 'tick' for event in events) == 2 * writer.MAX_PENDING
+
+
+def test_drops_are_reported_on_close(tmp_path):
+    path = str(tmp_path / 'events.jsonl')
+    writer = GatedWriter(path)
+    for i in range(writer.MAX_PENDING + 2):
+        writer.submit([(float(i), 'tick', {'i': i})])
+    writer.gate.set()
+    writer.close()
+
+    events = list(read_events(path))
+    assert events[-1]['event'] == 'dropped'
+    assert events[-1]['events'] == writer.dropped == 2
+    assert not writer.thread.is_alive()
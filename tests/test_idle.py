@@ -0,0 +1,91 @@
+import tkinter as tk
+import types
+
+from bench.tkrecord import Tk
+from gamekit.idle import ACTIVE, BACKGROUND, HIDDEN, IdleManager
+from gamekit.scheduler import FrameScheduler
+
+
+def make_idle(**options):
+    root = Tk()
+    game = types.SimpleNamespace(root=root, scheduler=FrameScheduler(root))
+    return game.scheduler, IdleManager(game, **options)
+
+
+def map_event(idle, kind):
+    idle.on_map(types.SimpleNamespace(widget=idle.window, type=kind))
+
+
+def go_idle(idle):
+    idle.last_input -= idle.MENU_IDLE_SECONDS + 1
+    idle.update()
+
+
+def test_hidden_window_runs_only_background_tasks():
+    scheduler, idle = make_idle(logic=("income",), background=("income",))
+    scheduler.every("income", 100, lambda: None)
+    scheduler.every("cookie", 30, lambda: None)
+
+    map_event(idle, tk.EventType.Unmap)
+    assert idle.state == HIDDEN
+    assert scheduler.keep == {"income", "idle"}
+    assert scheduler.other_steps == 0 and scheduler.render_paused
+    assert scheduler.frame_interval == idle.HIDDEN_FRAME_MS / 1000
+
+    map_event(idle, tk.EventType.Map)
+    assert idle.state == ACTIVE
+    assert scheduler.keep is None and not scheduler.render_paused
+
+
+def test_unfocused_window_keeps_game_logic_at_full_rate():
+    scheduler, idle = make_idle()
+    scheduler.every("game", 100, lambda: None)
+    idle.window.focus_displayof = lambda: None
+
+    idle.update()
+    assert idle.state == BACKGROUND
+    assert "game" in scheduler.keep
+    assert scheduler.frame_interval == idle.BACKGROUND_FRAME_MS / 1000
+
+    # Logic faster than the slow frame keeps the normal frame rate
+    scheduler.every("game", 50, lambda: None)
+    idle.update()
+    assert scheduler.frame_interval == scheduler.base_frame_interval
+
+
+def test_menu_idles_after_a_while_and_input_wakes_it():
+    scheduler, idle = make_idle()
+    idle.update()
+    assert idle.state == ACTIVE
+
+    go_idle(idle)
+    assert idle.state == BACKGROUND
+    idle.on_input(None)
+    assert idle.state == ACTIVE
+
+
+def test_running_game_logic_never_counts_as_idle():
+    scheduler, idle = make_idle()
+    scheduler.every("game", 100, lambda: None)
+    go_idle(idle)
+    assert idle.state == ACTIVE
+
+
+def test_in_round_overrides_the_logic_tasks():
+    # Wordle: no logic loop, a round lasts until the engine is done
+    engine = types.SimpleNamespace(done=False)
+    scheduler, idle = make_idle(logic=("flip", "shake"), in_round=lambda: not engine.done)
+
+    go_idle(idle)
+    assert idle.state == ACTIVE
+
+    engine.done = True
+    idle.update()
+    assert idle.state == BACKGROUND
+    assert {"flip", "shake"} <= scheduler.keep
+
+
+def test_idle_poll_is_persistent():
+    scheduler, idle = make_idle()
+    scheduler.cancel_all()
+    assert scheduler.is_active("idle")
@@ -0,0 +1,89 @@
+import types
+
+from gamekit.inputs import InputBuffer
+from gamekit.scheduler import FrameScheduler
+
+
+class Widget:
+    """Keeps the handlers bound to it, so tests can fire events by sequence"""
+
+    def __init__(self):
+        self.bindings = {}
+
+    def bind(self, sequence, handler):
+        self.bindings[sequence] = handler
+
+    def fire(self, sequence, event=None):
+        self.bindings[sequence](event if event is not None else sequence)
+
+
+def make_buffer():
+    game = types.SimpleNamespace(scheduler=FrameScheduler(None), engine=types.SimpleNamespace(recorder=None))
+    return game.scheduler, InputBuffer(game)
+
+
+def test_interleaved_keys_keep_their_order():
+    scheduler, inputs = make_buffer()
+    widget = Widget()
+    moves = []
+    inputs.bind(widget, '<Left>', lambda e: moves.append('LEFT'), key='LEFT')
+    inputs.bind(widget, '<Right>', lambda e: moves.append('RIGHT'), key='RIGHT')
+
+    for sequence in ('<Left>', '<Right>', '<Left>'):
+        widget.fire(sequence)
+    assert moves == []  # Nothing runs until the next frame
+
+    scheduler._advance(0.016)
+    assert moves == ['LEFT', 'RIGHT', 'LEFT']
+
+
+def test_a_repeated_key_collapses_to_its_latest_event():
+    scheduler, inputs = make_buffer()
+    widget = Widget()
+    seen = []
+    inputs.bind(widget, '<Left>', lambda e: seen.append(e), key='LEFT')
+    inputs.bind(widget, '<Right>', lambda e: seen.append(e), key='RIGHT')
+
+    # Autorepeat: a run of one key, then another key, then the first again
+    for event in ('left 1', 'left 2', 'left 3'):
+        widget.fire('<Left>', event)
+    widget.fire('<Right>', 'right')
+    widget.fire('<Left>', 'left 4')
+
+    scheduler._advance(0.016)
+    assert seen == ['left 3', 'right', 'left 4']
+    assert (inputs.received, inputs.delivered) == (5, 3)
+
+
+def test_press_and_release_share_a_key():
+    scheduler, inputs = make_buffer()
+    widget = Widget()
+    down = set()
+    inputs.bind(widget, '<Left>', lambda e: down.add('LEFT'), key='Left')
+    inputs.bind(widget, '<KeyRelease-Left>', lambda e: down.discard('LEFT'), key='Left')
+    inputs.bind(widget, '<Right>', lambda e: down.add('RIGHT'), key='Right')
+
+    widget.fire('<Left>')
+    widget.fire('<KeyRelease-Left>')
+    widget.fire('<Right>')
+    widget.fire('<Left>')
+    scheduler._advance(0.016)
+    assert down == {'LEFT', 'RIGHT'}
+
+    widget.fire('<Left>')
+    widget.fire('<KeyRelease-Left>')
+    scheduler._advance(0.016)
+    assert down == {'RIGHT'}
+
+
+def test_unkeyed_events_are_all_delivered():
+    scheduler, inputs = make_buffer()
+    widget = Widget()
+    typed = []
+    inputs.bind(widget, '<Key>', typed.append)
+
+    for letter in 'HELLO':
+        widget.fire('<Key>', letter)
+    scheduler._advance(0.016)
+    assert ''.join(typed) == 'HELLO'
+    assert inputs.pending == []
@@ -0,0 +1,91 @@
+import csv
+import json
+import types
+
+import pytest
+
+from bench.tkrecord import Canvas, Tk
+from gamekit.engines.snake import SnakeEngine
+from gamekit.instrument import Instrument, percentile
+from gamekit.phases import no_phase
+from gamekit.scheduler import FrameScheduler
+
+
+def make_game():
+    root = Tk()
+    game = types.SimpleNamespace(root=root, canvas=Canvas(root), engine=SnakeEngine(seed=1))
+    game.scheduler = FrameScheduler(root)
+    return game
+
+
+def play_frames(game, instrument, count, frame_ms=10.0):
+    """Report ``count`` frames of ``frame_ms`` each, timing an update phase in every one"""
+    for i in range(count):
+        start = i * 0.016
+        with instrument.phase("update"):
+            pass
+        game.scheduler.frame_count += 1
+        instrument.frame_done(start, start + frame_ms / 1000)
+
+
+def test_percentile_is_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile(values, 100) == 100
+    assert percentile([7], 95) == 7
+    assert percentile([], 50) == 0.0
+
+
+def test_phases_are_timed_only_while_active(tmp_path):
+    game = make_game()
+    instrument = Instrument(game, "snake", export_path=str(tmp_path / "frames.csv"))
+    assert game.scheduler.phase is no_phase and game.engine.phase is no_phase
+
+    instrument.toggle_overlay()
+    assert game.scheduler.phase is instrument.timer
+    assert game.engine.phase is instrument.timer
+
+    instrument.overlay_visible = False
+    instrument.update_hooks()
+    assert game.engine.phase is no_phase
+    play_frames(game, instrument, 5)
+    assert not instrument.samples
+
+
+def test_csv_export_has_a_row_per_frame(tmp_path):
+    path = tmp_path / "frames.csv"
+    game = make_game()
+    game.canvas.create_rectangle(0, 0, 10, 10)
+    instrument = Instrument(game, "snake", export_path=str(path))
+
+    instrument.toggle_export()
+    play_frames(game, instrument, 4)
+    instrument.toggle_export()
+
+    rows = list(csv.DictReader(path.open()))
+    assert len(rows) == 4
+    assert [int(row["frame"]) for row in rows] == [1, 2, 3, 4]
+    assert {row["items"] for row in rows} == {"1"}
+    assert float(rows[0]["frame_ms"]) == pytest.approx(10.0)
+    assert "update_ms" in rows[0] and "collision_ms" in rows[0]
+
+
+def test_json_export_and_summary(tmp_path):
+    path = tmp_path / "frames.jsonl"
+    game = make_game()
+    instrument = Instrument(game, "snake", export_path=str(path))
+
+    instrument.toggle_export()
+    play_frames(game, instrument, 10)
+    instrument.stop_export()
+
+    samples = [json.loads(line) for line in path.read_text().splitlines()]
+    assert len(samples) == 10
+    assert samples[1]["interval_ms"] == pytest.approx(16.0)
+
+    stats = instrument.summary()
+    assert stats["fps"] == pytest.approx(62.5)
+    assert stats["p50"] == pytest.approx(10.0)
+    assert set(stats["phases"]) == {"update"}
+    assert "62.5 fps" in instrument.overlay_text()
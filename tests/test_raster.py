@@ -0,0 +1,100 @@
+import struct
+import zlib
+
+import pytest
+
+from gamekit.raster import RasterCanvas, png_bytes, scale_down
+
+np = pytest.importorskip('numpy')
+
+BLACK = [0, 0, 0]
+RED = [255, 0, 0]
+GREEN = [0, 255, 0]
+BLUE = [0, 0, 255]
+
+
+def test_rectangle_fill_and_outline():
+    canvas = RasterCanvas(20, 20, "black")
+    canvas.create_rectangle(4, 4, 14, 12, fill="#ff0000", outline="#00ff00", width=2)
+    frame = canvas.render()
+
+    assert frame[0, 0].tolist() == BLACK
+    assert frame[8, 9].tolist() == RED  # Inside
+    assert frame[4, 9].tolist() == GREEN  # Top edge
+    assert frame[5, 13].tolist() == GREEN  # Right edge, 2 px wide
+    assert frame[12, 9].tolist() == BLACK  # The far corner is exclusive
+    assert (frame[6:10, 6:12] == RED).all()
+
+
+def test_oval_covers_its_circle_only():
+    canvas = RasterCanvas(20, 20, "black")
+    canvas.create_oval(0, 0, 20, 20, fill="#0000ff", outline="")
+    frame = canvas.render()
+
+    assert frame[10, 10].tolist() == BLUE
+    assert frame[10, 0].tolist() == BLUE  # Edge midpoint
+    for y, x in ((0, 0), (0, 19), (19, 0), (19, 19)):
+        assert frame[y, x].tolist() == BLACK  # Corners fall outside
+
+    # Pixels whose centers lie within the radius, and no others
+    ys, xs = np.mgrid[0:20, 0:20] + 0.5
+    inside = (xs - 10) ** 2 + (ys - 10) ** 2 <= 100
+    assert ((frame == BLUE).all(axis=2) == inside).all()
+
+
+def test_polygon_fills_a_triangle():
+    canvas = RasterCanvas(20, 20, "black")
+    canvas.create_polygon(0, 0, 20, 0, 0, 20, fill="#ff0000", outline="")
+    frame = canvas.render()
+
+    assert frame[2, 2].tolist() == RED
+    assert frame[17, 17].tolist() == BLACK
+    assert frame[9, 9].tolist() == RED  # Just inside the diagonal
+    assert frame[10, 10].tolist() == BLACK  # Just outside
+    assert (frame == RED).all(axis=2).sum() == 190  # Pixel centers under x + y = 20
+
+
+def test_items_stack_and_hide():
+    canvas = RasterCanvas(10, 10, "black")
+    bottom = canvas.create_rectangle(0, 0, 10, 10, fill="#ff0000", outline="")
+    top = canvas.create_rectangle(0, 0, 5, 10, fill="#00ff00", outline="")
+    assert canvas.render()[5, 2].tolist() == GREEN
+
+    canvas.itemconfig(top, state="hidden")
+    assert canvas.render()[5, 2].tolist() == RED
+    canvas.delete(bottom)
+    assert canvas.render()[5, 8].tolist() == BLACK
+
+
+def decode_png(data):
+    """Pixels of an 8-bit RGB PNG written with no row filters"""
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    position = 8
+    chunks = {}
+    while position < len(data):
+        length, = struct.unpack(">I", data[position:position + 4])
+        kind = data[position + 4:position + 8]
+        body = data[position + 8:position + 8 + length]
+        crc, = struct.unpack(">I", data[position + 8 + length:position + 12 + length])
+        assert crc == zlib.crc32(kind + body)
+        chunks[kind] = chunks.get(kind, b"") + body
+        position += 12 + length
+
+    width, height, depth, color_type = struct.unpack(">IIBB", chunks[b"IHDR"][:10])
+    assert (depth, color_type) == (8, 2)
+    rows = np.frombuffer(zlib.decompress(chunks[b"IDAT"]), dtype=np.uint8).reshape(height, width * 3 + 1)
+    assert not rows[:, 0].any()
+    return rows[:, 1:].reshape(height, width, 3)
+
+
+def test_png_round_trip():
+    frame = np.random.default_rng(1).integers(0, 256, size=(7, 13, 3), dtype=np.uint8)
+    assert (decode_png(png_bytes(frame)) == frame).all()
+
+
+def test_scale_down_keeps_every_nth_pixel():
+    frame = np.arange(6 * 4 * 3, dtype=np.uint8).reshape(6, 4, 3)
+    small = scale_down(frame, 2)
+    assert small.shape == (3, 2, 3)
+    assert (small == frame[::2, ::2]).all()
+    assert scale_down(frame, 1) is frame
@@ -0,0 +1,93 @@
+import json
+import random
+
+import pytest
+
+from gamekit.engines import ENGINES
+from gamekit.replay import Recorder, load, replay, state_digest
+
+
+def random_action(engine, rng):
+    """Any action the game takes, so recordings cover inputs a player could send"""
+    if hasattr(engine, 'ACTIONS'):
+        return rng.choice(engine.ACTIONS)
+    if hasattr(engine, 'mines'):
+        return rng.choice(('reveal', 'reveal', 'flag')), (rng.randrange(engine.grid_size), rng.randrange(engine.grid_size))
+    return rng.choice(engine.word_list)
+
+
+GAMES = ('snake', 'tetris', 'block breaker', 'minesweeper', 'wordle')
+
+
+def record(tmp_path, game, seed, rounds=2, max_steps=900):
+    """Play ``rounds`` recorded rounds; returns the live engine, its final digest and the file"""
+    engine = ENGINES[game](seed=seed)
+    path = tmp_path / f"{game.replace(' ', '_')}.jsonl"
+    recorder = Recorder(game, engine, str(path))
+    rng = random.Random(seed)
+
+    # Fewer steps than CHECK_EVERY per round would never write a digest mid-round
+    recorder.CHECK_EVERY = 50
+    for round_number in range(rounds):
+        if round_number:
+            engine.reset()
+        for _ in range(max_steps):
+            if engine.done:
+                break
+            engine.step(random_action(engine, rng))
+    digest = state_digest(engine)
+    recorder.close()
+    return engine, digest, path
+
+
+@pytest.mark.parametrize('game', GAMES)
+def test_replay_reproduces_every_digest(tmp_path, game):
+    engine, digest, path = record(tmp_path, game, seed=7)
+    header, entries = load(path)
+    assert entries[-1]['digest'] == digest
+
+    result = replay(header, entries)
+    assert result['desync'] is None
+    assert state_digest(result['engine']) == digest
+
+
+def test_replay_reports_the_first_mismatch(tmp_path):
+    _, _, path = record(tmp_path, 'block breaker', seed=7)
+    header, entries = load(path)
+    checks = [index for index, entry in enumerate(entries) if 'digest' in entry]
+    assert len(checks) > 1  # Digests along the way, not just at the end
+    entries[checks[0]]['digest'] = '00000000'
+
+    result = replay(header, entries)
+    assert result['desync'] == {'entry': checks[0] + 1, 'steps': entries[checks[0]]['steps']}
+
+
+def test_digest_is_stable_and_tracks_state():
+    first = ENGINES['snake'](seed=3)
+    second = ENGINES['snake'](seed=3)
+    assert state_digest(first) == state_digest(second)
+
+    # Derived indexes are left out, so their order does not matter
+    second.free_cells.reverse()
+    assert state_digest(first) == state_digest(second)
+
+    first.step('LEFT')
+    assert state_digest(first) != state_digest(second)
+    second.step('LEFT')
+    assert state_digest(first) == state_digest(second)
+
+
+def test_digest_ignores_set_order():
+    first = ENGINES['minesweeper'](seed=3)
+    second = ENGINES['minesweeper'](seed=3)
+    first.mines = {(0, 1), (2, 3), (4, 5)}
+    second.mines = {(4, 5), (0, 1), (2, 3)}
+    assert state_digest(first) == state_digest(second)
+
+
+def test_recording_is_json_lines(tmp_path):
+    _, _, path = record(tmp_path, 'tetris', seed=1, rounds=1)
+    lines = path.read_text().splitlines()
+    header = json.loads(lines[0])
+    assert header['game'] == 'tetris'
+    assert 'reset' in json.loads(lines[1])
@@ -0,0 +1,28 @@
+from gamekit.resources import FADE_STEPS, fade, font, gray, parse, ramp, rgb
+
+
+def test_colors_are_interned():
+    assert rgb(255, 71, 87) == "#ff4757"
+    assert rgb(255, 71, 87) is rgb(255, 71, 87)
+    assert gray(16) == "#101010"
+    assert parse("#ff4757") == (255, 71, 87)
+
+
+def test_ramps_run_between_their_ends_and_are_cached():
+    colors = ramp("#000000", "#ff4757", FADE_STEPS + 1)
+    assert len(colors) == FADE_STEPS + 1
+    assert colors[0] == "#000000" and colors[-1] == "#ff4757"
+    assert ramp("#000000", "#ff4757", FADE_STEPS + 1) is colors
+
+
+def test_fade_clamps_alpha():
+    assert fade("#ffffff", 0) == "#000000"
+    assert fade("#ffffff", 1) == "#ffffff"
+    assert fade("#ffffff", 2) == "#ffffff"
+    assert fade("#ffffff", -1) == "#000000"
+    assert fade("#ffffff", 0.5, background="#ffffff") == "#ffffff"
+
+
+def test_font_is_a_tuple_without_a_root():
+    # No Tk root here, as in off-screen rendering
+    assert font("Arial", 12, "bold") == ("Arial", 12, "bold")
@@ -0,0 +1,89 @@
+import random
+
+from bench.tkrecord import Canvas, Tk
+from gamekit.engines.snake import SnakeEngine
+from gamekit.retained import RetainedCanvas
+
+
+def look(cell, is_head):
+    x, y = cell
+    return (x * 10, y * 10, x * 10 + 10, y * 10 + 10), {'fill': 'head' if is_head else 'body'}
+
+
+def make_layer():
+    canvas = Canvas(Tk())
+    return canvas, RetainedCanvas(canvas, layers=("default", "snake"))
+
+
+def shown(canvas, ring):
+    """What each of the ring's items shows, head first"""
+    items = [canvas.items[entry.item] for entry in ring.entries]
+    assert all(item.options.get('state', 'normal') != 'hidden' for item in items)
+    return [(tuple(item.coords), item.options['fill']) for item in items]
+
+
+def expected(cells):
+    return [(coords, options['fill']) for coords, options in (look(cell, i == 0) for i, cell in enumerate(cells))]
+
+
+def test_ring_matches_the_snake_as_it_moves_and_grows():
+    canvas, layer = make_layer()
+    ring = layer.ring("snake", layer="snake")
+    rng = random.Random(4)
+    engine = SnakeEngine(grid_size=12, seed=4)
+
+    for _ in range(2000):
+        if engine.done:
+            engine.reset()
+        engine.step(rng.choice(engine.ACTIONS))
+        # Draw only some ticks, so a frame can cover several moves
+        if rng.random() < 0.6:
+            ring.draw(engine.snake, engine.ticks, look)
+            assert shown(canvas, ring) == expected(engine.snake)
+
+
+def test_moving_reuses_the_tail_item():
+    canvas, layer = make_layer()
+    ring = layer.ring("snake", layer="snake")
+    engine = SnakeEngine(grid_size=30, seed=1)
+    engine.food = (0, 0)
+
+    ring.draw(engine.snake, engine.ticks, look)
+    items = set(canvas.items)
+    for action in ['LEFT'] * 5 + ['UP'] * 5 + ['RIGHT'] * 5:
+        engine.step(action)
+        ring.draw(engine.snake, engine.ticks, look)
+    assert set(canvas.items) == items
+    assert shown(canvas, ring) == expected(engine.snake)
+
+
+def test_growth_takes_one_item_per_new_segment():
+    canvas, layer = make_layer()
+    ring = layer.ring("snake", layer="snake")
+    engine = SnakeEngine(grid_size=30, seed=1)
+    ring.draw(engine.snake, engine.ticks, look)
+
+    head_x, head_y = engine.snake[0]
+    engine.food = (head_x, head_y - 1)
+    engine.step('UP')
+    engine.food = (0, 0)
+    engine.step('UP')
+    created = canvas.next_id
+    ring.draw(engine.snake, engine.ticks, look)
+    assert canvas.next_id == created + 1
+    assert len(ring.entries) == len(engine.snake) == 4
+    assert shown(canvas, ring) == expected(engine.snake)
+
+
+def test_new_round_reuses_pooled_items():
+    canvas, layer = make_layer()
+    ring = layer.ring("snake", layer="snake")
+    engine = SnakeEngine(grid_size=30, seed=1)
+    ring.draw(engine.snake, engine.ticks, look)
+    created = canvas.next_id
+
+    engine.reset()
+    ring.draw(engine.snake, engine.ticks, look)
+    assert canvas.next_id == created
+    assert shown(canvas, ring) == expected(engine.snake)
+    assert layer.item_count() == len(engine.snake)
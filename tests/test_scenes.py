@@ -0,0 +1,52 @@
+from bench.tkrecord import Canvas, Tk
+from gamekit.scenes import SceneManager
+
+
+class Widget:
+    def __init__(self):
+        self.packed = None
+
+    def pack(self, **options):
+        self.packed = options
+
+    def pack_forget(self):
+        self.packed = None
+
+
+def test_scenes_are_built_once_and_then_shown_and_hidden():
+    canvas = Canvas(Tk())
+    scenes = SceneManager()
+    calls = []
+    menu_frame = Widget()
+
+    def build_menu(scene):
+        calls.append('build menu')
+        scene.pack(menu_frame, padx=20)
+        canvas.create_text(0, 0, text="snake", tags="menu")
+        scene.items(canvas, "menu")
+
+    scenes.add('menu', build=build_menu, enter=lambda: calls.append('enter menu'),
+               leave=lambda: calls.append('leave menu'))
+    scenes.add('game', enter=lambda level: calls.append(f'enter game {level}'))
+
+    scenes.show('menu')
+    scenes.show('game', 1)
+    assert menu_frame.packed is None
+    assert all(item.options['state'] == 'hidden' for item in canvas.items.values())
+
+    scenes.show('menu')
+    assert menu_frame.packed == {'padx': 20}
+    assert all(item.options['state'] == 'normal' for item in canvas.items.values())
+    assert calls == ['build menu', 'enter menu', 'leave menu', 'enter game 1', 'enter menu']
+    assert (scenes.builds, scenes.switches) == (2, 3)
+
+
+def test_showing_the_current_scene_only_enters_it_again():
+    scenes = SceneManager()
+    entered = []
+    scenes.add('game', enter=entered.append)
+    scenes.show('game', 1)
+    scenes.show('game', 2)
+    assert entered == [1, 2]
+    assert scenes.switches == 1
+    assert scenes.is_showing('game') and not scenes.is_showing('menu')
@@ -0,0 +1,149 @@
+from gamekit.scheduler import FrameScheduler
+
+
+def make_scheduler():
+    # Frames are driven by hand through _advance, so no Tk root is needed
+    return FrameScheduler(None, frame_ms=16, max_catchup=5)
+
+
+def test_tasks_run_once_per_whole_interval():
+    scheduler = make_scheduler()
+    calls = []
+    scheduler.every('tick', 100, lambda: calls.append(1))
+
+    scheduler._advance(0.05)
+    assert calls == []
+    scheduler._advance(0.06)
+    assert len(calls) == 1
+    scheduler._advance(0.25)
+    assert len(calls) == 3
+
+
+def test_catchup_is_capped_and_the_backlog_dropped():
+    scheduler = make_scheduler()
+    calls = []
+    scheduler.every('tick', 10, lambda: calls.append(1), max_catchup=3)
+
+    scheduler._advance(1.0)
+    assert len(calls) == 3
+    scheduler._advance(0.0)
+    assert len(calls) == 3
+
+
+def test_after_runs_once_and_rescheduling_replaces_it():
+    scheduler = make_scheduler()
+    calls = []
+    scheduler.after('result', 100, lambda: calls.append('first'))
+    scheduler.after('result', 200, lambda: calls.append('second'))
+
+    scheduler._advance(0.15)
+    assert calls == []
+    scheduler._advance(0.1)
+    assert calls == ['second']
+    assert not scheduler.is_active('result')
+    scheduler._advance(1.0)
+    assert calls == ['second']
+
+
+def test_cancel_all_keeps_persistent_tasks():
+    scheduler = make_scheduler()
+    scheduler.every('game', 100, lambda: None)
+    scheduler.after('message', 100, lambda: None)
+    scheduler.every('idle', 500, lambda: None, persistent=True)
+
+    scheduler.cancel_all()
+    assert scheduler.live() == ['idle']
+
+
+def test_task_cancelled_by_another_does_not_run():
+    scheduler = make_scheduler()
+    calls = []
+    scheduler.every('first', 10, lambda: scheduler.cancel('second'))
+    scheduler.every('second', 10, lambda: calls.append(1))
+
+    scheduler._advance(0.05)
+    assert calls == []
+
+
+def test_input_comes_before_tasks_and_render_once_when_invalidated():
+    scheduler = make_scheduler()
+    order = []
+    scheduler.set_input(lambda: order.append('input'))
+    scheduler.every('tick', 10, lambda: (order.append('tick'), scheduler.invalidate()))
+    scheduler.set_render(lambda: order.append('render'))
+
+    scheduler._advance(0.02)
+    assert order == ['input', 'tick', 'tick', 'render']
+    scheduler._advance(0.0)
+    assert order[-1] == 'input'
+
+
+def test_throttle_limits_tasks_not_kept():
+    scheduler = make_scheduler()
+    calls = {'game': 0, 'title': 0}
+    # Intervals of 1/64 s add up exactly in floating point
+    scheduler.every('game', 15.625, lambda: calls.__setitem__('game', calls['game'] + 1))
+    scheduler.every('title', 15.625, lambda: calls.__setitem__('title', calls['title'] + 1))
+
+    scheduler.throttle(100, keep=('game',), other_steps=1)
+    scheduler._advance(0.0625)
+    assert calls == {'game': 4, 'title': 1}
+
+    scheduler.throttle(250, keep=('game',), other_steps=0, render=False)
+    scheduler._advance(0.0625)
+    assert calls == {'game': 8, 'title': 1}
+
+    scheduler.unthrottle()
+    assert scheduler.frame_interval == scheduler.base_frame_interval
+    assert scheduler.dirty
+    scheduler._advance(0.0625)
+    assert calls['title'] > 1
+
+
+def test_live_lists_pending_tasks_and_one_shots():
+    scheduler = make_scheduler()
+    scheduler.every('game', 100, lambda: None)
+    scheduler.after('result', 300, lambda: None)
+    assert scheduler.live() == ['game', 'result']
+
+    scheduler._advance(0.3)
+    assert scheduler.live() == ['game']
+    scheduler.cancel('game')
+    scheduler.cancel('unknown')
+    assert scheduler.live() == []
+
+
+def test_every_replaces_a_running_task_instead_of_stacking():
+    scheduler = make_scheduler()
+    calls = []
+    scheduler.every('title', 30, lambda: calls.append('old'))
+    scheduler.every('title', 30, lambda: calls.append('new'))
+    scheduler._advance(0.03)
+    assert calls == ['new']
+
+
+def test_set_interval_keeps_the_accumulated_time():
+    scheduler = make_scheduler()
+    calls = []
+    scheduler.every('game', 100, lambda: calls.append(1))
+    scheduler._advance(0.075)
+    scheduler.set_interval('game', 50)
+    scheduler._advance(0.0)
+    assert len(calls) == 1
+    scheduler.set_interval('unknown', 50)  # Ignored
+
+
+def test_a_one_shot_can_reschedule_itself():
+    scheduler = make_scheduler()
+    calls = []
+
+    def blink():
+        calls.append(1)
+        if len(calls) < 3:
+            scheduler.after('blink', 100, blink)
+
+    scheduler.after('blink', 100, blink)
+    for _ in range(5):
+        scheduler._advance(0.1)
+    assert len(calls) == 3
+    assert not scheduler.is_active('blink')
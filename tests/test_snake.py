@@ -0,0 +1,78 @@
+import random
+from collections import Counter
+
+from gamekit.engines.snake import SnakeEngine
+
+
+def assert_consistent(engine):
+    """occupancy, free_cells and free_slot all agree with the body"""
+    size = engine.grid_size
+    counts = Counter(y * size + x for x, y in engine.snake if 0 <= x < size and 0 <= y < size)
+    assert all(engine.occupancy[cell] == counts.get(cell, 0) for cell in range(size * size))
+
+    free = list(engine.free_cells)
+    assert len(free) == len(set(free))
+    assert set(free) == {cell for cell in range(size * size) if not counts.get(cell)}
+    for slot, cell in enumerate(free):
+        assert engine.free_slot[cell] == slot
+    assert all(engine.free_slot[cell] == -1 for cell in counts)
+
+
+def test_free_index_follows_random_play():
+    rng = random.Random(0)
+    engine = SnakeEngine(grid_size=8, seed=0)
+    for _ in range(3000):
+        if engine.done:
+            engine.reset()
+        engine.step(rng.choice(engine.ACTIONS))
+        assert_consistent(engine)
+        if engine.food is not None:
+            assert not engine.occupied(engine.food)
+
+
+def test_set_snake_clears_only_the_old_body():
+    engine = SnakeEngine(grid_size=6, seed=1)
+    engine.set_snake([(0, 0), (1, 0), (1, 0), (2, 0)])
+    assert engine.occupied((1, 0)) == 2
+    assert_consistent(engine)
+
+    engine.set_snake([(5, 5), (5, 4)])
+    assert_consistent(engine)
+    assert len(engine.free_cells) == 34
+
+    # A head past the wall is kept in the body but not on the board
+    engine.set_snake([(-1, 3), (0, 3)])
+    assert engine.snake[0] == (-1, 3)
+    assert_consistent(engine)
+
+
+def test_reset_restores_the_whole_free_list():
+    engine = SnakeEngine(grid_size=10, seed=2)
+    engine.set_snake([(x, y) for y in range(10) for x in range(10) if (x + y) % 3])
+    assert_consistent(engine)
+
+    engine.reset()
+    assert_consistent(engine)
+    assert len(engine.free_cells) == 100 - 3
+
+
+def test_filling_the_board_wins():
+    engine = SnakeEngine(grid_size=4, seed=3)
+
+    # Every cell but the last, walked as a serpentine that ends beside it,
+    # with the tail doubled as if the snake had just eaten
+    path = []
+    for y in range(4):
+        row = [(x, y) for x in range(4)]
+        path.extend(row if y % 2 else reversed(row))
+    *body, last = path
+    engine.set_snake(list(reversed(body)) + [body[0]])
+    engine.direction = 'RIGHT'
+    engine.food = last
+    assert list(engine.free_cells) == [last[1] * 4 + last[0]]
+
+    assert engine.step() == 1
+    assert engine.done and engine.won
+    assert engine.food is None
+    assert not engine.free_cells
+    assert_consistent(engine)
@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+from gamekit.agents import snake_greedy
+from gamekit.engines.snake import SnakeEngine
+from gamekit.engines.snake_batch import ACTIONS, NO_ACTION, SnakeBatch
+
+np = pytest.importorskip('numpy')
+
+
+def keep_food(engine):
+    """Leave food placement to the test, which copies each board's food over"""
+    engine.spawn_food = lambda: True
+
+
+def copy_food(batch, engine, board):
+    cell = int(batch.food_cell[board])
+    size = batch.grid_size
+    engine.food = (cell % size, cell // size) if cell >= 0 else None
+
+
+@pytest.mark.parametrize('grid_size', [5, 8])
+def test_batch_plays_the_engine_rules(grid_size):
+    boards = 16
+    batch = SnakeBatch(boards, grid_size, seed=1)
+    engines = [SnakeEngine(grid_size, seed=board) for board in range(boards)]
+    for board, engine in enumerate(engines):
+        keep_food(engine)
+        copy_food(batch, engine, board)
+
+    rng = random.Random(5)
+    ended = 0
+    for _ in range(1500):
+        # Mostly greedy, with some random turns, reversals and no-ops
+        actions = np.array([
+            ACTIONS.index(snake_greedy(engine, rng)) if rng.random() < 0.95 else rng.randrange(NO_ACTION, 4)
+            for engine in engines
+        ])
+        points = [engine.step(ACTIONS[action] if action >= 0 else None) for engine, action in zip(engines, actions)]
+        rewards, done = batch.step(actions)
+
+        for board, engine in enumerate(engines):
+            assert rewards[board] == points[board]
+            assert done[board] == engine.done
+            if done[board]:
+                ended += 1
+                assert batch.final_score[board] == engine.score
+                assert batch.won[board] == (engine.food is None)
+                engine.reset()
+                keep_food(engine)
+                copy_food(batch, engine, board)
+                assert batch.snake(board) == list(engine.snake)
+                continue
+
+            assert batch.snake(board) == list(engine.snake)
+            occupied = np.array(engine.occupancy).reshape(grid_size, grid_size) > 0
+            assert (batch.body[board] > 0).tolist() == occupied.tolist()
+            head_x, head_y = engine.snake[0]
+            assert batch.head[board, head_y, head_x] == 1 and batch.head[board].sum() == 1
+            if points[board]:
+                copy_food(batch, engine, board)
+            assert batch.food[board].sum() == (batch.food_cell[board] >= 0)
+    assert ended > boards
+
+
+def test_observations_are_views_of_the_state():
+    batch = SnakeBatch(4, 10, seed=2)
+    planes = batch.observe()
+    assert planes.shape == (4, 3, 10, 10)
+    assert np.shares_memory(planes, batch.body)
+
+    batch.step(np.full(4, ACTIONS.index('UP')))
+    assert batch.observe() is planes
+    for board in range(4):
+        head_x, head_y = batch.snake(board)[0]
+        assert planes[board, 1, head_y, head_x] == 1
+        assert planes[board, 0].sum() == 3
+
+
+def test_food_never_lands_on_the_body():
+    batch = SnakeBatch(32, 6, seed=3)
+    rng = np.random.default_rng(3)
+    for _ in range(500):
+        batch.step(rng.integers(NO_ACTION, 4, size=32))
+        placed = np.flatnonzero(batch.food_cell >= 0)
+        assert not batch.occupancy[placed, batch.food_cell[placed]].any()
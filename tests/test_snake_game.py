@@ -0,0 +1,103 @@
+from bench.tkrecord import recorded_game
+from tests.test_snake import assert_consistent
+
+SIZE = 2000
+
+
+def make_game():
+    game = recorded_game('snake', grid_size=SIZE)
+    game.start_game()
+    game.engine.food = None  # Nothing to eat, so the length stays put
+    return game
+
+
+def drawn_cells(game):
+    """Board cells of the segment items shown on the canvas"""
+    cam_x, cam_y = game.camera
+    cells = set()
+    for item in game.canvas.items.values():
+        if item.options.get('state', 'normal') == 'hidden':
+            continue
+        if item.options.get('fill') in (game.SNAKE_COLOR, game.SNAKE_HEAD_COLOR):
+            x1, y1 = item.coords[:2]
+            cells.add((cam_x + int(x1) // game.CELL_SIZE, cam_y + int(y1) // game.CELL_SIZE))
+    return cells
+
+
+def assert_head_in_view(game):
+    view, margin = game.GRID_SIZE, game.CAMERA_MARGIN
+    cam_x, cam_y = game.camera
+    assert 0 <= cam_x <= SIZE - view and 0 <= cam_y <= SIZE - view
+    for head, cam in zip(game.engine.snake[0], game.camera):
+        # Within the margin, unless the camera is already against the board edge
+        assert cam <= head < cam + view
+        assert head - cam >= margin or cam == 0
+        assert cam + view - 1 - head >= margin or cam == SIZE - view
+
+
+def walk(game, direction, steps):
+    for _ in range(steps):
+        game.engine.step(direction)
+        game.draw()
+        assert_head_in_view(game)
+
+
+def test_camera_follows_the_head_and_clamps_at_the_edges():
+    game = make_game()
+    game.draw()
+    assert_head_in_view(game)
+
+    walk(game, 'UP', SIZE // 2)
+    assert game.engine.snake[0][1] == 0 and game.camera[1] == 0
+    walk(game, 'LEFT', SIZE // 2)
+    assert game.camera == (0, 0)
+    walk(game, 'DOWN', 30)
+    walk(game, 'RIGHT', SIZE - 1)
+    assert game.engine.snake[0][0] == SIZE - 1 and game.camera[0] == SIZE - game.GRID_SIZE
+    walk(game, 'DOWN', SIZE - 31)
+    assert game.camera == (SIZE - game.GRID_SIZE, SIZE - game.GRID_SIZE)
+    assert not game.engine.done
+
+
+def test_camera_scrolls_only_past_the_margin():
+    game = make_game()
+    game.draw()
+    camera = game.camera
+    # The first view puts the head on its bottom margin; turning back and
+    # forth above it leaves the camera alone
+    walk(game, 'LEFT', 3)
+    walk(game, 'UP', 1)
+    walk(game, 'RIGHT', 3)
+    assert game.camera == camera
+
+
+def test_only_the_cells_in_view_are_drawn():
+    game = make_game()
+    engine = game.engine
+    # A long body doubling back, half of it off screen
+    x, y = SIZE // 2, SIZE // 2
+    body = [(x - i, y) for i in range(30)] + [(x - 29 + i, y + 1) for i in range(30)]
+    engine.set_snake(body)
+    engine.direction = 'RIGHT'
+    for _ in range(10):
+        engine.step('RIGHT')
+        game.draw()
+
+    cam_x, cam_y = game.camera
+    view = game.GRID_SIZE
+    in_view = {cell for cell in engine.snake
+               if cam_x <= cell[0] < cam_x + view and cam_y <= cell[1] < cam_y + view}
+    assert 0 < len(in_view) < len(engine.snake)
+    assert drawn_cells(game) == in_view
+
+
+def test_restart_recentres_the_camera_on_a_clean_board():
+    game = make_game()
+    walk(game, 'UP', 200)
+    game.engine.done = True
+    game.start_game()
+    assert game.camera == (0, 0)
+    assert_consistent(game.engine)
+    game.draw()
+    assert_head_in_view(game)
+    assert game.engine.snake[0] == (SIZE // 2, SIZE // 2)
@@ -0,0 +1,72 @@
+import socket
+import time
+
+from gamekit.spectate import SpectatorServer
+
+
+def start_server():
+    server = SpectatorServer(port=0)
+    server.start()
+    return server
+
+
+def connect(server):
+    client = socket.create_connection((server.host, server.port), timeout=2)
+    deadline = time.monotonic() + 2
+    while not server.clients and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert server.clients
+    return client
+
+
+def test_lines_reach_a_spectator_from_the_first_keyframe():
+    server = start_server()
+    client = connect(server)
+    try:
+        server.submit(b"delta\n")
+        server.submit(b"keyframe\n", keyframe=True)
+        server.submit(b"delta 2\n")
+        lines = client.makefile('rb')
+        assert lines.readline() == b"keyframe\n"
+        assert lines.readline() == b"delta 2\n"
+    finally:
+        client.close()
+        server.close()
+
+
+def test_close_disconnects_spectators_and_ends_the_thread():
+    server = start_server()
+    client = connect(server)
+    try:
+        start = time.monotonic()
+        server.close()
+        assert not server.thread.is_alive()
+        assert time.monotonic() - start < 1
+        assert client.recv(4096) == b""  # EOF
+    finally:
+        client.close()
+
+
+def test_close_works_with_the_handoff_queue_full():
+    server = start_server()
+    client = connect(server)
+    try:
+        # Keep the loop from draining the queue while it fills up
+        server.loop.call_soon_threadsafe(time.sleep, 0.3)
+        for _ in range(server.MAX_PENDING + 10):
+            server.submit(b"x\n")
+        assert server.dropped
+        server.close()
+        assert not server.thread.is_alive()
+    finally:
+        client.close()
+
+
+def test_port_is_free_after_close():
+    server = start_server()
+    port = server.port
+    server.close()
+
+    again = SpectatorServer(port=port)
+    again.start()
+    again.close()
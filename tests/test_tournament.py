@@ -0,0 +1,52 @@
+import math
+
+import pytest
+
+from gamekit.agents import DEFAULT_AGENTS
+from gamekit.tournament import GAMES, Stats, load_agent, run_episode, run_tournament
+
+
+@pytest.mark.parametrize('game', GAMES)
+def test_episodes_are_reproducible(game):
+    agent = load_agent(DEFAULT_AGENTS[game])
+    first = run_episode(game, agent, seed=5, max_steps=2000)
+    second = run_episode(game, agent, seed=5, max_steps=2000)
+    for key in ('seed', 'score', 'steps', 'won'):
+        assert first[key] == second[key]
+    assert 0 < first['steps'] <= 2000
+
+
+def test_load_agent_needs_module_and_function():
+    assert load_agent('gamekit.agents:random_action').__name__ == 'random_action'
+    with pytest.raises(ValueError):
+        load_agent('gamekit.agents')
+
+
+def test_stats_match_direct_computation():
+    scores = [3, 7, 7, 1, 12]
+    stats = Stats()
+    for seed, score in enumerate(scores):
+        stats.add({'seed': seed, 'score': score, 'steps': 10, 'seconds': 0.01, 'won': score > 5})
+
+    mean = sum(scores) / len(scores)
+    variance = sum((score - mean) ** 2 for score in scores) / (len(scores) - 1)
+    assert stats.episodes == 5
+    assert stats.wins == 3
+    assert stats.score_mean == pytest.approx(mean)
+    assert stats.score_stdev == pytest.approx(math.sqrt(variance))
+    assert (stats.score_min, stats.score_max) == (1, 12)
+    assert stats.summary(total=10).startswith("5/10 episodes")
+
+
+def test_pool_and_in_process_runs_agree():
+    seeds = range(12)
+    local = run_tournament('snake', DEFAULT_AGENTS['snake'], seeds, workers=0, max_steps=500)
+    pooled = run_tournament('snake', DEFAULT_AGENTS['snake'], seeds, workers=2, max_steps=500)
+    assert pooled.episodes == local.episodes == 12
+    assert pooled.score_mean == pytest.approx(local.score_mean)
+    assert pooled.steps == local.steps
+
+
+def test_unknown_game_is_refused():
+    with pytest.raises(ValueError):
+        run_tournament('cookie clicker', 'gamekit.agents:random_action', [1], workers=0)
@@ -0,0 +1,84 @@
+from bench.tkrecord import Canvas, Tk
+from gamekit.resources import FADE_STEPS, ramp
+from gamekit.scheduler import FrameScheduler
+from gamekit.tween import BOB_PERIOD_MS, TICK_MS, WAVE_STEPS, Tweens, wave
+
+
+def make_tweens():
+    scheduler = FrameScheduler(None)
+    return scheduler, Tweens(scheduler), Canvas(Tk())
+
+
+def y_of(canvas, item):
+    return canvas.items[item].coords[1]
+
+
+def test_wave_is_one_period_of_whole_pixels():
+    offsets = wave(6)
+    assert len(offsets) == WAVE_STEPS
+    assert max(offsets) == 6 and min(offsets) == -6
+    assert wave(6) is offsets
+
+
+def test_bob_moves_the_tag_and_settles_back():
+    scheduler, tweens, canvas = make_tweens()
+    title = canvas.create_text(100, 50, text="snake", tags="title")
+    tweens.bob(canvas, "title", 6)
+    assert scheduler.is_active("tweens")
+
+    seen = set()
+    for _ in range(BOB_PERIOD_MS // TICK_MS):
+        scheduler._advance(TICK_MS / 1000)
+        seen.add(y_of(canvas, title))
+    assert min(seen) == 44 and max(seen) == 56
+
+    tweens.clear()
+    assert y_of(canvas, title) == 50
+    assert not scheduler.is_active("tweens")
+
+
+def test_bob_only_moves_when_the_offset_changes():
+    scheduler, tweens, canvas = make_tweens()
+    canvas.create_text(100, 50, text="snake", tags="title")
+    tweens.bob(canvas, "title", 1)
+    canvas.log.reset()
+    for _ in range(BOB_PERIOD_MS // TICK_MS):
+        scheduler._advance(TICK_MS / 1000)
+    # A 1-pixel wave changes offset four times a period
+    assert canvas.log.calls['move'] <= 5
+
+
+def test_fade_reaches_its_color_and_ends():
+    scheduler, tweens, canvas = make_tweens()
+    text = canvas.create_text(100, 50, text="game over", fill="#000000")
+    tweens.fade_in(canvas, {text: "#ff4757"}, duration_ms=200)
+    colors = ramp("#000000", "#ff4757", FADE_STEPS + 1)
+    assert canvas.items[text].options['fill'] == colors[0]
+
+    for _ in range(200 // TICK_MS):
+        scheduler._advance(TICK_MS / 1000)
+    assert canvas.items[text].options['fill'] == "#ff4757"
+    assert "fade" not in tweens.active
+    scheduler._advance(TICK_MS / 1000)
+    assert not scheduler.is_active("tweens")
+
+
+def test_restarting_a_key_replaces_the_tween():
+    scheduler, tweens, canvas = make_tweens()
+    title = canvas.create_text(100, 50, text="snake", tags="title")
+    tweens.bob(canvas, "title", 6, phase=0.25)
+    assert y_of(canvas, title) == 56
+    tweens.bob(canvas, "title", 6, phase=0.25)
+    assert y_of(canvas, title) == 56  # The first bob settled before the second began
+    assert len(tweens.active) == 1
+
+
+def test_tweens_restart_after_cancel_all():
+    scheduler, tweens, canvas = make_tweens()
+    title = canvas.create_text(100, 50, text="snake", tags="title")
+    tweens.bob(canvas, "title", 6, phase=0.25)
+    scheduler.cancel_all()
+
+    tweens.bob(canvas, "title", 6)
+    assert scheduler.is_active("tweens")
+    assert y_of(canvas, title) == 50